@@ -18,6 +18,9 @@ from .services import (
     start_heartbeat,
     stop_heartbeat,
     send_stick_control,
+    send_stick_control_batch,
+    StickBatcher,
+    DRCDownlinkScheduler,
     set_camera_zoom,
     camera_screen_split,
     camera_screen_split_wait,
@@ -49,6 +52,7 @@ from .live_utils import (
 )
 from .primitives import (
     wait_for_condition,
+    wait_for_event,
     send_stick_repeatedly,
     fly_to_waypoint,
     monitor_flyto_progress,
@@ -85,6 +89,9 @@ __all__ = [
     "start_heartbeat",
     "stop_heartbeat",
     "send_stick_control",
+    "send_stick_control_batch",
+    "StickBatcher",
+    "DRCDownlinkScheduler",
     "set_camera_zoom",
     "camera_screen_split",
     "camera_screen_split_wait",
@@ -112,6 +119,7 @@ __all__ = [
     "zoom_control_loop",
     # Primitives
     "wait_for_condition",
+    "wait_for_event",
     "send_stick_repeatedly",
     "fly_to_waypoint",
     "monitor_flyto_progress",
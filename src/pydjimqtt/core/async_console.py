@@ -0,0 +1,66 @@
+"""
+异步终端输出 - 把 Rich 格式化与写出移出 MQTT 回调线程
+
+调用方只把参数放入队列，由一个后台守护线程统一调用 Console.print，
+避免网络线程在终端 I/O 上阻塞。
+"""
+
+import atexit
+import os
+import queue
+import threading
+from typing import Optional
+
+from rich.console import Console
+
+# 成功提示开关：PYDJIMQTT_VERBOSE=0 时关闭所有非错误输出（高频调用时省去终端 I/O）
+# 服务层各模块运行时读取 async_console.VERBOSE，修改此处即可统一开关
+VERBOSE = os.environ.get("PYDJIMQTT_VERBOSE", "1") != "0"
+
+
+class AsyncConsole:
+    """Console.print 的异步替身（接口兼容 print，多模块共享一个写出线程）"""
+
+    def __init__(self, console: Optional[Console] = None):
+        self._console = console or Console()
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def print(self, *args, **kwargs) -> None:
+        """入队一条输出（立即返回，不做格式化和 I/O）"""
+        if self._thread is None:
+            self._start_worker()
+        self._queue.put((args, kwargs))
+
+    def flush(self, timeout: float = 1.0) -> None:
+        """等待已入队的输出全部写出（最多 timeout 秒）"""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _start_worker(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._drain, daemon=True)
+            self._thread.start()
+            atexit.register(self.flush)
+
+    def _drain(self) -> None:
+        while True:
+            item = self._queue.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            args, kwargs = item
+            try:
+                self._console.print(*args, **kwargs)
+            except Exception:
+                pass  # 输出失败不影响调用方
+
+
+# 全局共享实例
+console = AsyncConsole()
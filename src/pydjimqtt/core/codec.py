@@ -0,0 +1,34 @@
+"""
+MQTT 载荷编解码 - 优先使用 orjson，未安装时回退到标准库 json
+
+安装可选依赖以启用快速路径：pip install "pydjimqtt[fast]"
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 可选依赖
+    orjson = None
+
+
+def dumps(obj: Any) -> Union[bytes, str]:
+    """
+    编码 MQTT 载荷
+
+    Returns:
+        orjson 可用时返回 bytes，否则返回 str（paho publish 两者都接受）
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """解码 MQTT 载荷（直接接受 bytes，无需先 decode）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
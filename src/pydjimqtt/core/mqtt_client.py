@@ -3,14 +3,165 @@ MQTT 客户端 - 负责连接管理和消息收发
 """
 
 import json
+import asyncio
 import threading
 import time
-from typing import Dict, Any, Optional
-from concurrent.futures import Future
+import uuid
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Any, Optional, Tuple
 import paho.mqtt.client as mqtt
-from rich.console import Console
 
-console = Console()
+from . import codec
+from .async_console import console  # 输出入队，由后台线程写出（不阻塞回调线程）
+
+
+# 服务请求信封（data 为预先编码好的 JSON）；tid/method 只含 ASCII 安全字符，无需转义
+_SERVICE_ENVELOPE = b'{"tid":"%s","bid":"%s","timestamp":%d,"method":"%s","data":%s}'
+
+# Fly-to 终止状态
+_FLYTO_TERMINAL_STATUSES = frozenset({"wayline_ok", "wayline_failed", "wayline_cancel"})
+
+
+# 飞行模式代码 → 中文名称
+FLIGHT_MODE_NAMES = {
+    0: "待机",
+    1: "起飞准备",
+    2: "起飞准备完毕",
+    3: "摇杆控制",
+    4: "自动起飞",
+    5: "航线飞行",
+    6: "全景拍照",
+    7: "智能跟随",
+    8: "ADS-B 躲避",
+    9: "自动返航",
+    10: "自动降落",
+    11: "强制降落",
+    12: "三桨叶降落",
+    13: "升级中",
+    14: "未连接",
+    15: "APAS",
+    16: "虚拟摇杆状态",
+    17: "指令飞行",
+}
+
+
+@dataclass(slots=True)
+class OsdData:
+    """OSD 数据缓存（osd_info_push / hsi_info_push / drc_batteries_info_push）"""
+
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    height: Optional[float] = None
+    attitude_head: Optional[float] = None
+    horizontal_speed: Optional[float] = None
+    speed_x: Optional[float] = None
+    speed_y: Optional[float] = None
+    speed_z: Optional[float] = None
+    down_distance: Optional[int] = None
+    down_enable: Optional[bool] = None
+    down_work: Optional[bool] = None
+    battery_percent: Optional[int] = None
+
+
+@dataclass(slots=True)
+class DroneState:
+    """无人机状态数据（drc_drone_state_push）"""
+
+    mode_code: Optional[int] = None
+    rth_altitude: Optional[int] = None
+    distance_limit: Optional[int] = None
+    height_limit: Optional[int] = None
+    is_in_fixed_speed: Optional[bool] = None
+    night_lights_state: Optional[int] = None
+
+
+@dataclass(slots=True)
+class CameraOsd:
+    """相机 OSD 信息（drc_camera_osd_info_push）"""
+
+    payload_index: Optional[str] = None  # 相机索引，如 "88-0-0"
+    gimbal_pitch: Optional[float] = None
+    gimbal_roll: Optional[float] = None
+    gimbal_yaw: Optional[float] = None
+    screen_split_enable: Optional[bool] = None
+    ir_zoom_factor: Optional[float] = None
+    zoom_factor: Optional[float] = None
+
+
+@dataclass(slots=True)
+class FlytoProgress:
+    """Fly-to 进度数据（fly_to_point_progress）"""
+
+    fly_to_id: Optional[str] = None
+    status: Optional[str] = None  # wayline_cancel, wayline_failed, wayline_ok, wayline_progress
+    result: Optional[int] = None
+    way_point_index: Optional[int] = None
+    remaining_distance: Optional[float] = None
+    remaining_time: Optional[float] = None
+    planned_path_points: Optional[list] = None
+
+
+class _PendingCall:
+    """
+    挂起的服务请求（轻量 Future 替代）
+
+    只用一个 Event 唤醒等待方，接口与 Future 的 set_result/set_exception/result 保持一致。
+    """
+
+    __slots__ = ("_event", "_result", "_exc")
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result: Any = None
+        self._exc: Optional[BaseException] = None
+
+    def set_result(self, result: Any) -> None:
+        self._result = result
+        self._event.set()
+
+    def set_exception(self, exc: BaseException) -> None:
+        self._exc = exc
+        self._event.set()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """等待响应；超时抛出 TimeoutError，服务错误时抛出对应异常"""
+        if not self._event.wait(timeout):
+            raise TimeoutError()
+        if self._exc is not None:
+            raise self._exc
+        return self._result
+
+
+class UpdateSignal:
+    """
+    状态更新通知（Condition + 版本号）
+
+    发布方每次更新调用 set()；等待方先记下 version 再检查条件，
+    再用 wait_for_update(version) 等待更新的版本。不清除共享状态，多个等待方互不吞掉唤醒。
+    """
+
+    __slots__ = ("_cv", "version")
+
+    def __init__(self):
+        self._cv = threading.Condition(threading.Lock())
+        self.version = 0
+
+    def set(self) -> None:
+        """发布一次更新并唤醒所有等待方"""
+        with self._cv:
+            self.version += 1
+            self._cv.notify_all()
+
+    def is_set(self) -> bool:
+        """是否已有过更新"""
+        return self.version > 0
+
+    def wait_for_update(self, since: int, timeout: Optional[float] = None) -> int:
+        """等待 version 超过 since（已超过时立即返回），返回当前版本号"""
+        with self._cv:
+            self._cv.wait_for(lambda: self.version != since, timeout)
+            return self.version
 
 
 def _to_optional_int(value: Any) -> Optional[int]:
@@ -29,44 +180,35 @@ class MQTTClient:
         self.gateway_sn = gateway_sn
         self.config = mqtt_config
         self.client: Optional[mqtt.Client] = None
-        self.pending_requests: Dict[str, Future] = {}
-        self.lock = threading.Lock()
+        # 服务请求主题（每次 publish 复用，避免重复格式化）
+        self._services_topic = f"thing/product/{gateway_sn}/services"
+        # DRC 下行主题（杆量、心跳、云台等 fire-and-forget 指令共用）
+        self.drc_down_topic = f"thing/product/{gateway_sn}/drc/down"
+        self.pending_requests: Dict[str, _PendingCall] = {}
+        # DRC 回包等待表（(method, seq) → 挂起请求），由 _on_message 按键直接唤醒
+        self._drc_waiters: Dict[Tuple[str, int], _PendingCall] = {}
+        # 按数据域拆分的锁，避免 100Hz OSD 写入与其他域的读取互相阻塞
+        self._osd_lock = threading.Lock()  # osd_data / hsi_data / 频率追踪
+        self._state_lock = threading.Lock()  # drone_state / topo_data
+        self._camera_lock = threading.Lock()  # camera_osd
+        self._flyto_lock = threading.Lock()  # flyto_progress
+        self._requests_lock = threading.Lock()  # pending_requests / _drc_waiters
+        # install_asyncio_loop 模式下维持 keepalive 的任务
+        self._misc_task: Optional[asyncio.Task] = None
+        # CONNACK 到达事件（on_connect rc=0 时置位，connect() 等待它而非轮询）
+        self._connected_evt = threading.Event()
+        # Fly-to 进度条件变量（与 _flyto_lock 共用同一把锁）
+        self._flyto_cv = threading.Condition(self._flyto_lock)
+        # 每条 fly_to_point_progress 推送递增（等待方据此判断是否有新进度）
+        self._flyto_version = 0
         # OSD 数据缓存
-        self.osd_data = {
-            "latitude": None,
-            "longitude": None,
-            "height": None,
-            "attitude_head": None,
-            "horizontal_speed": None,
-            "speed_x": None,
-            "speed_y": None,
-            "speed_z": None,
-            "down_distance": None,
-            "down_enable": None,
-            "down_work": None,
-            "battery_percent": None,
-        }
+        self.osd_data = OsdData()
         # 无人机状态数据
-        self.drone_state = {
-            "mode_code": None,
-            "rth_altitude": None,
-            "distance_limit": None,
-            "height_limit": None,
-            "is_in_fixed_speed": None,
-            "night_lights_state": None,
-        }
+        self.drone_state = DroneState()
         # 拓扑数据（update_topo）- 保存完整的 data 字段
         self.topo_data = None  # 完整的 update_topo data 对象
         # 相机 OSD 信息（从 drc_camera_osd_info_push 获取）
-        self.camera_osd = {
-            "payload_index": None,  # 相机索引，如 "88-0-0"
-            "gimbal_pitch": None,
-            "gimbal_roll": None,
-            "gimbal_yaw": None,
-            "screen_split_enable": None,
-            "ir_zoom_factor": None,
-            "zoom_factor": None,
-        }
+        self.camera_osd = CameraOsd()
         # HSI 数据（hsi_info_push）
         self.hsi_data = {
             "around_distances": [],
@@ -94,19 +236,20 @@ class MQTTClient:
         # 起飞点高度（第一次读取到的全局高度）
         self.takeoff_height = None
         # Fly-to 进度数据
-        self.flyto_progress = {
-            "fly_to_id": None,
-            "status": None,  # wayline_cancel, wayline_failed, wayline_ok, wayline_progress
-            "result": None,
-            "way_point_index": None,
-            "remaining_distance": None,
-            "remaining_time": None,
-            "planned_path_points": None,
-        }
-        # OSD 消息回调列表（用于 FPS 监控等）
-        self.osd_callbacks = []
+        self.flyto_progress = FlytoProgress()
+        # 每条 OSD 推送后 set()，供 wait_for_event 等待状态变化而不必轮询
+        self.osd_updated = UpdateSignal()
+        # 每条 drc_drone_state_push 后 set()，等待飞行模式切换（如降落完成）时使用
+        self.drone_state_updated = UpdateSignal()
+        # OSD 消息回调（用于 FPS 监控等），使用 tuple 以便热路径直接遍历
+        self.osd_callbacks: tuple = ()
+        # 只保护注册时的“读-拼接-写”，热路径读取不加锁
+        self._callbacks_lock = threading.Lock()
+        # OSD 回调节流：最小触发间隔（秒），0 表示每条消息都触发
+        self._osd_callback_period = 0.0
+        self._last_osd_callback_time = 0.0
         # 频率追踪（2秒时间窗口，平滑网络抖动）
-        self._osd_timestamps = []  # 2秒窗口内的所有 OSD 消息时间戳
+        self._osd_timestamps: deque[float] = deque()  # 2秒窗口内的所有 OSD 消息时间戳
         self._last_osd_time = 0.0  # 最后一次 OSD 消息时间（用于离线检测）
         self._freq_window = 2.0  # 频率计算窗口大小（秒）
         # 连接可观测性（供上层排障）
@@ -115,12 +258,20 @@ class MQTTClient:
         self._last_battery_msg_monotonic: Optional[float] = None
         self._last_osd_msg_monotonic: Optional[float] = None
         self._last_hsi_msg_monotonic: Optional[float] = None
+        # 推送消息分发表（method → 处理函数），未命中的消息按服务响应处理
+        self._handlers = {
+            "osd_info_push": self._handle_osd_info_push,
+            "hsi_info_push": self._handle_hsi_info_push,
+            "drc_batteries_info_push": self._handle_batteries_info_push,
+            "drc_drone_state_push": self._handle_drone_state_push,
+            "update_topo": self._handle_update_topo,
+            "drc_camera_osd_info_push": self._handle_camera_osd_info_push,
+            "fly_to_point_progress": self._handle_fly_to_point_progress,
+        }
 
     def connect(self):
         """建立 MQTT 连接"""
         # 添加3位随机UUID后缀，避免多个客户端冲突
-        import uuid
-
         random_suffix = str(uuid.uuid4())[:3]
         client_id = f"python-drc-{self.gateway_sn}-{random_suffix}"
 
@@ -131,6 +282,7 @@ class MQTTClient:
         # 添加连接回调用于调试
         def on_connect(client, userdata, flags, rc):
             if rc == 0:
+                self._connected_evt.set()
                 console.print(f"[green]✓[/green] MQTT 连接成功 (rc={rc})")
             else:
                 error_messages = {
@@ -156,20 +308,16 @@ class MQTTClient:
             f"[cyan]连接 MQTT: {self.config['host']}:{self.config['port']}[/cyan]"
         )
 
+        self._connected_evt.clear()
         try:
             # 添加连接超时（5秒）
             self.client.connect(self.config["host"], self.config["port"], 60)
             self.client.loop_start()
 
-            # 等待连接成功（最多等待 5 秒）
-            import time
-
+            # 等待 CONNACK（on_connect 置位事件，最多等待 5 秒）
             timeout = 5
-            start_time = time.time()
-            while not self.client.is_connected():
-                if time.time() - start_time > timeout:
-                    raise TimeoutError(f"MQTT 连接超时（{timeout}秒）")
-                time.sleep(0.1)
+            if not self._connected_evt.wait(timeout):
+                raise TimeoutError(f"MQTT 连接超时（{timeout}秒）")
 
         except Exception as e:
             console.print(f"[red]✗[/red] MQTT 连接异常: {e}")
@@ -212,6 +360,75 @@ class MQTTClient:
             self.client.disconnect()
             console.print("[yellow]MQTT 连接已断开[/yellow]")
 
+    def install_asyncio_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        改由 asyncio 事件循环驱动 paho 网络 I/O（替代 loop_start 后台线程）
+
+        适用于单客户端、主流程本身运行在事件循环上的应用：socket 可读/可写时
+        直接在事件循环线程上调用 loop_read/loop_write，每秒调用一次 loop_misc 维持 keepalive。
+
+        注意:
+            - 必须在 connect() 成功后、在事件循环线程中调用
+            - 该模式下不会自动重连；连接断开后 loop_misc 任务自动结束
+            - 读取接口仍可在其他线程调用（锁保持不变）
+            - publish 也可在其他线程调用（心跳/StickBatcher 调度线程、asyncio.to_thread 中的
+              ServiceCaller.call 等）：paho 在调用线程上触发 socket 注册回调，
+              此时经 call_soon_threadsafe 转交事件循环线程，并唤醒阻塞在 select 上的循环
+
+        Example:
+            >>> async def main():
+            ...     mqtt.connect()
+            ...     mqtt.install_asyncio_loop(asyncio.get_running_loop())
+            ...     await asyncio.to_thread(input, "按 Enter 退出...")
+            ...     mqtt.disconnect()
+        """
+        if not self.client:
+            raise RuntimeError("MQTT client is not connected")
+
+        client = self.client
+        client.loop_stop()  # 停止后台网络线程，后续 I/O 由事件循环驱动
+        loop_thread = threading.get_ident()
+
+        def on_loop(fn, *args) -> None:
+            # 事件循环方法非线程安全；其他线程上的调用转交循环线程执行（同时唤醒循环）
+            if threading.get_ident() == loop_thread:
+                fn(*args)
+            else:
+                loop.call_soon_threadsafe(fn, *args)
+
+        def close_socket(sock):
+            loop.remove_reader(sock)
+            loop.remove_writer(sock)
+
+        def on_socket_open(_client, _userdata, sock):
+            on_loop(loop.add_reader, sock, client.loop_read)
+
+        def on_socket_close(_client, _userdata, sock):
+            on_loop(close_socket, sock)
+
+        def on_socket_register_write(_client, _userdata, sock):
+            on_loop(loop.add_writer, sock, client.loop_write)
+
+        def on_socket_unregister_write(_client, _userdata, sock):
+            on_loop(loop.remove_writer, sock)
+
+        async def misc_loop():
+            while client.loop_misc() == mqtt.MQTT_ERR_SUCCESS:
+                await asyncio.sleep(1)
+
+        client.on_socket_open = on_socket_open
+        client.on_socket_close = on_socket_close
+        client.on_socket_register_write = on_socket_register_write
+        client.on_socket_unregister_write = on_socket_unregister_write
+
+        # 连接已建立，on_socket_open 不会再触发，手动注册当前 socket
+        sock = client.socket()
+        if sock is not None:
+            loop.add_reader(sock, client.loop_read)
+            if client.want_write():
+                loop.add_writer(sock, client.loop_write)
+        self._misc_task = loop.create_task(misc_loop())
+
     def get_connection_diagnostics(self) -> Dict[str, Any]:
         """返回 MQTT 连接诊断信息（只读）。"""
         connected = False
@@ -228,84 +445,94 @@ class MQTTClient:
 
     def get_last_battery_msg_monotonic(self) -> Optional[float]:
         """返回最近一次电池推送消息到达的 monotonic 时间。"""
-        with self.lock:
-            return self._last_battery_msg_monotonic
+        return self._last_battery_msg_monotonic
 
     def get_last_osd_msg_monotonic(self) -> Optional[float]:
         """返回最近一次 OSD 推送消息到达的 monotonic 时间。"""
-        with self.lock:
-            return self._last_osd_msg_monotonic
+        return self._last_osd_msg_monotonic
 
     def get_last_hsi_msg_monotonic(self) -> Optional[float]:
         """返回最近一次 HSI 推送消息到达的 monotonic 时间。"""
-        with self.lock:
-            return self._last_hsi_msg_monotonic
+        return self._last_hsi_msg_monotonic
 
     def cleanup_request(self, tid: str):
         """清理挂起的请求（用于超时处理）"""
-        with self.lock:
+        with self._requests_lock:
             self.pending_requests.pop(tid, None)
 
+    def expect_drc_reply(self, method: str, seq: int) -> _PendingCall:
+        """
+        登记一个 DRC 回包等待（按 method + seq 匹配 drc/up 上的回包）
+
+        须在发送指令前登记，避免回包先于登记到达；用完后调用 cancel_drc_reply 清理。
+
+        Returns:
+            挂起请求对象，result(timeout) 返回完整回包 payload
+        """
+        future = _PendingCall()
+        with self._requests_lock:
+            self._drc_waiters[(method, seq)] = future
+        return future
+
+    def cancel_drc_reply(self, method: str, seq: int) -> None:
+        """撤销 DRC 回包等待（已收到回包时为空操作）"""
+        with self._requests_lock:
+            self._drc_waiters.pop((method, seq), None)
+
     def get_latitude(self) -> Optional[float]:
         """获取最新纬度（无卫星信号时返回 None）"""
-        with self.lock:
-            return self.osd_data["latitude"]
+        return self.osd_data.latitude
 
     def get_longitude(self) -> Optional[float]:
         """获取最新经度（无卫星信号时返回 None）"""
-        with self.lock:
-            return self.osd_data["longitude"]
+        return self.osd_data.longitude
 
     def get_height(self) -> Optional[float]:
         """获取最新全局高度（GPS高度，无卫星信号时返回 None）"""
-        with self.lock:
-            return self.osd_data["height"]
+        return self.osd_data.height
 
     def get_relative_height(self) -> Optional[float]:
         """获取距起飞点高度（当前高度 - 起飞点高度，无数据时返回 None）"""
-        with self.lock:
-            if self.osd_data["height"] is not None and self.takeoff_height is not None:
-                return self.osd_data["height"] - self.takeoff_height
+        with self._osd_lock:
+            if self.osd_data.height is not None and self.takeoff_height is not None:
+                return self.osd_data.height - self.takeoff_height
             return None
 
     def get_attitude_head(self) -> Optional[float]:
         """获取最新航向角（无数据时返回 None）"""
-        with self.lock:
-            return self.osd_data["attitude_head"]
+        return self.osd_data.attitude_head
 
     def get_speed(
         self,
     ) -> tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
         """获取速度数据 (水平速度, X轴速度, Y轴速度, Z轴速度)"""
-        with self.lock:
+        with self._osd_lock:
             return (
-                self.osd_data["horizontal_speed"],
-                self.osd_data["speed_x"],
-                self.osd_data["speed_y"],
-                self.osd_data["speed_z"],
+                self.osd_data.horizontal_speed,
+                self.osd_data.speed_x,
+                self.osd_data.speed_y,
+                self.osd_data.speed_z,
             )
 
     def get_battery_percent(self) -> Optional[int]:
         """获取电池电量百分比（无数据时返回 None）"""
-        with self.lock:
-            return self.osd_data["battery_percent"]
+        return self.osd_data.battery_percent
 
     def get_local_height(self) -> Optional[float]:
         """获取HSI高度/下视距离（无数据时返回 None）"""
-        with self.lock:
-            return self.osd_data["down_distance"]
+        return self.osd_data.down_distance
 
     def is_local_height_ok(self) -> bool:
         """判断 HSI 高度数据是否有效（down_enable 和 down_work 都为 True）"""
-        with self.lock:
+        with self._osd_lock:
             return (
-                self.osd_data["down_enable"] is True
-                and self.osd_data["down_work"] is True
+                self.osd_data.down_enable is True
+                and self.osd_data.down_work is True
             )
 
     def get_hsi_data(self) -> Dict[str, Any]:
         """获取完整 HSI 快照（返回副本，避免外部写入污染内部缓存）。"""
-        with self.lock:
+        with self._osd_lock:
             snapshot = self.hsi_data.copy()
             around = snapshot.get("around_distances")
             snapshot["around_distances"] = list(around) if isinstance(around, list) else []
@@ -313,60 +540,38 @@ class MQTTClient:
 
     def get_around_distances(self) -> list[int]:
         """获取 around_distances 数组副本。"""
-        with self.lock:
+        with self._osd_lock:
             around = self.hsi_data.get("around_distances")
             return list(around) if isinstance(around, list) else []
 
     def get_position(self) -> tuple[Optional[float], Optional[float], Optional[float]]:
         """获取最新位置 (纬度, 经度, 高度)，无卫星信号时返回 (None, None, None)"""
-        with self.lock:
+        with self._osd_lock:
             return (
-                self.osd_data["latitude"],
-                self.osd_data["longitude"],
-                self.osd_data["height"],
+                self.osd_data.latitude,
+                self.osd_data.longitude,
+                self.osd_data.height,
             )
 
     def get_flight_mode(self) -> Optional[int]:
         """获取飞行模式代码（mode_code）"""
-        with self.lock:
-            return self.drone_state["mode_code"]
+        return self.drone_state.mode_code
 
     def get_flight_mode_name(self) -> str:
         """获取飞行模式名称（中文）"""
-        mode_names = {
-            0: "待机",
-            1: "起飞准备",
-            2: "起飞准备完毕",
-            3: "摇杆控制",
-            4: "自动起飞",
-            5: "航线飞行",
-            6: "全景拍照",
-            7: "智能跟随",
-            8: "ADS-B 躲避",
-            9: "自动返航",
-            10: "自动降落",
-            11: "强制降落",
-            12: "三桨叶降落",
-            13: "升级中",
-            14: "未连接",
-            15: "APAS",
-            16: "虚拟摇杆状态",
-            17: "指令飞行",
-        }
-        with self.lock:
-            mode_code = self.drone_state["mode_code"]
-            if mode_code is None:
-                return "未知"
-            return mode_names.get(mode_code, f"未知模式({mode_code})")
+        mode_code = self.drone_state.mode_code
+        if mode_code is None:
+            return "未知"
+        return FLIGHT_MODE_NAMES.get(mode_code, f"未知模式({mode_code})")
 
     def get_drone_state(self) -> Dict[str, Any]:
         """获取完整的无人机状态数据"""
-        with self.lock:
-            return self.drone_state.copy()
+        with self._state_lock:
+            return asdict(self.drone_state)
 
     def get_aircraft_sn(self) -> Optional[str]:
         """获取无人机序列号（从 update_topo 消息的 sub_devices[0].sn 中获取）"""
-        with self.lock:
+        with self._state_lock:
             if self.topo_data and "sub_devices" in self.topo_data:
                 sub_devices = self.topo_data.get("sub_devices", [])
                 if sub_devices and len(sub_devices) > 0:
@@ -375,34 +580,33 @@ class MQTTClient:
 
     def get_topo_data(self) -> Optional[Dict[str, Any]]:
         """获取完整的 update_topo data 数据"""
-        with self.lock:
+        with self._state_lock:
             return self.topo_data.copy() if self.topo_data else None
 
     def get_payload_index(self) -> Optional[str]:
         """获取相机负载索引（如 "88-0-0"，从 drc_camera_osd_info_push 获取）"""
-        with self.lock:
-            return self.camera_osd["payload_index"]
+        return self.camera_osd.payload_index
 
     def get_gimbal_attitude(
         self,
     ) -> tuple[Optional[float], Optional[float], Optional[float]]:
         """获取云台姿态 (pitch, roll, yaw)"""
-        with self.lock:
+        with self._camera_lock:
             return (
-                self.camera_osd["gimbal_pitch"],
-                self.camera_osd["gimbal_roll"],
-                self.camera_osd["gimbal_yaw"],
+                self.camera_osd.gimbal_pitch,
+                self.camera_osd.gimbal_roll,
+                self.camera_osd.gimbal_yaw,
             )
 
     def get_camera_osd_data(self) -> Dict[str, Any]:
         """获取完整的相机 OSD 数据"""
-        with self.lock:
-            return self.camera_osd.copy()
+        with self._camera_lock:
+            return asdict(self.camera_osd)
 
     def get_flyto_progress(self) -> Dict[str, Any]:
         """获取 Fly-to 进度数据"""
-        with self.lock:
-            return self.flyto_progress.copy()
+        with self._flyto_lock:
+            return asdict(self.flyto_progress)
 
     def get_flyto_status(self) -> Optional[str]:
         """
@@ -415,30 +619,31 @@ class MQTTClient:
             - "wayline_ok": 执行成功，已飞向目标点
             - "wayline_progress": 执行中
         """
-        with self.lock:
-            return self.flyto_progress["status"]
+        return self.flyto_progress.status
 
     def wait_for_flyto_event(
         self,
         expected_fly_to_id: str,
         timeout: float = 120.0,
         poll_interval: float = 1.0,
-    ) -> Dict[str, Any]:
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        should_abort: Optional[Callable[[], bool]] = None,
+    ) -> Optional[Dict[str, Any]]:
         """
-        等待指定 fly_to_id 的航点事件（事件驱动 + 轮询兜底）
+        等待指定 fly_to_id 的航点事件（条件变量驱动）
 
-        使用混合策略：
-        1. 主策略：事件回调（event 到达时立即返回，延迟 <10ms）
-        2. 兜底策略：定期轮询（每 poll_interval 秒检查一次，防止漏事件）
-        3. 超时保护：超时后抛出 TimeoutError
+        `_on_message` 收到 fly_to_point_progress 后会 notify，
+        等待方被唤醒后立即检查 fly_to_id 与状态，无需轮询。
 
         Args:
             expected_fly_to_id: 期望的 fly_to_id（必须匹配，防止读取旧航点数据）
             timeout: 超时时间（秒），默认 120 秒
-            poll_interval: 轮询间隔（秒），默认 1 秒
+            poll_interval: 已废弃，保留以兼容旧调用（不再轮询）
+            on_progress: 可选，该航点每条非终止进度推送到达时调用（在等待线程上、锁外执行，参数为进度快照）
+            should_abort: 可选，返回 True 时放弃等待并返回 None（每次唤醒及至少每 0.5 秒检查一次）
 
         Returns:
-            完整的 flyto_progress 数据（当 status 为终止状态时返回）
+            完整的 flyto_progress 数据（当 status 为终止状态时返回）；should_abort 触发时返回 None
 
         Raises:
             TimeoutError: 超时未收到终止状态事件
@@ -449,37 +654,62 @@ class MQTTClient:
             >>> if progress['status'] == 'wayline_ok':
             >>>     print("✓ 已到达航点")
         """
-        import time
-
-        start_time = time.time()
-        terminal_statuses = {"wayline_ok", "wayline_failed", "wayline_cancel"}
+        deadline = time.monotonic() + timeout
+        seen_version = -1
 
         while True:
-            elapsed = time.time() - start_time
-            if elapsed > timeout:
-                raise TimeoutError(
-                    f"等待 fly_to_id={expected_fly_to_id} 的事件超时（{timeout}秒）"
-                )
+            with self._flyto_cv:
+                while True:
+                    flyto = self.flyto_progress
+                    # ✅ 关键检查：fly_to_id 必须匹配，且到达终止状态（ok / failed / cancel）
+                    if flyto.fly_to_id == expected_fly_to_id:
+                        if flyto.status in _FLYTO_TERMINAL_STATUSES:
+                            return asdict(flyto)
+                        if on_progress is not None and self._flyto_version != seen_version:
+                            seen_version = self._flyto_version
+                            progress = asdict(flyto)
+                            break
+
+                    if should_abort is not None and should_abort():
+                        return None
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"等待 fly_to_id={expected_fly_to_id} 的事件超时（{timeout}秒）"
+                        )
+                    if should_abort is not None:
+                        remaining = min(remaining, 0.5)
+                    self._flyto_cv.wait(remaining)
 
-            # 读取最新事件数据（线程安全）
-            progress = self.get_flyto_progress()
-            event_fly_to_id = progress.get("fly_to_id")
-            status = progress.get("status")
+            # 回调在锁外执行，不阻塞消息线程写入新进度
+            on_progress(progress)
 
-            # ✅ 关键检查：fly_to_id 必须匹配
-            if event_fly_to_id == expected_fly_to_id:
-                # 收到当前航点的事件
-                if status in terminal_statuses:
-                    # 到达终止状态（ok / failed / cancel）
-                    return progress
-                # 还在飞行中（wayline_progress），继续等待
+    def register_osd_callback(self, callback):
+        """
+        注册 OSD 消息回调（用于 FPS 监控等）
 
-            # 轮询间隔（既能快速响应，又不占用太多 CPU）
-            time.sleep(poll_interval)
+        写时复制：整体替换 tuple，消息线程持有的旧快照不受影响，遍历无需加锁。
+        """
+        with self._callbacks_lock:
+            self.osd_callbacks = self.osd_callbacks + (callback,)
 
-    def register_osd_callback(self, callback):
-        """注册 OSD 消息回调（用于 FPS 监控等）"""
-        self.osd_callbacks.append(callback)
+    def unregister_osd_callback(self, callback) -> None:
+        """移除 OSD 消息回调（写时复制，未注册时忽略）"""
+        with self._callbacks_lock:
+            self.osd_callbacks = tuple(cb for cb in self.osd_callbacks if cb != callback)
+
+    def set_osd_callback_rate(self, hz: Optional[float]) -> None:
+        """
+        设置 OSD 回调的最高触发频率（接收频率控制）
+
+        OSD 缓存始终按消息实时更新，只有回调按该频率节流；
+        例如 100Hz 推送 + 10Hz 回调时，下游只处理 1/10 的消息。
+
+        Args:
+            hz: 最高触发频率（Hz），None 或 <= 0 表示不节流（默认）
+        """
+        self._osd_callback_period = 1.0 / hz if hz and hz > 0 else 0.0
 
     def get_osd_frequency(self) -> float:
         """
@@ -491,7 +721,7 @@ class MQTTClient:
         Returns:
             频率（Hz），如果数据不足返回 0.0
         """
-        with self.lock:
+        with self._osd_lock:
             if len(self._osd_timestamps) < 2:
                 return 0.0
             time_span = self._osd_timestamps[-1] - self._osd_timestamps[0]
@@ -512,16 +742,14 @@ class MQTTClient:
         Returns:
             True 如果在线（timeout 秒内有消息），False 如果离线
         """
-        import time
-
-        with self.lock:
+        with self._osd_lock:
             if self._last_osd_time == 0:
                 return False  # 还没有收到过任何 OSD 消息
             return (time.time() - self._last_osd_time) < timeout
 
-    def publish(self, method: str, data: Dict[str, Any], tid: str) -> Future:
+    def publish(self, method: str, data: Dict[str, Any], tid: str) -> _PendingCall:
         """
-        发布消息并返回 Future 等待响应
+        发布消息并返回挂起请求对象等待响应
 
         Args:
             method: 服务方法名
@@ -529,264 +757,331 @@ class MQTTClient:
             tid: 事务 ID
 
         Returns:
-            Future 对象，可通过 result() 获取响应
+            挂起请求对象，可通过 result(timeout) 获取响应
         """
-        topic = f"thing/product/{self.gateway_sn}/services"
         payload = {
             "tid": tid,
             # bid (business id) 和 tid (transaction id):
             # DJI 协议要求两个字段，实测中两者可以相同
             "bid": tid,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "method": method,
             "data": data,
         }
 
-        # 创建 Future 等待响应
-        future = Future()
-        with self.lock:
+        return self._publish_service(method, codec.dumps(payload), tid)
+
+    def publish_raw(self, method: str, data_json: bytes, tid: str) -> _PendingCall:
+        """
+        发布消息（data 已编码为 JSON bytes），跳过整包序列化
+
+        用于固定结构的请求：data 在导入时编码一次，每次只拼接信封。
+
+        Args:
+            method: 服务方法名
+            data_json: 已编码的 data 字段（JSON bytes）
+            tid: 事务 ID
+
+        Returns:
+            挂起请求对象，可通过 result(timeout) 获取响应
+        """
+        tid_b = tid.encode()
+        body = _SERVICE_ENVELOPE % (
+            tid_b,
+            tid_b,
+            time.time_ns() // 1_000_000,
+            method.encode(),
+            data_json,
+        )
+        return self._publish_service(method, body, tid)
+
+    def publish_drc(self, payload) -> None:
+        """
+        向 drc/down 发布已编码的 DRC 指令（QoS 0，无响应）
+
+        Args:
+            payload: 完整的 JSON 消息（bytes 或 str）
+        """
+        self.client.publish(self.drc_down_topic, payload, qos=0)
+
+    def _publish_service(self, method: str, body, tid: str) -> _PendingCall:
+        """登记挂起请求并发布已编码的请求体"""
+        # 创建挂起请求等待响应
+        future = _PendingCall()
+        with self._requests_lock:
             self.pending_requests[tid] = future
 
         # 发布消息
-        msg_json = json.dumps(payload)
-        self.client.publish(topic, msg_json, qos=1)
+        self.client.publish(self._services_topic, body, qos=1)
         console.print(f"[blue]→[/blue] 发送 {method} (tid: {tid[:8]}...)")
 
         return future
 
     def _on_message(self, client, userdata, msg):
-        """处理收到的消息"""
+        """处理收到的消息（按 method 查表分发，未匹配时按服务响应处理）"""
         try:
-            payload = json.loads(msg.payload.decode())
-
-            # 处理 OSD 数据推送
-            if payload.get("method") == "osd_info_push":
-                # 更新频率追踪（在锁外完成时间获取，减少锁持有时间）
-                now = time.time()
-                now_monotonic = time.monotonic()
-
-                data = payload.get("data", {})
-                with self.lock:
-                    # 更新 OSD 数据
-                    self.osd_data["latitude"] = data.get("latitude")
-                    self.osd_data["longitude"] = data.get("longitude")
-                    height = data.get("height")
-                    self.osd_data["height"] = height
-                    # 记录起飞点高度（第一次读取到有效高度时）
-                    if height is not None and self.takeoff_height is None:
-                        self.takeoff_height = height
-                    self.osd_data["attitude_head"] = data.get("attitude_head")
-                    self.osd_data["horizontal_speed"] = data.get("horizontal_speed")
-                    self.osd_data["speed_x"] = data.get("speed_x")
-                    self.osd_data["speed_y"] = data.get("speed_y")
-                    self.osd_data["speed_z"] = data.get("speed_z")
-
-                    # 更新频率追踪数据（2秒时间窗口）
-                    self._last_osd_time = now
-                    self._last_osd_msg_monotonic = now_monotonic
-                    self._osd_timestamps.append(now)
-                    # 清理超过2秒的旧时间戳，保持窗口大小
-                    while (
-                        self._osd_timestamps
-                        and (now - self._osd_timestamps[0]) > self._freq_window
-                    ):
-                        self._osd_timestamps.pop(0)
-
-                # 触发所有注册的回调（用于 FPS 监控等）
-                for callback in self.osd_callbacks:
-                    try:
-                        callback()
-                    except Exception:
-                        pass  # 忽略回调异常，避免影响消息处理
-                return
-
-            # 处理 HSI 数据推送
-            if payload.get("method") == "hsi_info_push":
-                data = payload.get("data", {})
-                around_distances: list[int] = []
-                around_raw = data.get("around_distances")
-                if isinstance(around_raw, list):
-                    for item in around_raw:
-                        parsed = _to_optional_int(item)
-                        if parsed is not None:
-                            around_distances.append(parsed)
-                with self.lock:
-                    down_distance = _to_optional_int(data.get("down_distance"))
-                    up_distance = _to_optional_int(data.get("up_distance"))
-                    self.osd_data["down_distance"] = down_distance
-                    self.osd_data["down_enable"] = data.get("down_enable")
-                    self.osd_data["down_work"] = data.get("down_work")
-                    self.hsi_data["around_distances"] = around_distances
-                    self.hsi_data["up_distance"] = up_distance
-                    self.hsi_data["down_distance"] = down_distance
-                    self.hsi_data["up_enable"] = data.get("up_enable")
-                    self.hsi_data["up_work"] = data.get("up_work")
-                    self.hsi_data["down_enable"] = data.get("down_enable")
-                    self.hsi_data["down_work"] = data.get("down_work")
-                    self.hsi_data["left_enable"] = data.get("left_enable")
-                    self.hsi_data["left_work"] = data.get("left_work")
-                    self.hsi_data["right_enable"] = data.get("right_enable")
-                    self.hsi_data["right_work"] = data.get("right_work")
-                    self.hsi_data["front_enable"] = data.get("front_enable")
-                    self.hsi_data["front_work"] = data.get("front_work")
-                    self.hsi_data["back_enable"] = data.get("back_enable")
-                    self.hsi_data["back_work"] = data.get("back_work")
-                    self.hsi_data["vertical_enable"] = data.get("vertical_enable")
-                    self.hsi_data["vertical_work"] = data.get("vertical_work")
-                    self.hsi_data["horizontal_enable"] = data.get("horizontal_enable")
-                    self.hsi_data["horizontal_work"] = data.get("horizontal_work")
-                    self.hsi_data["timestamp"] = _to_optional_int(payload.get("timestamp"))
-                    self.hsi_data["seq"] = _to_optional_int(payload.get("seq"))
-                    self._last_hsi_msg_monotonic = time.monotonic()
-                return
+            payload = codec.loads(msg.payload)
 
-            # 处理电池信息推送
-            if payload.get("method") == "drc_batteries_info_push":
-                data = payload.get("data", {})
-                with self.lock:
-                    self.osd_data["battery_percent"] = data.get("capacity_percent")
-                    self._last_battery_msg_monotonic = time.monotonic()
+            handler = self._handlers.get(payload.get("method"))
+            if handler is not None:
+                handler(payload)
                 return
 
-            # 处理无人机状态推送
-            if payload.get("method") == "drc_drone_state_push":
-                data = payload.get("data", {})
-                limit = data.get("limit", {})
-                with self.lock:
-                    self.drone_state["mode_code"] = data.get("mode_code")
-                    self.drone_state["rth_altitude"] = data.get("rth_altitude")
-                    self.drone_state["distance_limit"] = limit.get("distance_limit")
-                    self.drone_state["height_limit"] = limit.get("height_limit")
-                    self.drone_state["is_in_fixed_speed"] = data.get(
-                        "is_in_fixed_speed"
+            # 有 DRC 回包等待时按 (method, seq) 查表唤醒，无等待时只多一次字典真值判断
+            if self._drc_waiters:
+                with self._requests_lock:
+                    future = self._drc_waiters.pop(
+                        (payload.get("method"), payload.get("seq")), None
                     )
-                    self.drone_state["night_lights_state"] = data.get(
-                        "night_lights_state"
-                    )
-                return
+                if future is not None:
+                    future.set_result(payload)
+                    return
 
-            # 处理拓扑更新推送（保存完整的 data 字段）
-            if payload.get("method") == "update_topo":
-                data = payload.get("data", {})
-                with self.lock:
-                    self.topo_data = data  # 保存完整的 data 对象
-                return
+            self._handle_service_reply(payload)
 
-            # 处理相机 OSD 信息推送
-            if payload.get("method") == "drc_camera_osd_info_push":
-                data = payload.get("data", {})
-                ir_lense = data.get("ir_lense", {})
-                zoom_lense = data.get("zoom_lense", {})
-                with self.lock:
-                    self.camera_osd["payload_index"] = data.get("payload_index")
-                    self.camera_osd["gimbal_pitch"] = data.get("gimbal_pitch")
-                    self.camera_osd["gimbal_roll"] = data.get("gimbal_roll")
-                    self.camera_osd["gimbal_yaw"] = data.get("gimbal_yaw")
-                    if isinstance(ir_lense, dict):
-                        self.camera_osd["screen_split_enable"] = ir_lense.get(
-                            "screen_split_enable"
-                        )
-                        self.camera_osd["ir_zoom_factor"] = ir_lense.get(
-                            "ir_zoom_factor"
-                        )
-                    if isinstance(zoom_lense, dict):
-                        self.camera_osd["zoom_factor"] = zoom_lense.get("zoom_factor")
-                return
+        except Exception as e:
+            console.print(f"[red]消息处理异常: {e}[/red]")
 
-            # 处理 Fly-to 进度事件推送
-            if payload.get("method") == "fly_to_point_progress":
-                data = payload.get("data", {})
-                with self.lock:
-                    self.flyto_progress["fly_to_id"] = data.get("fly_to_id")
-                    self.flyto_progress["status"] = data.get("status")
-                    self.flyto_progress["result"] = data.get("result")
-                    self.flyto_progress["way_point_index"] = data.get("way_point_index")
-                    self.flyto_progress["remaining_distance"] = data.get(
-                        "remaining_distance"
-                    )
-                    self.flyto_progress["remaining_time"] = data.get("remaining_time")
-                    self.flyto_progress["planned_path_points"] = data.get(
-                        "planned_path_points"
-                    )
-                return
+    def _handle_osd_info_push(self, payload: Dict[str, Any]) -> None:
+        """处理 OSD 数据推送"""
+        # 更新频率追踪（在锁外完成时间获取，减少锁持有时间）
+        now = time.time()
+        now_monotonic = time.monotonic()
+
+        # 锁外完成字段提取，锁内只做赋值
+        data = payload.get("data", {})
+        latitude = data.get("latitude")
+        longitude = data.get("longitude")
+        height = data.get("height")
+        attitude_head = data.get("attitude_head")
+        horizontal_speed = data.get("horizontal_speed")
+        speed_x = data.get("speed_x")
+        speed_y = data.get("speed_y")
+        speed_z = data.get("speed_z")
+
+        with self._osd_lock:
+            # 更新 OSD 数据
+            osd = self.osd_data
+            osd.latitude = latitude
+            osd.longitude = longitude
+            osd.height = height
+            osd.attitude_head = attitude_head
+            osd.horizontal_speed = horizontal_speed
+            osd.speed_x = speed_x
+            osd.speed_y = speed_y
+            osd.speed_z = speed_z
+            # 记录起飞点高度（第一次读取到有效高度时）
+            if height is not None and self.takeoff_height is None:
+                self.takeoff_height = height
+
+            # 更新频率追踪数据（2秒时间窗口）
+            self._last_osd_time = now
+            self._last_osd_msg_monotonic = now_monotonic
+            self._osd_timestamps.append(now)
+            # 清理超过2秒的旧时间戳，保持窗口大小
+            while (
+                self._osd_timestamps
+                and (now - self._osd_timestamps[0]) > self._freq_window
+            ):
+                self._osd_timestamps.popleft()
+
+        self.osd_updated.set()
+
+        # 触发所有注册的回调（用于 FPS 监控等），无回调时直接跳过
+        callbacks = self.osd_callbacks
+        if callbacks:
+            if self._osd_callback_period:
+                if now_monotonic - self._last_osd_callback_time < self._osd_callback_period:
+                    return
+                self._last_osd_callback_time = now_monotonic
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    pass  # 忽略回调异常，避免影响消息处理
+
+    def _handle_hsi_info_push(self, payload: Dict[str, Any]) -> None:
+        """处理 HSI 数据推送"""
+        data = payload.get("data", {})
+        around_distances: list[int] = []
+        around_raw = data.get("around_distances")
+        if isinstance(around_raw, list):
+            for item in around_raw:
+                parsed = _to_optional_int(item)
+                if parsed is not None:
+                    around_distances.append(parsed)
+        down_distance = _to_optional_int(data.get("down_distance"))
+        down_enable = data.get("down_enable")
+        down_work = data.get("down_work")
+        # 锁外构建完整更新，锁内一次 dict.update
+        hsi_update = {
+            "around_distances": around_distances,
+            "up_distance": _to_optional_int(data.get("up_distance")),
+            "down_distance": down_distance,
+            "up_enable": data.get("up_enable"),
+            "up_work": data.get("up_work"),
+            "down_enable": down_enable,
+            "down_work": down_work,
+            "left_enable": data.get("left_enable"),
+            "left_work": data.get("left_work"),
+            "right_enable": data.get("right_enable"),
+            "right_work": data.get("right_work"),
+            "front_enable": data.get("front_enable"),
+            "front_work": data.get("front_work"),
+            "back_enable": data.get("back_enable"),
+            "back_work": data.get("back_work"),
+            "vertical_enable": data.get("vertical_enable"),
+            "vertical_work": data.get("vertical_work"),
+            "horizontal_enable": data.get("horizontal_enable"),
+            "horizontal_work": data.get("horizontal_work"),
+            "timestamp": _to_optional_int(payload.get("timestamp")),
+            "seq": _to_optional_int(payload.get("seq")),
+        }
+        now_monotonic = time.monotonic()
+
+        with self._osd_lock:
+            self.osd_data.down_distance = down_distance
+            self.osd_data.down_enable = down_enable
+            self.osd_data.down_work = down_work
+            self.hsi_data.update(hsi_update)
+            self._last_hsi_msg_monotonic = now_monotonic
+
+    def _handle_batteries_info_push(self, payload: Dict[str, Any]) -> None:
+        """处理电池信息推送"""
+        data = payload.get("data", {})
+        with self._osd_lock:
+            self.osd_data.battery_percent = data.get("capacity_percent")
+            self._last_battery_msg_monotonic = time.monotonic()
+
+    def _handle_drone_state_push(self, payload: Dict[str, Any]) -> None:
+        """处理无人机状态推送"""
+        data = payload.get("data", {})
+        limit = data.get("limit", {})
+        with self._state_lock:
+            self.drone_state.mode_code = data.get("mode_code")
+            self.drone_state.rth_altitude = data.get("rth_altitude")
+            self.drone_state.distance_limit = limit.get("distance_limit")
+            self.drone_state.height_limit = limit.get("height_limit")
+            self.drone_state.is_in_fixed_speed = data.get("is_in_fixed_speed")
+            self.drone_state.night_lights_state = data.get("night_lights_state")
+
+        self.drone_state_updated.set()
+
+    def _handle_update_topo(self, payload: Dict[str, Any]) -> None:
+        """处理拓扑更新推送（保存完整的 data 字段）"""
+        data = payload.get("data", {})
+        with self._state_lock:
+            self.topo_data = data  # 保存完整的 data 对象
+
+    def _handle_camera_osd_info_push(self, payload: Dict[str, Any]) -> None:
+        """处理相机 OSD 信息推送"""
+        data = payload.get("data", {})
+        ir_lense = data.get("ir_lense", {})
+        zoom_lense = data.get("zoom_lense", {})
+        with self._camera_lock:
+            self.camera_osd.payload_index = data.get("payload_index")
+            self.camera_osd.gimbal_pitch = data.get("gimbal_pitch")
+            self.camera_osd.gimbal_roll = data.get("gimbal_roll")
+            self.camera_osd.gimbal_yaw = data.get("gimbal_yaw")
+            if isinstance(ir_lense, dict):
+                self.camera_osd.screen_split_enable = ir_lense.get(
+                    "screen_split_enable"
+                )
+                self.camera_osd.ir_zoom_factor = ir_lense.get("ir_zoom_factor")
+            if isinstance(zoom_lense, dict):
+                self.camera_osd.zoom_factor = zoom_lense.get("zoom_factor")
+
+    def _handle_fly_to_point_progress(self, payload: Dict[str, Any]) -> None:
+        """处理 Fly-to 进度事件推送"""
+        data = payload.get("data", {})
+        with self._flyto_lock:
+            self.flyto_progress.fly_to_id = data.get("fly_to_id")
+            self.flyto_progress.status = data.get("status")
+            self.flyto_progress.result = data.get("result")
+            self.flyto_progress.way_point_index = data.get("way_point_index")
+            self.flyto_progress.remaining_distance = data.get("remaining_distance")
+            self.flyto_progress.remaining_time = data.get("remaining_time")
+            self.flyto_progress.planned_path_points = data.get(
+                "planned_path_points"
+            )
+            self._flyto_version += 1
+            self._flyto_cv.notify_all()
 
-            # 处理服务响应
-            tid = payload.get("tid")
-            if not tid:
-                return
+    def _handle_service_reply(self, payload: Dict[str, Any]) -> None:
+        """处理服务响应（按 tid 匹配挂起的请求）"""
+        tid = payload.get("tid")
+        if not tid:
+            return
 
-            with self.lock:
-                future = self.pending_requests.pop(tid, None)
-
-            if future:
-                # 检查是否有错误 - DJI 协议有两种格式：
-                # 格式1（标准）：info.code != 0 表示错误
-                # 格式2（简化）：data.result != 0 表示错误
-                info = payload.get("info", {})
-                data = payload.get("data", {})
-                top_result = payload.get("result")
-                info_code = info.get("code") if isinstance(info, dict) else None
-                data_result = data.get("result") if isinstance(data, dict) else None
-
-                # 优先检查 info.code（标准格式）
-                if info and info_code not in (None, 0):
-                    error_msg = info.get("message", "Unknown error")
-                    console.print(
-                        "[red]✗[/red] 服务调用错误 "
-                        f"(method={payload.get('method')}, tid={tid[:8]}..., info.code={info_code}, message={error_msg})"
-                    )
-                    future.set_exception(
-                        Exception(f"{error_msg} (info.code={info_code}, tid={tid})")
-                    )
-                # 再检查 payload.result（部分接口可能返回在顶层）
-                elif top_result not in (None, 0):
-                    output = data.get("output", {}) if isinstance(data, dict) else {}
-                    error_msg = (
-                        payload.get("message")
-                        or (output.get("msg") if isinstance(output, dict) else None)
-                        or (
-                            output.get("message")
-                            if isinstance(output, dict)
-                            else None
-                        )
-                        or "Unknown error"
-                    )
-                    console.print(
-                        "[red]✗[/red] 服务调用错误 "
-                        f"(method={payload.get('method')}, tid={tid[:8]}..., result={top_result}, message={error_msg})"
-                    )
-                    future.set_exception(
-                        Exception(f"{error_msg} (result={top_result}, tid={tid})")
-                    )
-                # 再检查 data.result（简化格式，如 drc_mode_enter）
-                elif "result" in data and data_result != 0:
-                    output = data.get("output", {})
-                    error_msg = (
-                        data.get("message")
-                        or (output.get("msg") if isinstance(output, dict) else None)
-                        or (
-                            output.get("message")
-                            if isinstance(output, dict)
-                            else None
-                        )
-                        or (
-                            json.dumps(output, ensure_ascii=False)
-                            if output not in ({}, None)
-                            else None
-                        )
-                        or "Unknown error"
+        with self._requests_lock:
+            future = self.pending_requests.pop(tid, None)
+
+        if future:
+            # 检查是否有错误 - DJI 协议有两种格式：
+            # 格式1（标准）：info.code != 0 表示错误
+            # 格式2（简化）：data.result != 0 表示错误
+            info = payload.get("info", {})
+            data = payload.get("data", {})
+            top_result = payload.get("result")
+            info_code = info.get("code") if isinstance(info, dict) else None
+            data_result = data.get("result") if isinstance(data, dict) else None
+
+            # 优先检查 info.code（标准格式）
+            if info and info_code not in (None, 0):
+                error_msg = info.get("message", "Unknown error")
+                console.print(
+                    "[red]✗[/red] 服务调用错误 "
+                    f"(method={payload.get('method')}, tid={tid[:8]}..., info.code={info_code}, message={error_msg})"
+                )
+                future.set_exception(
+                    Exception(f"{error_msg} (info.code={info_code}, tid={tid})")
+                )
+            # 再检查 payload.result（部分接口可能返回在顶层）
+            elif top_result not in (None, 0):
+                output = data.get("output", {}) if isinstance(data, dict) else {}
+                error_msg = (
+                    payload.get("message")
+                    or (output.get("msg") if isinstance(output, dict) else None)
+                    or (
+                        output.get("message")
+                        if isinstance(output, dict)
+                        else None
                     )
-                    console.print(
-                        "[red]✗[/red] 服务调用错误 "
-                        f"(method={payload.get('method')}, tid={tid[:8]}..., data.result={data_result}, message={error_msg})"
+                    or "Unknown error"
+                )
+                console.print(
+                    "[red]✗[/red] 服务调用错误 "
+                    f"(method={payload.get('method')}, tid={tid[:8]}..., result={top_result}, message={error_msg})"
+                )
+                future.set_exception(
+                    Exception(f"{error_msg} (result={top_result}, tid={tid})")
+                )
+            # 再检查 data.result（简化格式，如 drc_mode_enter）
+            elif "result" in data and data_result != 0:
+                output = data.get("output", {})
+                error_msg = (
+                    data.get("message")
+                    or (output.get("msg") if isinstance(output, dict) else None)
+                    or (
+                        output.get("message")
+                        if isinstance(output, dict)
+                        else None
                     )
-                    future.set_exception(
-                        Exception(f"{error_msg} (data.result={data_result}, tid={tid})")
+                    or (
+                        json.dumps(output, ensure_ascii=False)
+                        if output not in ({}, None)
+                        else None
                     )
-                # 成功
-                else:
-                    console.print(f"[green]←[/green] 收到响应 (tid: {tid[:8]}...)")
-                    future.set_result(data)
-
-        except Exception as e:
-            console.print(f"[red]消息处理异常: {e}[/red]")
+                    or "Unknown error"
+                )
+                console.print(
+                    "[red]✗[/red] 服务调用错误 "
+                    f"(method={payload.get('method')}, tid={tid[:8]}..., data.result={data_result}, message={error_msg})"
+                )
+                future.set_exception(
+                    Exception(f"{error_msg} (data.result={data_result}, tid={tid})")
+                )
+            # 成功
+            else:
+                console.print(f"[green]←[/green] 收到响应 (tid: {tid[:8]}...)")
+                future.set_result(data)
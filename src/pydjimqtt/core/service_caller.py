@@ -2,10 +2,24 @@
 服务调用器 - 负责生成请求和等待响应
 """
 
+import itertools
 import uuid
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .mqtt_client import MQTTClient
 
+# tid = 递增计数（前8位，便于日志区分）+ 进程级随机后缀，保持 UUID 字符串格式
+# 只在导入时读取一次随机数，避免每次调用 uuid4() 的系统调用
+_TID_SUFFIX = str(uuid.uuid4())[9:]
+_TID_SEQ = itertools.count()
+
+# 空 data 的编码结果（无参数调用直接复用，不再构造和序列化空字典）
+EMPTY_DATA = b"{}"
+
+
+def next_tid() -> str:
+    """生成进程内唯一的 tid（itertools.count 在 GIL 下线程安全）"""
+    return f"{next(_TID_SEQ) & 0xFFFFFFFF:08x}-{_TID_SUFFIX}"
+
 
 class ServiceCaller:
     """简单的服务调用封装"""
@@ -14,13 +28,13 @@ class ServiceCaller:
         self.mqtt = mqtt_client
         self.timeout = timeout
 
-    def call(self, method: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
+    def call(self, method: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         调用服务并等待响应
 
         Args:
             method: 服务方法名
-            data: 请求数据（可选）
+            data: 请求数据（可选，None 或空字典时发送 {}）
 
         Returns:
             响应数据
@@ -29,10 +43,30 @@ class ServiceCaller:
             TimeoutError: 响应超时
             Exception: 服务返回错误
         """
-        tid = str(uuid.uuid4())
-        future = self.mqtt.publish(method, data or {}, tid)
+        tid = next_tid()
+        if data:
+            future = self.mqtt.publish(method, data, tid)
+        else:
+            future = self.mqtt.publish_raw(method, EMPTY_DATA, tid)
+        return self._wait(method, tid, future)
+
+    def call_raw(self, method: str, data_json: bytes) -> Dict[str, Any]:
+        """
+        调用服务并等待响应（data 为预先编码的 JSON bytes，跳过序列化）
+
+        Args:
+            method: 服务方法名
+            data_json: 已编码的请求数据，例如 b"{}"
+
+        Returns:
+            响应数据
+        """
+        tid = next_tid()
+        future = self.mqtt.publish_raw(method, data_json, tid)
+        return self._wait(method, tid, future)
 
-        # 等待响应
+    def _wait(self, method: str, tid: str, future) -> Dict[str, Any]:
+        """等待响应，超时时清理挂起请求"""
         try:
             result = future.result(timeout=self.timeout)
             return result
@@ -7,14 +7,80 @@ DJI SDK 直播相关高级工具
 """
 
 import time
-import threading
-import uuid
 from typing import Optional
 from rich.console import Console
-from .utils import print_json_message, get_key
+from .utils import print_json_message, get_key, build_video_id
+from .services.commands import QUALITY_NAMES
 from .services.drc_commands import set_camera_zoom
+from .core.service_caller import next_tid
 
-console = Console()
+console = Console(highlight=False)  # 输出都带显式 markup，不需要自动高亮
+
+
+def _call_with_logging(
+    caller, method: str, request_data: dict, success_msg: str, fail_msg: str
+) -> bool:
+    """
+    调用服务并打印完整的请求/响应消息（start_live/stop_live/set_live_quality 共用）
+
+    Args:
+        caller: 服务调用器
+        method: 服务方法名
+        request_data: 请求数据
+        success_msg: 成功提示
+        fail_msg: 失败提示
+
+    Returns:
+        是否成功（data.result == 0）
+    """
+    # 构造完整的 MQTT 请求消息（模拟）
+    tid = next_tid()
+    full_request = {
+        "bid": tid,
+        "data": request_data,
+        "tid": tid,
+        "timestamp": time.time_ns() // 1_000_000,
+        "method": method,
+    }
+
+    # 打印发送的请求
+    print_json_message(f"📤 发送 MQTT 请求 ({method})", full_request, "blue")
+
+    try:
+        result = caller.call(method, request_data)
+
+        # 构造完整的 MQTT 响应消息（模拟）
+        full_response = {
+            "bid": tid,
+            "data": result,
+            "tid": tid,
+            "timestamp": time.time_ns() // 1_000_000,
+            "method": method,
+        }
+
+        # 打印接收的响应
+        print_json_message(f"📥 接收 MQTT 响应 ({method})", full_response, "green")
+
+        # 判定成功：data.result == 0
+        if result.get("result") == 0:
+            console.print(f"\n[bold green]✓ {success_msg}[/bold green]")
+
+            # 显示额外信息（如果有）
+            output = result.get("output", {})
+            if output:
+                console.print(f"[dim]输出信息: {output}[/dim]")
+            return True
+
+        error_code = result.get("result", "unknown")
+        error_msg = result.get("message", "无错误信息")
+        console.print(f"\n[bold red]✗ {fail_msg}[/bold red]")
+        console.print(f"[red]错误码: {error_code}[/red]")
+        console.print(f"[red]错误信息: {error_msg}[/red]")
+        return False
+
+    except Exception as e:
+        console.print(f"\n[bold red]✗ 请求异常: {e}[/bold red]")
+        return False
 
 
 def start_live(
@@ -45,8 +111,6 @@ def start_live(
     console.print("\n[bold cyan]========== 开始直播推流 ==========[/bold cyan]")
 
     # 构建 video_id
-    from .utils import build_video_id
-
     video_id = build_video_id(mqtt_client, video_index)
     console.print(f"[cyan]Video ID:[/cyan] {video_id}")
     console.print(f"[cyan]RTMP URL:[/cyan] {rtmp_url}")
@@ -62,58 +126,10 @@ def start_live(
         "video_quality": video_quality,
     }
 
-    # 构造完整的 MQTT 请求消息（模拟）
-    tid = str(uuid.uuid4())
-    full_request = {
-        "bid": tid,
-        "data": request_data,
-        "tid": tid,
-        "timestamp": int(time.time() * 1000),
-        "method": "live_start_push",
-    }
-
-    # 打印发送的请求
-    print_json_message("📤 发送 MQTT 请求 (live_start_push)", full_request, "blue")
-
-    # 调用 SDK 开始直播
-    try:
-        result = caller.call("live_start_push", request_data)
-
-        # 构造完整的 MQTT 响应消息（模拟）
-        full_response = {
-            "bid": tid,
-            "data": result,
-            "tid": tid,
-            "timestamp": int(time.time() * 1000),
-            "method": "live_start_push",
-        }
-
-        # 打印接收的响应
-        print_json_message(
-            "📥 接收 MQTT 响应 (live_start_push)", full_response, "green"
-        )
-
-        # 判定成功：data.result == 0
-        if result.get("result") == 0:
-            console.print("\n[bold green]✓ 直播推流已启动！[/bold green]")
-
-            # 显示额外信息（如果有）
-            output = result.get("output", {})
-            if output:
-                console.print(f"[dim]输出信息: {output}[/dim]")
-
-            return video_id
-        else:
-            error_code = result.get("result", "unknown")
-            error_msg = result.get("message", "无错误信息")
-            console.print("\n[bold red]✗ 直播推流失败[/bold red]")
-            console.print(f"[red]错误码: {error_code}[/red]")
-            console.print(f"[red]错误信息: {error_msg}[/red]")
-            return None
-
-    except Exception as e:
-        console.print(f"\n[bold red]✗ 请求异常: {e}[/bold red]")
-        return None
+    ok = _call_with_logging(
+        caller, "live_start_push", request_data, "直播推流已启动！", "直播推流失败"
+    )
+    return video_id if ok else None
 
 
 def stop_live(caller, video_id: str) -> bool:
@@ -138,54 +154,9 @@ def stop_live(caller, video_id: str) -> bool:
     # 构造请求数据
     request_data = {"video_id": video_id}
 
-    # 构造完整的 MQTT 请求消息（模拟）
-    tid = str(uuid.uuid4())
-    full_request = {
-        "bid": tid,
-        "data": request_data,
-        "tid": tid,
-        "timestamp": int(time.time() * 1000),
-        "method": "live_stop_push",
-    }
-
-    # 打印发送的请求
-    print_json_message("📤 发送 MQTT 请求 (live_stop_push)", full_request, "blue")
-
-    try:
-        result = caller.call("live_stop_push", request_data)
-
-        # 构造完整的 MQTT 响应消息（模拟）
-        full_response = {
-            "bid": tid,
-            "data": result,
-            "tid": tid,
-            "timestamp": int(time.time() * 1000),
-            "method": "live_stop_push",
-        }
-
-        # 打印接收的响应
-        print_json_message("📥 接收 MQTT 响应 (live_stop_push)", full_response, "green")
-
-        # 判定成功：data.result == 0
-        if result.get("result") == 0:
-            console.print("\n[bold green]✓ 直播推流已停止！[/bold green]")
-
-            # 显示额外信息（如果有）
-            output = result.get("output", {})
-            if output:
-                console.print(f"[dim]输出信息: {output}[/dim]")
-            return True
-        else:
-            error_code = result.get("result", "unknown")
-            error_msg = result.get("message", "无错误信息")
-            console.print("\n[bold red]✗ 停止直播失败[/bold red]")
-            console.print(f"[red]错误码: {error_code}[/red]")
-            console.print(f"[red]错误信息: {error_msg}[/red]")
-            return False
-
-    except Exception as e:
-        console.print(f"\n[bold red]✗ 请求异常: {e}[/bold red]")
-        return False
+    return _call_with_logging(
+        caller, "live_stop_push", request_data, "直播推流已停止！", "停止直播失败"
+    )
 
 
 def set_live_quality(caller, video_id: str, video_quality: int) -> bool:
@@ -210,8 +181,7 @@ def set_live_quality(caller, video_id: str, video_quality: int) -> bool:
         >>> if success:
         ...     print("清晰度已设置为超清")
     """
-    quality_names = {0: "自适应", 1: "流畅", 2: "标清", 3: "高清", 4: "超清"}
-    quality_name = quality_names.get(video_quality, "未知")
+    quality_name = QUALITY_NAMES.get(video_quality, "未知")
 
     console.print("\n[bold cyan]========== 设置直播清晰度 ==========[/bold cyan]")
     console.print(f"[cyan]Video ID:[/cyan] {video_id}")
@@ -220,58 +190,13 @@ def set_live_quality(caller, video_id: str, video_quality: int) -> bool:
     # 构造请求数据
     request_data = {"video_id": video_id, "video_quality": video_quality}
 
-    # 构造完整的 MQTT 请求消息（模拟）
-    tid = str(uuid.uuid4())
-    full_request = {
-        "bid": tid,
-        "data": request_data,
-        "tid": tid,
-        "timestamp": int(time.time() * 1000),
-        "method": "live_set_quality",
-    }
-
-    # 打印发送的请求
-    print_json_message("📤 发送 MQTT 请求 (live_set_quality)", full_request, "blue")
-
-    try:
-        result = caller.call("live_set_quality", request_data)
-
-        # 构造完整的 MQTT 响应消息（模拟）
-        full_response = {
-            "bid": tid,
-            "data": result,
-            "tid": tid,
-            "timestamp": int(time.time() * 1000),
-            "method": "live_set_quality",
-        }
-
-        # 打印接收的响应
-        print_json_message(
-            "📥 接收 MQTT 响应 (live_set_quality)", full_response, "green"
-        )
-
-        # 判定成功：data.result == 0
-        if result.get("result") == 0:
-            console.print(
-                f"\n[bold green]✓ 清晰度已设置为 {quality_name}！[/bold green]"
-            )
-
-            # 显示额外信息（如果有）
-            output = result.get("output", {})
-            if output:
-                console.print(f"[dim]输出信息: {output}[/dim]")
-            return True
-        else:
-            error_code = result.get("result", "unknown")
-            error_msg = result.get("message", "无错误信息")
-            console.print("\n[bold red]✗ 设置清晰度失败[/bold red]")
-            console.print(f"[red]错误码: {error_code}[/red]")
-            console.print(f"[red]错误信息: {error_msg}[/red]")
-            return False
-
-    except Exception as e:
-        console.print(f"\n[bold red]✗ 请求异常: {e}[/bold red]")
-        return False
+    return _call_with_logging(
+        caller,
+        "live_set_quality",
+        request_data,
+        f"清晰度已设置为 {quality_name}！",
+        "设置清晰度失败",
+    )
 
 
 def zoom_control_loop(
@@ -313,59 +238,41 @@ def zoom_control_loop(
         f"\n[dim]当前变焦: {zoom_factor}x (范围: {min_zoom}-{max_zoom}x)[/dim]\n"
     )
 
-    stop_flag = threading.Event()
-
-    def keyboard_listener():
-        """键盘监听线程"""
-        nonlocal zoom_factor
-
-        while not stop_flag.is_set():
-            try:
-                key = get_key()
-
-                if key == "UP":
-                    # 放大
-                    new_zoom = min(zoom_factor + zoom_step, max_zoom)
-                    if new_zoom != zoom_factor:
-                        zoom_factor = new_zoom
-                        console.print(
-                            f"[cyan]↑[/cyan] 放大至 [bold green]{zoom_factor:.1f}x[/bold green]"
-                        )
-                        set_camera_zoom(
-                            mqtt_client, payload_index, zoom_factor, camera_type
-                        )
-                    else:
-                        console.print(f"[yellow]已达到最大变焦 ({max_zoom}x)[/yellow]")
-
-                elif key == "DOWN":
-                    # 缩小
-                    new_zoom = max(zoom_factor - zoom_step, min_zoom)
-                    if new_zoom != zoom_factor:
-                        zoom_factor = new_zoom
-                        console.print(
-                            f"[cyan]↓[/cyan] 缩小至 [bold green]{zoom_factor:.1f}x[/bold green]"
-                        )
-                        set_camera_zoom(
-                            mqtt_client, payload_index, zoom_factor, camera_type
-                        )
-                    else:
-                        console.print(f"[yellow]已达到最小变焦 ({min_zoom}x)[/yellow]")
-
-                elif key in ["q", "Q", "ESC"]:
-                    console.print("\n[yellow]退出变焦控制模式[/yellow]")
-                    stop_flag.set()
-                    break
-
-            except Exception as e:
-                console.print(f"[red]键盘输入错误: {e}[/red]")
-                time.sleep(0.1)
-
-    # 启动键盘监听线程
-    listener_thread = threading.Thread(target=keyboard_listener, daemon=True)
-    listener_thread.start()
-
-    # 等待用户退出
-    stop_flag.wait()
-    listener_thread.join(timeout=1)
+    # 直接在调用线程上读键（调用方在此阻塞等待，无需额外监听线程）
+    while True:
+        try:
+            key = get_key()
+
+            if key == "UP":
+                # 放大
+                new_zoom = min(zoom_factor + zoom_step, max_zoom)
+                if new_zoom != zoom_factor:
+                    zoom_factor = new_zoom
+                    console.print(
+                        f"[cyan]↑[/cyan] 放大至 [bold green]{zoom_factor:.1f}x[/bold green]"
+                    )
+                    set_camera_zoom(mqtt_client, payload_index, zoom_factor, camera_type)
+                else:
+                    console.print(f"[yellow]已达到最大变焦 ({max_zoom}x)[/yellow]")
+
+            elif key == "DOWN":
+                # 缩小
+                new_zoom = max(zoom_factor - zoom_step, min_zoom)
+                if new_zoom != zoom_factor:
+                    zoom_factor = new_zoom
+                    console.print(
+                        f"[cyan]↓[/cyan] 缩小至 [bold green]{zoom_factor:.1f}x[/bold green]"
+                    )
+                    set_camera_zoom(mqtt_client, payload_index, zoom_factor, camera_type)
+                else:
+                    console.print(f"[yellow]已达到最小变焦 ({min_zoom}x)[/yellow]")
+
+            elif key in ["q", "Q", "ESC"]:
+                console.print("\n[yellow]退出变焦控制模式[/yellow]")
+                break
+
+        except Exception as e:
+            console.print(f"[red]键盘输入错误: {e}[/red]")
+            time.sleep(0.1)
 
     return True  # 返回 True 表示用户要求退出
@@ -10,6 +10,7 @@ import math
 import threading
 from typing import Optional, Tuple, Dict, Any
 
+from ..core.mqtt_client import FLIGHT_MODE_NAMES, UpdateSignal
 
 class MockMQTTClient:
     """
@@ -22,6 +23,29 @@ class MockMQTTClient:
     - 航向角：跟随飞行方向（0-360度）
     """
 
+    __slots__ = (
+        "gateway_sn",
+        "drc_down_topic",
+        "config",
+        "client",
+        "_connected",
+        "osd_updated",
+        "drone_state_updated",
+        "osd_callbacks",
+        "start_time",
+        "phase_offset",
+        "base_lat",
+        "base_lon",
+        "base_height",
+        "flight_radius",
+        "angular_velocity",
+        "vertical_amplitude",
+        "vertical_frequency",
+        "_tangential_velocity",
+        "takeoff_height",
+        "_state_cache",
+    )
+
     def __init__(self, gateway_sn: str, mqtt_config: Dict[str, Any], index: int = 0):
         """
         初始化模拟客户端
@@ -32,12 +56,19 @@ class MockMQTTClient:
             index: 无人机索引（用于生成不同轨迹）
         """
         self.gateway_sn = gateway_sn
+        self.drc_down_topic = f"thing/product/{gateway_sn}/drc/down"
         self.config = mqtt_config
         self.client = self  # 兼容 client.publish() 调用
         self._connected = False
+        # 与真实客户端接口一致；模拟数据按需计算，随时就绪
+        self.osd_updated = UpdateSignal()
+        self.osd_updated.set()
+        self.drone_state_updated = UpdateSignal()
+        self.drone_state_updated.set()
+        self.osd_callbacks: tuple = ()
 
         # 启动时间戳
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
 
         # 每架无人机的相位偏移（用于生成不同轨迹）
         # 5架无人机均匀分布在圆周上（0°, 72°, 144°, 216°, 288°）
@@ -54,10 +85,16 @@ class MockMQTTClient:
         self.angular_velocity = 0.1  # 角速度（弧度/秒，周期约60秒）
         self.vertical_amplitude = 5.0  # 垂直振荡幅度（米）
         self.vertical_frequency = 0.05  # 垂直振荡频率（弧度/秒）
+        # 切向速度大小（m/s）：v = r * w，r 从纬度单位换算为米（1° ≈ 111km）
+        # 圆周匀速运动，水平速度恒等于该值
+        self._tangential_velocity = self.flight_radius * self.angular_velocity * 111000
 
         # 起飞点高度（用于计算相对高度）
         self.takeoff_height = self.base_height
 
+        # 运动状态缓存：(10ms 量化时间戳, 状态元组)，同一帧内位置/速度/航向共用一次计算
+        self._state_cache: Optional[Tuple[int, Tuple[float, ...]]] = None
+
     def connect(self):
         """模拟连接MQTT"""
         self._connected = True
@@ -68,7 +105,71 @@ class MockMQTTClient:
 
     def _elapsed(self) -> float:
         """获取运行时长（秒）"""
-        return time.time() - self.start_time
+        return time.monotonic() - self.start_time
+
+    def _kinematics(self) -> Tuple[float, float, float, float, float, float]:
+        """
+        在同一时刻计算轨迹所需的全部三角函数
+
+        位置、速度、航向共用同一个时间戳和同一组 sin/cos，避免各自重复计算。
+
+        Returns:
+            (t, angle, sin(angle), cos(angle), sin(wv*t), cos(wv*t))
+        """
+        t = self._elapsed()
+        angle = self.angular_velocity * t + self.phase_offset
+        vertical_phase = self.vertical_frequency * t
+        return (
+            t,
+            angle,
+            math.sin(angle),
+            math.cos(angle),
+            math.sin(vertical_phase),
+            math.cos(vertical_phase),
+        )
+
+    def _kinematic_state(self) -> Tuple[float, ...]:
+        """
+        计算当前运动状态（位置 + 速度 + 航向），按 10ms 时间片缓存
+
+        同一帧内的 get_position/get_speed/get_attitude_head 及其派生 getter
+        共用一组 sin/cos。
+
+        Returns:
+            (lat, lon, height, horizontal_speed, speed_x, speed_y, speed_z, heading)
+        """
+        tick = int(time.monotonic() * 100)
+        cache = self._state_cache
+        if cache is not None and cache[0] == tick:
+            return cache[1]
+
+        _, angle, sin_a, cos_a, sin_v, cos_v = self._kinematics()
+
+        # 水平位置（圆形轨迹）
+        lat = self.base_lat + self.flight_radius * sin_a
+        lon = self.base_lon + self.flight_radius * cos_a
+
+        # 垂直位置（正弦波浮动）
+        height = self.base_height + 20.0 + self.vertical_amplitude * sin_v
+
+        tangential_velocity = self._tangential_velocity
+
+        # 速度分量（数学准确的导数）
+        speed_x = tangential_velocity * cos_a  # 纬度方向
+        speed_y = -tangential_velocity * sin_a  # 经度方向（负号因为cos的导数）
+
+        # 垂直速度（高度的导数）
+        speed_z = self.vertical_amplitude * self.vertical_frequency * cos_v
+
+        # 水平速度（合成）：sin²+cos²=1，模长即切向速度
+        horizontal_speed = tangential_velocity
+
+        # 航向角：转换为度数并归一化到 [0, 360)
+        heading = math.degrees(angle) % 360
+
+        state = (lat, lon, height, horizontal_speed, speed_x, speed_y, speed_z, heading)
+        self._state_cache = (tick, state)
+        return state
 
     # ========== GPS位置数据 ==========
 
@@ -83,21 +184,7 @@ class MockMQTTClient:
         Returns:
             (latitude, longitude, height)
         """
-        t = self._elapsed()
-        angle = self.angular_velocity * t + self.phase_offset
-
-        # 水平位置（圆形轨迹）
-        lat = self.base_lat + self.flight_radius * math.sin(angle)
-        lon = self.base_lon + self.flight_radius * math.cos(angle)
-
-        # 垂直位置（正弦波浮动）
-        height = (
-            self.base_height
-            + 20.0
-            + self.vertical_amplitude * math.sin(self.vertical_frequency * t)
-        )
-
-        return (lat, lon, height)
+        return self._kinematic_state()[0:3]
 
     def get_latitude(self) -> Optional[float]:
         """获取纬度"""
@@ -141,30 +228,7 @@ class MockMQTTClient:
         Returns:
             (horizontal_speed, speed_x, speed_y, speed_z) 单位：m/s
         """
-        t = self._elapsed()
-        angle = self.angular_velocity * t + self.phase_offset
-
-        # 切向速度大小（m/s）
-        # v = r * w，其中r需要转换为米
-        tangential_velocity = self.flight_radius * self.angular_velocity * 111000
-
-        # 速度分量（数学准确的导数）
-        speed_x = tangential_velocity * math.cos(angle)  # 纬度方向
-        speed_y = -tangential_velocity * math.sin(
-            angle
-        )  # 经度方向（负号因为cos的导数）
-
-        # 垂直速度（高度的导数）
-        speed_z = (
-            self.vertical_amplitude
-            * self.vertical_frequency
-            * math.cos(self.vertical_frequency * t)
-        )
-
-        # 水平速度（合成）
-        horizontal_speed = math.sqrt(speed_x**2 + speed_y**2)
-
-        return (horizontal_speed, speed_x, speed_y, speed_z)
+        return self._kinematic_state()[3:7]
 
     # ========== 姿态数据 ==========
 
@@ -181,12 +245,7 @@ class MockMQTTClient:
         Returns:
             航向角 [0, 360)
         """
-        t = self._elapsed()
-        angle = self.angular_velocity * t + self.phase_offset
-
-        # 转换为度数并归一化到 [0, 360)
-        heading = math.degrees(angle) % 360
-        return heading
+        return self._kinematic_state()[7]
 
     # ========== HSI数据（高度传感器）==========
 
@@ -246,30 +305,10 @@ class MockMQTTClient:
 
     def get_flight_mode_name(self) -> str:
         """获取飞行模式名称（中文）"""
-        mode_names = {
-            0: "待机",
-            1: "起飞准备",
-            2: "起飞准备完毕",
-            3: "摇杆控制",
-            4: "自动起飞",
-            5: "航线飞行",
-            6: "全景拍照",
-            7: "智能跟随",
-            8: "ADS-B 躲避",
-            9: "自动返航",
-            10: "自动降落",
-            11: "强制降落",
-            12: "三桨叶降落",
-            13: "升级中",
-            14: "未连接",
-            15: "APAS",
-            16: "虚拟摇杆状态",
-            17: "指令飞行",
-        }
         mode_code = self.get_flight_mode()
         if mode_code is None:
             return "未知"
-        return mode_names.get(mode_code, f"未知模式({mode_code})")
+        return FLIGHT_MODE_NAMES.get(mode_code, f"未知模式({mode_code})")
 
     def get_drone_state(self) -> Dict[str, Any]:
         """
@@ -353,6 +392,10 @@ class MockMQTTClient:
         # 静默忽略（避免污染输出）
         pass
 
+    def publish_drc(self, payload) -> None:
+        """兼容 DRC 下行发布接口（静默忽略）"""
+        pass
+
     def cleanup_request(self, tid: str):
         """兼容超时清理接口"""
         pass
@@ -384,6 +427,14 @@ class MockMQTTClient:
         """
         return True  # 模拟器始终在线
 
+    def register_osd_callback(self, callback) -> None:
+        """注册 OSD 回调（模拟器没有推送，回调不会被触发；仅保持接口一致）"""
+        self.osd_callbacks = self.osd_callbacks + (callback,)
+
+    def unregister_osd_callback(self, callback) -> None:
+        """移除 OSD 回调（仅保持接口一致）"""
+        self.osd_callbacks = tuple(cb for cb in self.osd_callbacks if cb != callback)
+
 
 class MockServiceCaller:
     """
@@ -392,6 +443,8 @@ class MockServiceCaller:
     GUI不调用服务（只读数据），此类仅占位以保持接口一致。
     """
 
+    __slots__ = ("mqtt",)
+
     def __init__(self, mqtt_client: MockMQTTClient):
         self.mqtt = mqtt_client
 
@@ -402,23 +455,28 @@ class MockServiceCaller:
         模拟服务调用（总是返回成功）
 
         Returns:
-            {'result': 0, 'data': {}, 'message': 'Mock success'}
+            {'result': 0, 'data': {}, 'message': 'Mock success'}（每次新建，调用方可修改）
         """
         return {"result": 0, "data": {}, "message": "Mock success"}
 
+    def call_raw(self, method: str, data_json: bytes) -> Dict[str, Any]:
+        """模拟预编码请求的服务调用（总是返回成功）"""
+        return {"result": 0, "data": {}, "message": "Mock success"}
+
 
-class MockHeartbeatThread(threading.Thread):
+class MockHeartbeatThread:
     """
     模拟的心跳线程
 
     特点：
-    - 继承threading.Thread（兼容is_alive()检查）
+    - 鸭子类型兼容 threading.Thread（is_alive/start/join/run）
     - 添加stop_flag属性（兼容stop_heartbeat()）
-    - 不实际运行后台循环（节省资源）
+    - 不继承 Thread、不创建真实线程（从不被调度，无需线程对象的锁和状态）
     """
 
+    __slots__ = ("stop_flag", "_mock_alive", "_started")
+
     def __init__(self):
-        super().__init__(daemon=True)
         self.stop_flag = threading.Event()
         self._mock_alive = True
         self._started = False  # 标记是否已启动
@@ -432,12 +490,11 @@ class MockHeartbeatThread(threading.Thread):
         pass
 
     def start(self):
-        """覆盖start方法，避免实际启动线程（但标记为已启动状态）"""
+        """标记为已启动状态（不启动真实线程）"""
         self._started = True
-        # 不调用 super().start()，避免启动真实线程
 
     def join(self, timeout=None):
-        """覆盖join方法，立即返回（因为没有真实线程在运行）"""
+        """立即返回（没有真实线程在运行）"""
         pass
 
 
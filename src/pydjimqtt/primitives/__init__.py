@@ -5,12 +5,13 @@
 """
 
 from .stick import send_stick_repeatedly
-from .wait import wait_for_condition
+from .wait import wait_for_condition, wait_for_event
 from .waypoint import fly_to_waypoint, monitor_flyto_progress
 
 __all__ = [
     "send_stick_repeatedly",
     "wait_for_condition",
+    "wait_for_event",
     "fly_to_waypoint",
     "monitor_flyto_progress",
 ]
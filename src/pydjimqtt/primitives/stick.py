@@ -36,6 +36,11 @@ def send_stick_repeatedly(
     """
     interval = 1.0 / frequency
     count = int(duration * frequency)
+    # 绝对截止时间调度：发送耗时不累积成漂移，落后的节拍直接补发
+    deadline = time.monotonic()
     for _ in range(count):
         send_stick_control(mqtt, roll=roll, pitch=pitch, throttle=throttle, yaw=yaw)
-        time.sleep(interval)
+        deadline += interval
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
@@ -2,8 +2,10 @@
 等待条件原语
 """
 
+import threading
 import time
-from typing import Callable
+from typing import Callable, Union
+from ..core.mqtt_client import UpdateSignal
 
 
 def wait_for_condition(
@@ -28,9 +30,58 @@ def wait_for_condition(
         >>> # 等待GPS数据就绪
         >>> wait_for_condition(lambda: mqtt.get_height() is not None, timeout=30)
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    start_time = time.monotonic()
+    while time.monotonic() - start_time < timeout:
         if condition_func():
             return
         time.sleep(check_interval)
     raise TimeoutError(timeout_msg)
+
+
+def wait_for_event(
+    event: Union[UpdateSignal, threading.Event],
+    condition_func: Callable[[], bool],
+    timeout: float = 30.0,
+    timeout_msg: str = "等待超时",
+) -> None:
+    """
+    等待条件满足（事件驱动，数据到达即检查）
+
+    每次被 event 唤醒后重新检查条件，无需固定间隔轮询。
+    UpdateSignal（mqtt.osd_updated 等）：先记下版本号再检查条件，检查之后的更新不会丢失，
+    多个等待方共用同一信号互不影响。
+    threading.Event：先 clear 再检查条件，仅适用于该事件只有一个等待方的情况。
+
+    Args:
+        event: 状态更新信号（如 mqtt.osd_updated、mqtt.drone_state_updated），或 threading.Event
+        condition_func: 返回布尔值的条件函数
+        timeout: 超时时间（秒）
+        timeout_msg: 超时错误消息
+
+    Raises:
+        TimeoutError: 超时未满足条件
+
+    Example:
+        >>> wait_for_event(mqtt.osd_updated, lambda: mqtt.get_height() is not None)
+        >>> # 等待降落完成（飞行模式回到待机）
+        >>> wait_for_event(mqtt.drone_state_updated, lambda: mqtt.get_flight_mode() == 0, timeout=50)
+    """
+    deadline = time.monotonic() + timeout
+    if isinstance(event, threading.Event):
+        while True:
+            event.clear()
+            if condition_func():
+                return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(timeout_msg)
+            event.wait(remaining)
+
+    while True:
+        seen = event.version
+        if condition_func():
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(timeout_msg)
+        event.wait_for_update(seen, remaining)
@@ -18,8 +18,11 @@ from .commands import (
     setup_multiple_drc_connections,
 )
 from .heartbeat import start_heartbeat, stop_heartbeat
+from .downlink import DRCDownlinkScheduler
 from .drc_commands import (
     send_stick_control,
+    send_stick_control_batch,
+    StickBatcher,
     set_camera_zoom,
     camera_screen_split,
     camera_screen_split_wait,
@@ -54,6 +57,9 @@ __all__ = [
     "stop_heartbeat",
     # DRC 杆量控制
     "send_stick_control",
+    "send_stick_control_batch",
+    "StickBatcher",
+    "DRCDownlinkScheduler",
     # 相机和云台控制
     "set_camera_zoom",
     "camera_screen_split",
@@ -4,16 +4,35 @@ DJI 云端服务调用 - 统一接口
 所有 DJI 服务的调用函数都在这里，通过通用包装消除重复代码。
 """
 
+import atexit
 import time
-import json
-import threading
+import uuid
 from typing import Dict, Any, Optional, Tuple, List
 from concurrent.futures import ThreadPoolExecutor
-from ..core import ServiceCaller, MQTTClient
+from ..core import ServiceCaller, MQTTClient, async_console, codec
+from ..core.service_caller import EMPTY_DATA
+from ..mock.mock_drone import MockHeartbeatThread
+from .drc_commands import STICK_TPL, check_stick, next_seq
+from .heartbeat import Heartbeat, start_heartbeat
 from rich.console import Console
 
 console = Console()
 
+# 多机连接设置共用的线程池（线程按需创建、空闲复用，跨多次任务不再反复建销线程）
+_SETUP_POOL = ThreadPoolExecutor(max_workers=64, thread_name_prefix="drc-setup")
+atexit.register(_SETUP_POOL.shutdown, wait=False)
+
+# 名称查表（只读，模块级共享，调用时不再重建字典）
+_LENS_NAMES = {"normal": "默认", "thermal": "红外", "wide": "广角", "zoom": "变焦"}
+QUALITY_NAMES = {0: "自适应", 1: "流畅", 2: "标清", 3: "高清", 4: "超清"}
+_RESET_MODE_NAMES = {0: "回中", 1: "向下", 2: "偏航回中", 3: "俯仰向下"}
+
+
+def _info(msg: str) -> None:
+    """非错误提示，受 async_console.VERBOSE 开关控制"""
+    if async_console.VERBOSE:
+        console.print(msg)
+
 
 def _call_service(
     caller: ServiceCaller,
@@ -37,36 +56,66 @@ def _call_service(
         Exception: 服务调用失败
     """
     try:
-        result = caller.call(method, data or {})
-
-        if result.get("result") == 0:
-            if success_msg:
-                console.print(f"[green]✓ {success_msg}[/green]")
-            return result.get("data", {})
-        else:
-            # 提取详细错误信息
-            error_code = result.get("result", "unknown")
-            error_msg = result.get(
-                "message", result.get("output", {}).get("msg", "Unknown error")
-            )
-
-            # 打印详细错误信息（仅针对错误情况）
-            console.print("[red]✗ 服务调用失败:[/red]")
-            console.print(f"  [yellow]方法:[/yellow] {method}")
-            console.print(f"  [yellow]错误码:[/yellow] {error_code}")
-            console.print(f"  [yellow]错误信息:[/yellow] {error_msg}")
-            console.print(f"  [dim]完整响应: {result}[/dim]")
-
-            # 增强异常消息，包含完整响应以便调试
-            raise Exception(
-                f"{method} 失败 (code={error_code}): {error_msg} | 完整响应: {result}"
-            )
+        return _unwrap_result(method, caller.call(method, data), success_msg)
+    except Exception as e:
+        console.print(f"[red]✗ {method}: {e}[/red]")
+        raise
+
 
+def call_service_raw(
+    caller: ServiceCaller,
+    method: str,
+    data_json: bytes = EMPTY_DATA,
+    success_msg: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    同 _call_service，但 data 为预先编码的 JSON bytes（固定载荷导入时编码一次）
+
+    Args:
+        caller: 服务调用器
+        method: DJI 服务方法名
+        data_json: 已编码的请求数据
+        success_msg: 成功时的提示信息
+
+    Returns:
+        服务返回的数据字典
+    """
+    try:
+        return _unwrap_result(method, caller.call_raw(method, data_json), success_msg)
     except Exception as e:
         console.print(f"[red]✗ {method}: {e}[/red]")
         raise
 
 
+def _unwrap_result(
+    method: str, result: Dict[str, Any], success_msg: Optional[str]
+) -> Dict[str, Any]:
+    """检查服务响应：成功返回 data，失败打印详情并抛出异常"""
+    if result.get("result") == 0:
+        if success_msg:
+            _info(f"[green]✓ {success_msg}[/green]")
+        return result.get("data", {})
+
+    # 提取详细错误信息
+    error_code = result.get("result", "unknown")
+    error_msg = result.get("message")
+    if error_msg is None:
+        output = result.get("output")
+        error_msg = (output.get("msg") if output else None) or "Unknown error"
+
+    # 打印详细错误信息（仅针对错误情况）
+    console.print("[red]✗ 服务调用失败:[/red]")
+    console.print(f"  [yellow]方法:[/yellow] {method}")
+    console.print(f"  [yellow]错误码:[/yellow] {error_code}")
+    console.print(f"  [yellow]错误信息:[/yellow] {error_msg}")
+    console.print(f"  [dim]完整响应: {result}[/dim]")
+
+    # 增强异常消息，包含完整响应以便调试
+    raise Exception(
+        f"{method} 失败 (code={error_code}): {error_msg} | 完整响应: {result}"
+    )
+
+
 # ========== 控制权管理 ==========
 
 
@@ -76,7 +125,7 @@ def request_control_auth(
     user_callsign: str = "Cloud Pilot",
 ) -> Dict[str, Any]:
     """请求控制权"""
-    console.print("[bold cyan]请求控制权...[/bold cyan]")
+    _info("[bold cyan]请求控制权...[/bold cyan]")
     return _call_service(
         caller,
         "cloud_control_auth_request",
@@ -91,8 +140,8 @@ def request_control_auth(
 
 def release_control_auth(caller: ServiceCaller) -> Dict[str, Any]:
     """释放控制权"""
-    console.print("[cyan]释放控制权...[/cyan]")
-    return _call_service(
+    _info("[cyan]释放控制权...[/cyan]")
+    return call_service_raw(
         caller, "cloud_control_auth_release", success_msg="控制权已释放"
     )
 
@@ -107,7 +156,7 @@ def enter_drc_mode(
     hsi_frequency: int = 10,
 ) -> Dict[str, Any]:
     """进入 DRC 模式"""
-    console.print("[bold cyan]进入 DRC 模式...[/bold cyan]")
+    _info("[bold cyan]进入 DRC 模式...[/bold cyan]")
     result = _call_service(
         caller,
         "drc_mode_enter",
@@ -123,8 +172,8 @@ def enter_drc_mode(
 
 def exit_drc_mode(caller: ServiceCaller) -> Dict[str, Any]:
     """退出 DRC 模式"""
-    console.print("[cyan]退出 DRC 模式...[/cyan]")
-    return _call_service(caller, "drc_mode_exit", success_msg="已退出 DRC 模式")
+    _info("[cyan]退出 DRC 模式...[/cyan]")
+    return call_service_raw(caller, "drc_mode_exit", success_msg="已退出 DRC 模式")
 
 
 # ========== 直播控制 ==========
@@ -150,9 +199,8 @@ def change_live_lens(
         >>> # 切换到广角镜头
         >>> change_live_lens(caller, "SN123/39-0-7/wide-0", "wide")
     """
-    lens_names = {"normal": "默认", "thermal": "红外", "wide": "广角", "zoom": "变焦"}
-    lens_name = lens_names.get(video_type, video_type)
-    console.print(f"[cyan]切换直播镜头: {video_id} → {lens_name}[/cyan]")
+    lens_name = _LENS_NAMES.get(video_type, video_type)
+    _info(f"[cyan]切换直播镜头: {video_id} → {lens_name}[/cyan]")
     return _call_service(
         caller,
         "live_lens_change",
@@ -184,9 +232,8 @@ def set_live_quality(
         >>> # 设置为超清
         >>> set_live_quality(caller, "1234567890ABC/88-0-0/normal-0", 4)
     """
-    quality_names = {0: "自适应", 1: "流畅", 2: "标清", 3: "高清", 4: "超清"}
-    quality_name = quality_names.get(video_quality, "未知")
-    console.print(f"[cyan]设置直播清晰度: {quality_name} (video_id: {video_id})[/cyan]")
+    quality_name = QUALITY_NAMES.get(video_quality, "未知")
+    _info(f"[cyan]设置直播清晰度: {quality_name} (video_id: {video_id})[/cyan]")
     return _call_service(
         caller,
         "live_set_quality",
@@ -203,9 +250,9 @@ def start_live_push(
     video_quality: int = 0,
 ) -> Dict[str, Any]:
     """开始直播推流 (url_type: 0-RTMP, 1-RTSP, 2-GB28181)"""
-    console.print("[bold cyan]开始直播推流...[/bold cyan]")
-    console.print(f"[dim]URL: {url}[/dim]")
-    console.print(f"[dim]镜头: {video_id}[/dim]")
+    _info("[bold cyan]开始直播推流...[/bold cyan]")
+    _info(f"[dim]URL: {url}[/dim]")
+    _info(f"[dim]镜头: {video_id}[/dim]")
     return _call_service(
         caller,
         "live_start_push",
@@ -221,7 +268,7 @@ def start_live_push(
 
 def stop_live_push(caller: ServiceCaller, video_id: str) -> Dict[str, Any]:
     """停止直播推流"""
-    console.print(f"[cyan]停止直播推流: {video_id}[/cyan]")
+    _info(f"[cyan]停止直播推流: {video_id}[/cyan]")
     return _call_service(
         caller, "live_stop_push", {"video_id": video_id}, "直播推流已停止"
     )
@@ -247,8 +294,8 @@ def return_home(caller: ServiceCaller) -> Dict[str, Any]:
         [cyan]执行一键返航...[/cyan]
         [green]✓ 返航指令已发送[/green]
     """
-    console.print("[cyan]执行一键返航...[/cyan]")
-    return _call_service(caller, "return_home", data=None, success_msg="返航指令已发送")
+    _info("[cyan]执行一键返航...[/cyan]")
+    return call_service_raw(caller, "return_home", success_msg="返航指令已发送")
 
 
 def fly_to_point(
@@ -280,13 +327,11 @@ def fly_to_point(
         >>> fly_to_id = fly_to_point(caller, latitude=39.0427514, longitude=117.7238255, height=100.0)
         >>> progress = mqtt.wait_for_flyto_event(fly_to_id)
     """
-    import uuid
-
     # 生成 fly_to_id
     if fly_to_id is None:
         fly_to_id = str(uuid.uuid4())
 
-    console.print(
+    _info(
         f"[cyan]飞向目标点 (lat: {latitude:.6f}, lon: {longitude:.6f}, h: {height:.1f}m)...[/cyan]"
     )
 
@@ -344,27 +389,17 @@ def send_stick_control(
         >>> # 向左飞行
         >>> send_stick_control(mqtt, roll=694)  # 1024 - 330 (半杆)
     """
-    # 参数验证
-    if not (364 <= roll <= 1684):
-        raise ValueError(f"roll 必须在 [364, 1684] 范围内，当前值: {roll}")
-    if not (364 <= pitch <= 1684):
-        raise ValueError(f"pitch 必须在 [364, 1684] 范围内，当前值: {pitch}")
-    if not (364 <= throttle <= 1684):
-        raise ValueError(f"throttle 必须在 [364, 1684] 范围内，当前值: {throttle}")
-    if not (364 <= yaw <= 1684):
-        raise ValueError(f"yaw 必须在 [364, 1684] 范围内，当前值: {yaw}")
-
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
-    seq = int(time.time() * 1000)
-
-    payload = {
-        "seq": seq,
-        "method": "stick_control",
-        "data": {"roll": roll, "pitch": pitch, "throttle": throttle, "yaw": yaw},
-    }
+    # 参数验证（与 drc_commands 共用校验，保留本接口的中文报错）
+    frame = check_stick(
+        roll, pitch, throttle, yaw, "{name} 必须在 [364, 1684] 范围内，当前值: {value}"
+    )
 
-    # 发送控制指令（QoS 0，无回包机制）
-    mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
+    # 发送控制指令（QoS 0，无回包机制）；与 drc_commands 共用 bytes 模板和递增 seq
+    mqtt_client.client.publish(
+        mqtt_client.drc_down_topic,
+        STICK_TPL % (next_seq(), *frame),
+        qos=0,
+    )
 
 
 # ========== DRC 连接设置 ==========
@@ -380,7 +415,7 @@ def setup_drc_connection(
     heartbeat_interval: float = 1.0,
     wait_for_user: bool = True,
     skip_drc_setup: bool = False,
-) -> Tuple[MQTTClient, ServiceCaller, Optional[threading.Thread]]:
+) -> Tuple[MQTTClient, ServiceCaller, Optional[Heartbeat]]:
     """
     Setup complete DRC connection in one call.
 
@@ -406,8 +441,8 @@ def setup_drc_connection(
         skip_drc_setup: Skip control auth and DRC mode setup (only connect MQTT)
 
     Returns:
-        (mqtt_client, service_caller, heartbeat_thread)
-        Note: heartbeat_thread is None if skip_drc_setup=True
+        (mqtt_client, service_caller, heartbeat)
+        heartbeat is the HeartbeatHandle from start_heartbeat (None if skip_drc_setup=True)
 
     Example:
         >>> # Full DRC setup
@@ -416,9 +451,6 @@ def setup_drc_connection(
         >>> # MQTT only
         >>> mqtt, caller, _ = setup_drc_connection("SN123", mqtt_config, skip_drc_setup=True)
     """
-    from ..services.heartbeat import start_heartbeat
-    import uuid
-
     console.print(f"[bold cyan]设置 DRC 连接: {gateway_sn}[/bold cyan]")
 
     # Step 1: Connect MQTT
@@ -479,7 +511,7 @@ def setup_multiple_drc_connections(
     hsi_frequency: int = 10,
     heartbeat_interval: float = 1.0,
     skip_drc_setup: bool = False,
-) -> List[Tuple[MQTTClient, ServiceCaller, threading.Thread]]:
+) -> List[Tuple[MQTTClient, ServiceCaller, Heartbeat]]:
     """
     Setup multiple DRC connections in parallel (3x faster than sequential).
 
@@ -500,7 +532,8 @@ def setup_multiple_drc_connections(
         skip_drc_setup: Skip control auth and DRC mode setup (only connect MQTT)
 
     Returns:
-        List of (mqtt_client, service_caller, heartbeat_thread) tuples
+        List of (mqtt_client, service_caller, heartbeat) tuples; heartbeat is a
+        HeartbeatHandle (MockHeartbeatThread placeholder if skip_drc_setup=True)
 
     Example:
         >>> uav_configs = [
@@ -513,17 +546,15 @@ def setup_multiple_drc_connections(
         ...     stop_heartbeat(heartbeat)
         ...     mqtt.disconnect()
     """
-    from ..services.heartbeat import start_heartbeat
-
     if skip_drc_setup:
         console.print(
             f"[bold yellow]仅连接 MQTT ({len(uav_configs)} 架无人机)[/bold yellow]"
         )
         console.print("[dim]跳过控制权请求和 DRC 模式设置[/dim]\n")
 
-        # 只建立 MQTT 连接，不请求控制权和 DRC 模式
-        connections = []
-        for config in uav_configs:
+        # 只建立 MQTT 连接，不请求控制权和 DRC 模式（并行等待各自的 CONNACK）
+        # 不启动心跳（因为没有进入 DRC 模式），用 MockHeartbeatThread 占位
+        def connect_only(config):
             sn = config["sn"]
             console.print(f"[cyan]连接 {sn}...[/cyan]")
 
@@ -531,14 +562,10 @@ def setup_multiple_drc_connections(
             mqtt.connect()
             caller = ServiceCaller(mqtt)
 
-            # 不启动心跳（因为没有进入 DRC 模式）
-            # 创建一个空的 MockHeartbeatThread 占位
-            from ..mock.mock_drone import MockHeartbeatThread
-
-            heartbeat = MockHeartbeatThread()
-
-            connections.append((mqtt, caller, heartbeat))
             console.print(f"[green]✓ {sn} MQTT 已连接[/green]")
+            return (mqtt, caller, MockHeartbeatThread())
+
+        connections = list(_SETUP_POOL.map(connect_only, uav_configs))
 
         console.print(
             f"\n[bold green]✓ 所有 MQTT 连接已建立 ({len(connections)} 架)[/bold green]\n"
@@ -564,18 +591,8 @@ def setup_multiple_drc_connections(
 
         return (sn, mqtt, caller)
 
-    with ThreadPoolExecutor() as executor:
-        phase1_results = list(executor.map(phase1_connect_and_auth, uav_configs))
-
-    console.print(f"\n[green]✓ 已请求 {len(phase1_results)} 架无人机的控制权[/green]")
-
-    # Phase 2: Wait for user (single input for all)
-    input("\n🔔 请在 DJI Pilot APP 上允许所有无人机的控制权，然后按 Enter 继续...\n")
-
     # Phase 3: Parallel enter DRC + start heartbeat
     def phase3_enter_drc_and_heartbeat(result):
-        import uuid
-
         sn, mqtt, caller = result
 
         console.print(f"[dim]设置 {sn} DRC 模式...[/dim]")
@@ -599,8 +616,20 @@ def setup_multiple_drc_connections(
 
         return (mqtt, caller, heartbeat)
 
-    with ThreadPoolExecutor() as executor:
-        connections = list(executor.map(phase3_enter_drc_and_heartbeat, phase1_results))
+    # 阶段 1 与阶段 3 共用模块级线程池（阶段 3 复用阶段 1 的线程）
+    phase1_results = list(_SETUP_POOL.map(phase1_connect_and_auth, uav_configs))
+
+    console.print(
+        f"\n[green]✓ 已请求 {len(phase1_results)} 架无人机的控制权[/green]"
+    )
+
+    # Phase 2: Wait for user (single input for all)
+    input(
+        "\n🔔 请在 DJI Pilot APP 上允许所有无人机的控制权，然后按 Enter 继续...\n"
+    )
+
+    # Phase 3: Parallel enter DRC + start heartbeat
+    connections = list(_SETUP_POOL.map(phase3_enter_drc_and_heartbeat, phase1_results))
 
     console.print(
         f"\n[bold green]✓ 所有无人机 DRC 连接设置完成 ({len(connections)} 架)[/bold green]\n"
@@ -630,22 +659,16 @@ def reset_gimbal(mqtt_client: MQTTClient, payload_index: str, reset_mode: int) -
     Example:
         >>> # 云台回中
         >>> reset_gimbal(mqtt, payload_index="89-0-0", reset_mode=0)
-        [bright_green]✓ 云台回中[/bright_green]
 
         >>> # 云台向下
         >>> reset_gimbal(mqtt, payload_index="89-0-0", reset_mode=1)
-        [bright_yellow]✓ 云台向下[/bright_yellow]
     """
-    reset_mode_names = {0: "回中", 1: "向下", 2: "偏航回中", 3: "俯仰向下"}
-    mode_name = reset_mode_names.get(reset_mode, f"未知模式({reset_mode})")
-
     # 参数验证
-    if reset_mode not in reset_mode_names:
+    if reset_mode not in _RESET_MODE_NAMES:
         raise ValueError(f"reset_mode 必须在 [0, 3] 范围内，当前值: {reset_mode}")
 
     # 构建消息（使用 seq，不是 tid）
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
-    seq = int(time.time() * 1000)
+    seq = next_seq()
 
     payload = {
         "seq": seq,
@@ -654,7 +677,5 @@ def reset_gimbal(mqtt_client: MQTTClient, payload_index: str, reset_mode: int) -
     }
 
     # 发送指令（QoS 0，无回包机制）
-    mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
-
-    # 发送成功反馈
-    console.print(f"[bright_green]✓ 云台{mode_name}指令已发送[/bright_green]")
+    # 高频调用（5-10Hz），不打印成功提示
+    mqtt_client.publish_drc(codec.dumps(payload))
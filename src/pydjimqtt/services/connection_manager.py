@@ -3,26 +3,64 @@ DRC 连接管理器 - 自动重连机制
 
 功能：
 1. 监控 DRC 连接健康状态
-2. 检测到离线时自动重连（重试10次，每次等待1秒）
+2. 检测到离线时自动重连（重试10次，间隔指数退避，上限8秒）
 3. 提供连接状态查询接口（供 UI 显示）
 
 设计原则：
 - 简单直接，不使用复杂设计模式
-- 使用后台线程监控连接状态
+- 使用后台线程监控连接状态（OSD 回调刷新时间戳，线程只在离线截止时刻醒来）
 - 状态机模型：online → reconnecting → online/offline
 """
 
+import os
+import random
 import time
 import threading
 from typing import Dict, Any, Optional, Callable
 from rich.console import Console
 
-from ..core import MQTTClient, ServiceCaller
-from .commands import enter_drc_mode, request_control_auth
-from .heartbeat import start_heartbeat, stop_heartbeat
+from ..core import MQTTClient, ServiceCaller, codec
+from .commands import call_service_raw, request_control_auth
+from .heartbeat import Heartbeat, start_heartbeat, stop_heartbeat
 
 console = Console()
 
+# 重连退避间隔上限（秒）
+_RECONNECT_BACKOFF_MAX = 8.0
+
+
+def _build_enter_drc_template(
+    mqtt_config: Dict[str, Any], osd_frequency: int, hsi_frequency: int
+) -> bytes:
+    """
+    生成 drc_mode_enter 的 data 模板（bytes %-格式，占位 client_id 和 expire_time）
+
+    Returns:
+        模板，使用方式: tpl % (client_id_bytes, expire_time)
+    """
+    data = {
+        "mqtt_broker": {
+            "address": f"{mqtt_config['host']}:{mqtt_config['port']}",
+            "client_id": "\x00CLIENT_ID\x00",
+            "username": mqtt_config["username"],
+            "password": mqtt_config["password"],
+            "expire_time": "\x00EXPIRE\x00",
+            "enable_tls": mqtt_config.get("enable_tls", False),
+        },
+        "osd_frequency": osd_frequency,
+        "hsi_frequency": hsi_frequency,
+    }
+    # 与其他预编码载荷一致经 codec 编码；先转义配置中的 %，再把占位字符串替换为格式符
+    encoded = codec.dumps(data)
+    if isinstance(encoded, bytes):
+        encoded = encoded.decode()
+    tpl = (
+        encoded.replace("%", "%%")
+        .replace('"\\u0000CLIENT_ID\\u0000"', '"%s"')
+        .replace('"\\u0000EXPIRE\\u0000"', "%d")
+    )
+    return tpl.encode()
+
 
 class ConnectionState:
     """连接状态枚举"""
@@ -54,7 +92,7 @@ class DRCConnectionManager:
         hsi_frequency: int = 10,
         offline_timeout: float = 2.0,
         reconnect_attempts: int = 10,
-        reconnect_interval: float = 1.0,
+        reconnect_interval: float = 0.25,
     ):
         """
         初始化连接管理器
@@ -68,7 +106,7 @@ class DRCConnectionManager:
             hsi_frequency: HSI 数据频率（Hz）
             offline_timeout: 离线检测超时时间（秒）
             reconnect_attempts: 最大重连次数
-            reconnect_interval: 重连间隔（秒）
+            reconnect_interval: 首次重连间隔（秒），之后每次翻倍，上限 8 秒
         """
         self.mqtt = mqtt_client
         self.caller = service_caller
@@ -80,16 +118,23 @@ class DRCConnectionManager:
         self.reconnect_attempts = reconnect_attempts
         self.reconnect_interval = reconnect_interval
 
+        # drc_mode_enter 的 data 编码模板：结构在重连间不变，重连时只填 client_id 和 expire_time
+        self._enter_drc_tpl = _build_enter_drc_template(
+            mqtt_config, osd_frequency, hsi_frequency
+        )
+        self._client_id_prefix = f"drc-{uav_config['sn']}-"
+
         # 连接状态
         self.state = ConnectionState.ONLINE
         self.state_lock = threading.Lock()
 
-        # 心跳线程
-        self.heartbeat_thread = None
+        # 心跳句柄（HeartbeatHandle）
+        self.heartbeat_thread: Optional[Heartbeat] = None
 
         # 监控线程
         self.monitor_thread = None
         self.stop_flag = threading.Event()
+        self._last_osd_monotonic = 0.0
 
         # 回调函数（供 UI 订阅状态变化）
         self.on_state_change: Optional[Callable[[str], None]] = None
@@ -112,12 +157,12 @@ class DRCConnectionManager:
         """判断是否正在重连"""
         return self.get_state() == ConnectionState.RECONNECTING
 
-    def get_heartbeat_thread(self):
+    def get_heartbeat_thread(self) -> Optional[Heartbeat]:
         """
-        获取当前心跳线程引用（线程安全）
+        获取当前心跳句柄引用（线程安全）
 
         Returns:
-            当前心跳线程对象，如果没有则返回 None
+            当前心跳句柄，如果没有则返回 None
         """
         return self.heartbeat_thread
 
@@ -164,22 +209,13 @@ class DRCConnectionManager:
 
             # 2. 进入 DRC 模式
             console.print(f"[bright_cyan][{callsign}] 进入 DRC 模式...[/bright_cyan]")
-            import uuid
-
-            random_suffix = str(uuid.uuid4())[:3]
-            mqtt_broker_config = {
-                "address": f"{self.mqtt_config['host']}:{self.mqtt_config['port']}",
-                "client_id": f"drc-{self.uav_config['sn']}-{random_suffix}",
-                "username": self.mqtt_config["username"],
-                "password": self.mqtt_config["password"],
-                "expire_time": int(time.time()) + 3600,
-                "enable_tls": self.mqtt_config.get("enable_tls", False),
-            }
-            enter_drc_mode(
+            # 3位随机后缀，避免多实例冲突
+            client_id = self._client_id_prefix + os.urandom(2).hex()[:3]
+            call_service_raw(
                 self.caller,
-                mqtt_broker=mqtt_broker_config,
-                osd_frequency=self.osd_frequency,
-                hsi_frequency=self.hsi_frequency,
+                "drc_mode_enter",
+                self._enter_drc_tpl % (client_id.encode(), int(time.time()) + 3600),
+                f"已进入 DRC 模式 (OSD: {self.osd_frequency}Hz, HSI: {self.hsi_frequency}Hz)",
             )
 
             # 3. 重启心跳
@@ -195,73 +231,89 @@ class DRCConnectionManager:
             console.print(f"[bright_red]✗ [{callsign}] DRC 重连失败: {e}[/bright_red]")
             return False
 
+    def _on_osd(self) -> None:
+        """OSD 回调：只记录收到消息的时间，热路径上不做其他工作"""
+        self._last_osd_monotonic = time.monotonic()
+
     def _monitor_loop(self):
         """
         监控循环（在后台线程中运行）
 
         策略：
-        1. 每 0.5 秒检查一次 OSD 消息时间戳
-        2. 如果超过 offline_timeout 秒未收到消息，触发重连
+        1. 按最后一次 OSD 时间计算离线截止时刻，休眠到截止时刻再检查（不做周期轮询）
+        2. 截止时刻到达仍无新消息，且客户端也判定离线，触发重连
         3. 重连最多尝试 reconnect_attempts 次
-        4. 重连成功后恢复 online 状态
+        4. 重连成功后恢复 online 状态，并重新计时
         """
         callsign = self.uav_config.get("callsign", "UAV")
 
         while not self.stop_flag.is_set():
-            time.sleep(0.5)  # 每 0.5 秒检查一次
+            remaining = self._last_osd_monotonic + self.offline_timeout - time.monotonic()
+            if remaining > 0:
+                # 在线时每个 offline_timeout 周期最多醒来一次；stop() 可立即唤醒
+                self.stop_flag.wait(remaining)
+                continue
+
+            if self.mqtt.is_online(timeout=self.offline_timeout):
+                # 回调被节流或客户端不推送回调（如模拟器）时，以客户端判断为准
+                self._last_osd_monotonic = time.monotonic()
+                if self.get_state() == ConnectionState.RECONNECTING:
+                    self._set_state(ConnectionState.ONLINE)
+                continue
+
+            # 检测到离线
+            if self.get_state() == ConnectionState.ONLINE:
+                # 第一次检测到离线，开始重连
+                console.print(
+                    f"[bright_yellow]⚠ [{callsign}] 检测到离线（{self.offline_timeout}秒无数据）[/bright_yellow]"
+                )
+                self._set_state(ConnectionState.RECONNECTING)
 
-            # 检查是否在线
-            if not self.mqtt.is_online(timeout=self.offline_timeout):
-                # 检测到离线
-                current_state = self.get_state()
+                # 尝试重连
+                for attempt in range(1, self.reconnect_attempts + 1):
+                    if self.stop_flag.is_set():
+                        break
 
-                if current_state == ConnectionState.ONLINE:
-                    # 第一次检测到离线，开始重连
                     console.print(
-                        f"[bright_yellow]⚠ [{callsign}] 检测到离线（{self.offline_timeout}秒无数据）[/bright_yellow]"
+                        f"[bright_cyan][{callsign}] 重连尝试 {attempt}/{self.reconnect_attempts}...[/bright_cyan]"
                     )
-                    self._set_state(ConnectionState.RECONNECTING)
 
-                    # 尝试重连
-                    for attempt in range(1, self.reconnect_attempts + 1):
-                        if self.stop_flag.is_set():
-                            break
+                    if self._reconnect_drc():
+                        # 重连成功
+                        self._set_state(ConnectionState.ONLINE)
+                        break
 
-                        console.print(
-                            f"[bright_cyan][{callsign}] 重连尝试 {attempt}/{self.reconnect_attempts}...[/bright_cyan]"
+                    # 指数退避 + 随机抖动后重试；stop() 可立即打断等待
+                    if attempt < self.reconnect_attempts:
+                        backoff = min(
+                            self.reconnect_interval * 2 ** (attempt - 1),
+                            _RECONNECT_BACKOFF_MAX,
                         )
-
-                        if self._reconnect_drc():
-                            # 重连成功
-                            self._set_state(ConnectionState.ONLINE)
+                        if self.stop_flag.wait(backoff + random.uniform(0, 0.2)):
                             break
+                else:
+                    # 所有重连尝试均失败
+                    console.print(
+                        f"[bright_red]✗ [{callsign}] 重连失败（{self.reconnect_attempts}次尝试）[/bright_red]"
+                    )
+                    self._set_state(ConnectionState.OFFLINE)
 
-                        # 等待后重试
-                        if attempt < self.reconnect_attempts:
-                            time.sleep(self.reconnect_interval)
-                    else:
-                        # 所有重连尝试均失败
-                        console.print(
-                            f"[bright_red]✗ [{callsign}] 重连失败（{self.reconnect_attempts}次尝试）[/bright_red]"
-                        )
-                        self._set_state(ConnectionState.OFFLINE)
-
-            else:
-                # 在线状态
-                current_state = self.get_state()
-                if current_state == ConnectionState.RECONNECTING:
-                    # 从重连状态恢复到在线
-                    self._set_state(ConnectionState.ONLINE)
+            # 重新计时，给恢复后的 OSD 推送一个完整的超时窗口
+            self._last_osd_monotonic = time.monotonic()
 
-    def start(self, heartbeat_thread: Optional[threading.Thread] = None):
+    def start(self, heartbeat_thread: Optional[Heartbeat] = None):
         """
         启动连接管理器
 
         Args:
-            heartbeat_thread: 外部传入的心跳线程（如果已启动）
+            heartbeat_thread: 外部传入的心跳句柄（如果已启动）
         """
         self.heartbeat_thread = heartbeat_thread
 
+        # 由 OSD 回调刷新最后消息时间，监控线程据此计算离线截止时刻
+        self._last_osd_monotonic = time.monotonic()
+        self.mqtt.register_osd_callback(self._on_osd)
+
         # 启动监控线程
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
@@ -272,6 +324,8 @@ class DRCConnectionManager:
     def stop(self):
         """停止连接管理器"""
         self.stop_flag.set()
+        # 注销 OSD 回调：客户端不再持有已停止的管理器，也不再每条 OSD 调用它
+        self.mqtt.unregister_osd_callback(self._on_osd)
 
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2)
@@ -0,0 +1,132 @@
+"""
+DRC 下行调度器 - 单线程驱动多个周期发送任务
+
+心跳、杆量合并发送等周期任务注册到同一个调度器，由一个线程按截止时间依次执行：
+- 最小堆按下一次截止时间排序，线程只在最早的截止时刻醒来
+- 所有任务在同一线程上调用 publish，任务之间没有线程切换和锁竞争
+- 没有任务时线程自动退出，下次注册时再启动
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Optional
+from ..core.async_console import console  # 调度线程不直接做终端 I/O
+
+
+class DRCDownlinkScheduler:
+    """
+    DRC 下行调度器
+
+    示例:
+        >>> scheduler = DRCDownlinkScheduler()
+        >>> job = scheduler.schedule_periodic(0.2, lambda: print("tick"))
+        >>> scheduler.cancel(job)
+    """
+
+    def __init__(self):
+        # (截止时间, 任务 ID, 周期, 回调)；任务 ID 递增，截止时间相同时按注册顺序执行
+        self._heap: list[tuple[float, int, float, Callable[[], None]]] = []
+        self._active: set[int] = set()
+        self._ids = itertools.count()
+        self._cv = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running_job: Optional[int] = None
+
+    def schedule_periodic(
+        self, interval: float, fn: Callable[[], None], first_delay: float = 0.0
+    ) -> int:
+        """
+        注册周期任务
+
+        Args:
+            interval: 执行周期（秒）
+            fn: 任务回调（在调度线程上执行，应快速返回）
+            first_delay: 首次执行延迟（秒），默认立即执行
+
+        Returns:
+            任务 ID（用于 cancel）
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be > 0, got {interval}")
+        with self._cv:
+            job_id = next(self._ids)
+            self._active.add(job_id)
+            heapq.heappush(
+                self._heap, (time.monotonic() + first_delay, job_id, interval, fn)
+            )
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="drc-downlink", daemon=True
+                )
+                self._thread.start()
+            self._cv.notify()
+        return job_id
+
+    def cancel(self, job_id: int, timeout: float = 1.0) -> None:
+        """
+        取消任务（若任务正在执行，等待本次执行结束，最多 timeout 秒）
+
+        返回后该任务不会再被调用（在任务回调内取消自身时不等待）。
+        """
+        with self._cv:
+            self._active.discard(job_id)
+            self._cv.notify()
+            if threading.current_thread() is self._thread:
+                return
+            self._cv.wait_for(lambda: self._running_job != job_id, timeout)
+
+    def is_scheduled(self, job_id: int) -> bool:
+        """任务是否仍在调度中"""
+        return job_id in self._active
+
+    def _run(self) -> None:
+        cv = self._cv
+        heap = self._heap
+        while True:
+            with cv:
+                while True:
+                    # 丢弃已取消的任务
+                    while heap and heap[0][1] not in self._active:
+                        heapq.heappop(heap)
+                    if not heap:
+                        # 没有任务：线程退出，下次注册时重新启动
+                        self._thread = None
+                        return
+                    delay = heap[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    cv.wait(delay)
+
+                deadline, job_id, interval, fn = heapq.heappop(heap)
+                # 按截止时间累加（不漂移）；落后超过一个周期时从当前时刻重新计时
+                next_deadline = deadline + interval
+                now = time.monotonic()
+                if next_deadline <= now:
+                    next_deadline = now + interval
+                heapq.heappush(heap, (next_deadline, job_id, interval, fn))
+                self._running_job = job_id
+
+            try:
+                fn()
+            except Exception as e:
+                console.print(f"[yellow]下行任务执行失败: {e}[/yellow]")
+            finally:
+                with cv:
+                    self._running_job = None
+                    cv.notify_all()
+
+
+_shared_scheduler: Optional[DRCDownlinkScheduler] = None
+_shared_lock = threading.Lock()
+
+
+def get_downlink_scheduler() -> DRCDownlinkScheduler:
+    """获取进程内共享的下行调度器（所有无人机的周期下行任务共用一个线程）"""
+    global _shared_scheduler
+    if _shared_scheduler is None:
+        with _shared_lock:
+            if _shared_scheduler is None:
+                _shared_scheduler = DRCDownlinkScheduler()
+    return _shared_scheduler
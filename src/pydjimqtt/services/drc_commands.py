@@ -8,32 +8,68 @@ DRC 无回包指令（Fire-and-forget 模式）
 - 调用方负责控制发送频率
 """
 
-import json
+import itertools
+import sys
 import time
 import threading
-from ..core import MQTTClient
+from functools import lru_cache
+from ..core import MQTTClient, codec
+from ..core import async_console
+from ..core.async_console import console as _async_console
+from ..utils import print_json_message
+from .downlink import DRCDownlinkScheduler, get_downlink_scheduler
 from rich.console import Console
 
 console = Console()
 
-_SEQ_LOCK = threading.Lock()
-_SEQ_COUNTER = int(time.time() * 1000)
 
+def _log_sent(msg: str) -> None:
+    """DRC 下行指令的发送提示：纯文本直写 stdout，不经过 rich 的 markup 解析（受 VERBOSE 开关控制）"""
+    if async_console.VERBOSE:
+        sys.stdout.write(f"→ {msg}\n")
 
-def _next_seq() -> int:
+
+# 以导入时的毫秒时间戳为起点逐条递增：跨进程重启仍大于上次会话的 seq（发送速率远低于 1000 条/秒），
+# 运行中不再读时钟，NTP 回拨也不会让 seq 倒退
+_SEQ_COUNTER = itertools.count(time.time_ns() // 1_000_000)
+
+
+def next_seq() -> int:
     """
     生成递增 seq，保证指令顺序性。
 
-    使用毫秒时间戳作为起点，确保全局单调递增。
+    itertools.count 的 next() 在 GIL 下是原子的，无需加锁。
     """
-    global _SEQ_COUNTER
-    now = int(time.time() * 1000)
-    with _SEQ_LOCK:
-        if now <= _SEQ_COUNTER:
-            _SEQ_COUNTER += 1
-        else:
-            _SEQ_COUNTER = now
-        return _SEQ_COUNTER
+    return next(_SEQ_COUNTER)
+
+
+# 杆量消息模板：字段固定、取值为有界整数，直接 % 格式化为 bytes，省去 dict 构建和 JSON 编码
+STICK_TPL = (
+    b'{"seq":%d,"method":"stick_control",'
+    b'"data":{"roll":%d,"pitch":%d,"throttle":%d,"yaw":%d}}'
+)
+
+
+# 相机指令模板：字符串字段经 _json_str 转义，浮点数取 float.__repr__（与 JSON 编码结果一致）
+_ZOOM_TPL = (
+    b'{"seq":%d,"method":"drc_camera_focal_length_set",'
+    b'"data":{"payload_index":%b,"camera_type":%b,"zoom_factor":%r}}'
+)
+_LOOK_AT_TPL = (
+    b'{"seq":%d,"method":"drc_camera_look_at",'
+    b'"data":{"payload_index":%b,"locked":%b,"latitude":%r,"longitude":%r,"height":%r}}'
+)
+_AIM_TPL = (
+    b'{"seq":%d,"method":"drc_camera_aim",'
+    b'"data":{"payload_index":%b,"camera_type":%b,"locked":%b,"x":%r,"y":%r}}'
+)
+
+
+@lru_cache(maxsize=64)
+def _json_str(value: str) -> bytes:
+    """字符串编码为 JSON 字符串字面量（payload_index 等取值有限，按值缓存）"""
+    data = codec.dumps(value)
+    return data if isinstance(data, bytes) else data.encode()
 
 
 def _wait_for_drc_reply(
@@ -44,43 +80,59 @@ def _wait_for_drc_reply(
     timeout: float,
     send_fn,
 ) -> dict:
+    """登记 (method, seq) 回包等待后发送指令，阻塞到回包到达"""
     if not mqtt_client.client:
         raise RuntimeError("MQTT client is not connected")
 
-    result_box: dict = {"result": None, "raw": None}
-    done = threading.Event()
-    original_on_message = mqtt_client.client.on_message
-
-    def on_message(client, userdata, msg):
-        try:
-            payload = json.loads(msg.payload.decode())
-        except Exception:
-            payload = {}
-        if payload.get("method") == method and payload.get("seq") == seq:
-            data = payload.get("data", {})
-            result_box["result"] = data.get("result")
-            result_box["raw"] = payload
-            done.set()
-        if original_on_message:
-            original_on_message(client, userdata, msg)
-
-    mqtt_client.client.on_message = on_message
+    # 先登记再发送，回包由 MQTTClient._on_message 查表直接唤醒，不再替换 on_message
+    future = mqtt_client.expect_drc_reply(method, seq)
     try:
         send_fn()
-        if not done.wait(timeout):
-            raise TimeoutError(f"{method} timeout")
+        payload = future.result(timeout)
+    except TimeoutError:
+        raise TimeoutError(f"{method} timeout") from None
     finally:
-        mqtt_client.client.on_message = original_on_message
+        mqtt_client.cancel_drc_reply(method, seq)
 
-    result = result_box.get("result")
+    result = payload.get("data", {}).get("result")
     return {
         "ok": result in (0, None),
         "result": result,
         "seq": seq,
-        "raw": result_box.get("raw"),
+        "raw": payload,
     }
 
 
+_STICK_RANGE_ERROR = "{name} must be in range [364, 1684], got {value}"
+
+
+def check_stick(
+    roll, pitch, throttle, yaw, error_fmt: str = _STICK_RANGE_ERROR
+) -> tuple[int, int, int, int]:
+    """
+    校验四个杆量通道并返回整数帧 (roll, pitch, throttle, yaw)
+
+    正常路径一条链式比较；越界时逐通道定位，打印并抛出 ValueError（error_fmt 含 {name}/{value}）。
+    """
+    if not (
+        364 <= roll <= 1684
+        and 364 <= pitch <= 1684
+        and 364 <= throttle <= 1684
+        and 364 <= yaw <= 1684
+    ):
+        for name, value in (
+            ("roll", roll),
+            ("pitch", pitch),
+            ("throttle", throttle),
+            ("yaw", yaw),
+        ):
+            if not 364 <= value <= 1684:
+                console.print(f"[red]✗ {name} 超出范围: {value} (应在 364-1684)[/red]")
+                raise ValueError(error_fmt.format(name=name, value=value))
+    # 协议字段为整数，模板按 %d 编码：浮点输入在此显式截断取整（已在范围内）
+    return int(roll), int(pitch), int(throttle), int(yaw)
+
+
 def send_stick_control(
     mqtt_client: MQTTClient,
     roll: int = 1024,
@@ -114,37 +166,153 @@ def send_stick_control(
         ...     send_stick_control(mqtt, roll=1200, pitch=1024, yaw=1024, throttle=1024)
         ...     time.sleep(0.1)  # 10Hz
     """
-    # 参数校验
-    for name, value in [
-        ("roll", roll),
-        ("pitch", pitch),
-        ("throttle", throttle),
-        ("yaw", yaw),
-    ]:
-        if not 364 <= value <= 1684:
-            console.print(f"[red]✗ {name} 超出范围: {value} (应在 364-1684)[/red]")
-            raise ValueError(f"{name} must be in range [364, 1684], got {value}")
+    frame = check_stick(roll, pitch, throttle, yaw)
 
     # 生成 seq
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
 
     # 构建消息
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
-    payload = {
-        "seq": seq,
-        "method": "stick_control",
-        "data": {"roll": roll, "pitch": pitch, "throttle": throttle, "yaw": yaw},
-    }
+    topic = mqtt_client.drc_down_topic
+    payload = STICK_TPL % (seq, *frame)
 
     # 发送（QoS 0，无响应）
     try:
-        mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
+        mqtt_client.client.publish(topic, payload, qos=0)
     except Exception as e:
         console.print(f"[red]✗ 杆量控制发送失败: {e}[/red]")
         raise
 
 
+def send_stick_control_batch(
+    mqtt_client: MQTTClient,
+    frames: list[tuple[int, int, int, int]],
+) -> list[int]:
+    """
+    连续发送多帧杆量控制指令（一次校验，背靠背写出）
+
+    适合调用方已经算好一段杆量序列、需要一次性下发的场景；
+    每帧仍是独立的 DRC 消息并分配独立 seq（协议要求 seq 递增）。
+
+    Args:
+        mqtt_client: MQTT 客户端
+        frames: 杆量帧列表，每帧为 (roll, pitch, throttle, yaw)；
+                按通道分列的数据可传 list(zip(rolls, pitches, throttles, yaws))
+
+    Returns:
+        每帧实际使用的 seq 列表
+
+    注意:
+        - 帧之间不插入间隔，按频率发送请使用 primitives.send_stick_repeatedly
+        - 任一帧越界时整批不发送
+
+    示例:
+        >>> send_stick_control_batch(mqtt, [(1024, 1200, 1024, 1024)] * 3)
+    """
+    frames = [check_stick(*frame) for frame in frames]
+
+    # 整批一次取 seq、一次编码，发送循环里只剩 publish
+    seqs = list(itertools.islice(_SEQ_COUNTER, len(frames)))
+    payloads = [STICK_TPL % (seq, *frame) for seq, frame in zip(seqs, frames)]
+
+    topic = mqtt_client.drc_down_topic
+    publish = mqtt_client.client.publish
+    try:
+        for payload in payloads:
+            publish(topic, payload, qos=0)
+    except Exception as e:
+        console.print(f"[red]✗ 杆量控制批量发送失败: {e}[/red]")
+        raise
+    return seqs
+
+
+class StickBatcher:
+    """
+    杆量合并发送器（多机 DRC 可选）
+
+    调用方随时 set() 各机最新杆量（只做赋值，不阻塞），
+    下行调度器每个 tick 取出并发送每架机最新的一帧；tick 内被覆盖的旧帧直接丢弃。
+    每帧只发送一次，不会在 set() 停止后重复发送旧杆量。
+
+    示例:
+        >>> batcher = StickBatcher(tick=0.1)
+        >>> batcher.start()
+        >>> batcher.set(mqtt, roll=1200)
+        >>> batcher.set(mqtt, flush_immediately=True)  # 回中立即发出
+        >>> batcher.stop()
+    """
+
+    def __init__(self, tick: float = 0.1, scheduler: DRCDownlinkScheduler | None = None):
+        """
+        Args:
+            tick: 发送周期（秒）
+            scheduler: 下行调度器（默认使用进程内共享调度器，与心跳共用一个线程）
+        """
+        self.tick = tick
+        self._scheduler = scheduler
+        self._pending: dict[str, tuple[MQTTClient, tuple[int, int, int, int]]] = {}
+        self._lock = threading.Lock()
+        self._job: int | None = None
+
+    def set(
+        self,
+        mqtt_client: MQTTClient,
+        roll: int = 1024,
+        pitch: int = 1024,
+        throttle: int = 1024,
+        yaw: int = 1024,
+        flush_immediately: bool = False,
+    ) -> None:
+        """
+        更新某架机的最新杆量
+
+        Args:
+            mqtt_client: MQTT 客户端
+            roll/pitch/throttle/yaw: 通道值 (364-1684, 中值1024)
+            flush_immediately: 立即发送（用于首帧/回中等不能等待 tick 的指令）
+        """
+        if flush_immediately:
+            with self._lock:
+                self._pending.pop(mqtt_client.gateway_sn, None)
+            send_stick_control(mqtt_client, roll=roll, pitch=pitch, throttle=throttle, yaw=yaw)
+            return
+
+        frame = check_stick(roll, pitch, throttle, yaw)
+        with self._lock:
+            self._pending[mqtt_client.gateway_sn] = (mqtt_client, frame)
+
+    def start(self) -> None:
+        """开始周期发送（注册到下行调度器）"""
+        if self._job is not None:
+            return
+        if self._scheduler is None:
+            self._scheduler = get_downlink_scheduler()
+        self._job = self._scheduler.schedule_periodic(self.tick, self.flush)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """停止周期发送（停止前发出尚未发送的最新帧）"""
+        if self._job is not None:
+            self._scheduler.cancel(self._job, timeout)
+            self._job = None
+        self.flush()
+
+    def flush(self) -> None:
+        """发送当前所有待发帧"""
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, {}
+        for sn, (mqtt_client, frame) in pending.items():
+            try:
+                mqtt_client.client.publish(
+                    mqtt_client.drc_down_topic,
+                    STICK_TPL % (next_seq(), *frame),
+                    qos=0,
+                )
+            except Exception as e:
+                _async_console.print(f"[red]✗ 杆量控制发送失败 ({sn}): {e}[/red]")
+
+
 def drone_emergency_stop(mqtt_client: MQTTClient, seq: int | None = None) -> int:
     """
     DRC 飞行器急停（停止水平运动，Fire-and-forget）
@@ -161,13 +329,12 @@ def drone_emergency_stop(mqtt_client: MQTTClient, seq: int | None = None) -> int
         - 该指令用于运动过程中停止水平运动
     """
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
 
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
     payload = {"seq": seq, "method": "drone_emergency_stop", "data": {}}
 
     try:
-        mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
+        mqtt_client.publish_drc(codec.dumps(payload))
         console.print(f"[bright_yellow]⚠ 急停指令已发送 (seq: {seq})[/bright_yellow]")
     except Exception as e:
         console.print(f"[red]✗ 急停指令发送失败: {e}[/red]")
@@ -189,36 +356,16 @@ def drone_emergency_stop_wait(
         raise RuntimeError("MQTT client is not connected")
 
     if seq is None:
-        seq = _next_seq()
-
-    result_box: dict = {"result": None}
-    done = threading.Event()
-    original_on_message = mqtt_client.client.on_message
-
-    def on_message(client, userdata, msg):
-        try:
-            payload = json.loads(msg.payload.decode())
-        except Exception:
-            payload = {}
-        if (
-            payload.get("method") == "drone_emergency_stop"
-            and payload.get("seq") == seq
-        ):
-            data = payload.get("data", {})
-            result_box["result"] = data.get("result")
-            done.set()
-        if original_on_message:
-            original_on_message(client, userdata, msg)
-
-    mqtt_client.client.on_message = on_message
-    try:
-        drone_emergency_stop(mqtt_client, seq=seq)
-        if not done.wait(timeout):
-            raise TimeoutError("drone_emergency_stop timeout")
-    finally:
-        mqtt_client.client.on_message = original_on_message
+        seq = next_seq()
 
-    result = result_box.get("result")
+    reply = _wait_for_drc_reply(
+        mqtt_client,
+        method="drone_emergency_stop",
+        seq=seq,
+        timeout=timeout,
+        send_fn=lambda: drone_emergency_stop(mqtt_client, seq=seq),
+    )
+    result = reply["result"]
     return {
         "ok": result == 0,
         "result": result,
@@ -274,37 +421,32 @@ def set_camera_zoom(
 
     # 生成 seq
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
 
     # 构建消息
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
-    payload = {
-        "seq": seq,
-        "method": "drc_camera_focal_length_set",
-        "data": {
-            "payload_index": payload_index,
-            "camera_type": camera_type,
-            "zoom_factor": zoom_factor,
-        },
-    }
+    topic = mqtt_client.drc_down_topic
+    payload = _ZOOM_TPL % (
+        seq,
+        _json_str(payload_index),
+        _json_str(camera_type),
+        float(zoom_factor),
+    )
 
     # 发送（QoS 0，无响应）
     try:
         if debug_full_request:
-            from ..utils import print_json_message
-
             print_json_message(
                 "📤 发送 MQTT 请求 (drc_camera_focal_length_set)",
                 {
                     "topic": topic,
                     "qos": 0,
-                    "payload": payload,
+                    "payload": codec.loads(payload),
                 },
                 "blue",
             )
-        mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
-        console.print(
-            f"[cyan]→[/cyan] 变焦指令已发送: {camera_type} zoom={zoom_factor}x (payload: {payload_index})"
+        mqtt_client.publish_drc(payload)
+        _log_sent(
+            f"变焦指令已发送: {camera_type} zoom={zoom_factor}x (payload: {payload_index})"
         )
     except Exception as e:
         console.print(f"[red]✗ 变焦控制发送失败: {e}[/red]")
@@ -331,9 +473,8 @@ def camera_screen_split(
         raise ValueError("payload_index must be a non-empty string")
 
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
 
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
     payload = {
         "seq": seq,
         "method": "drc_camera_screen_split",
@@ -344,11 +485,9 @@ def camera_screen_split(
     }
 
     try:
-        mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
+        mqtt_client.publish_drc(codec.dumps(payload))
         status = "开启" if enable else "关闭"
-        console.print(
-            f"[cyan]→[/cyan] 分屏指令已发送: {status} (payload: {payload_index})"
-        )
+        _log_sent(f"分屏指令已发送: {status} (payload: {payload_index})")
     except Exception as e:
         console.print(f"[red]✗ 分屏指令发送失败: {e}[/red]")
         raise
@@ -368,7 +507,7 @@ def camera_screen_split_wait(
         {'ok': bool, 'result': int | None, 'seq': int, 'raw': dict | None}
     """
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
     return _wait_for_drc_reply(
         mqtt_client,
         method="drc_camera_screen_split",
@@ -407,9 +546,9 @@ def drc_live_lens_change(
         )
 
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
 
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
+    topic = mqtt_client.drc_down_topic
     payload = {
         "seq": seq,
         "method": "drc_live_lens_change",
@@ -421,16 +560,14 @@ def drc_live_lens_change(
 
     try:
         if debug_full_request:
-            from ..utils import print_json_message
-
             print_json_message(
                 "📤 发送 MQTT 请求 (drc_live_lens_change)",
                 {"topic": topic, "qos": 0, "payload": payload},
                 "blue",
             )
-        mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
-        console.print(
-            f"[cyan]→[/cyan] 镜头切换指令已发送: {normalized_video_type} (payload: {payload_index})"
+        mqtt_client.publish_drc(codec.dumps(payload))
+        _log_sent(
+            f"镜头切换指令已发送: {normalized_video_type} (payload: {payload_index})"
         )
     except Exception as e:
         console.print(f"[red]✗ 镜头切换指令发送失败: {e}[/red]")
@@ -452,7 +589,7 @@ def drc_live_lens_change_wait(
         {'ok': bool, 'result': int | None, 'seq': int, 'raw': dict | None}
     """
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
     return _wait_for_drc_reply(
         mqtt_client,
         method="drc_live_lens_change",
@@ -491,9 +628,9 @@ def take_photo(
         raise ValueError("payload_index must be a non-empty string")
 
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
 
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
+    topic = mqtt_client.drc_down_topic
     payload = {
         "seq": seq,
         "method": "drc_camera_photo_take",
@@ -502,15 +639,13 @@ def take_photo(
 
     try:
         if debug_full_request:
-            from ..utils import print_json_message
-
             print_json_message(
                 "📤 发送 MQTT 请求 (drc_camera_photo_take)",
                 {"topic": topic, "qos": 0, "payload": payload},
                 "blue",
             )
-        mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
-        console.print(f"[cyan]→[/cyan] 拍照指令已发送 (payload: {payload_index})")
+        mqtt_client.publish_drc(codec.dumps(payload))
+        _log_sent(f"拍照指令已发送 (payload: {payload_index})")
     except Exception as e:
         console.print(f"[red]✗ 拍照指令发送失败: {e}[/red]")
         raise
@@ -534,58 +669,36 @@ def take_photo_wait(
         raise RuntimeError("MQTT client is not connected")
 
     if seq is None:
-        seq = _next_seq()
-
-    result_box: dict = {"result": None, "status": None, "raw": None}
-    done = threading.Event()
-    original_on_message = mqtt_client.client.on_message
-
-    def on_message(client, userdata, msg):
-        try:
-            payload = json.loads(msg.payload.decode())
-        except Exception:
-            payload = {}
-        if (
-            payload.get("method") == "drc_camera_photo_take"
-            and payload.get("seq") == seq
-        ):
-            data = payload.get("data", {})
-            result_box["result"] = data.get("result")
-            result_box["status"] = data.get("status")
-            result_box["raw"] = payload
-            if debug_full_response:
-                from ..utils import print_json_message
-
-                print_json_message(
-                    "📥 接收 MQTT 响应 (drc_camera_photo_take)",
-                    {"topic": msg.topic, "payload": payload},
-                    "green",
-                )
-            done.set()
-        if original_on_message:
-            original_on_message(client, userdata, msg)
+        seq = next_seq()
 
-    mqtt_client.client.on_message = on_message
-    try:
-        take_photo(
+    reply = _wait_for_drc_reply(
+        mqtt_client,
+        method="drc_camera_photo_take",
+        seq=seq,
+        timeout=timeout,
+        send_fn=lambda: take_photo(
             mqtt_client,
             payload_index=payload_index,
             seq=seq,
             debug_full_request=debug_full_request,
+        ),
+    )
+    raw = reply["raw"]
+    if debug_full_response:
+        print_json_message(
+            "📥 接收 MQTT 响应 (drc_camera_photo_take)",
+            {"topic": f"thing/product/{mqtt_client.gateway_sn}/drc/up", "payload": raw},
+            "green",
         )
-        if not done.wait(timeout):
-            raise TimeoutError("drc_camera_photo_take timeout")
-    finally:
-        mqtt_client.client.on_message = original_on_message
 
-    result = result_box.get("result")
+    result = reply["result"]
     return {
         "ok": result == 0,
         "result": result,
-        "status": result_box.get("status"),
+        "status": raw.get("data", {}).get("status"),
         "seq": seq,
         "payload_index": payload_index,
-        "raw": result_box.get("raw"),
+        "raw": raw,
     }
 
 
@@ -647,27 +760,23 @@ def camera_look_at(
 
     # 生成 seq
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
 
     # 构建消息
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
-    payload = {
-        "seq": seq,
-        "method": "drc_camera_look_at",
-        "data": {
-            "payload_index": payload_index,
-            "locked": locked,
-            "latitude": latitude,
-            "longitude": longitude,
-            "height": height,
-        },
-    }
+    payload = _LOOK_AT_TPL % (
+        seq,
+        _json_str(payload_index),
+        b"true" if locked else b"false",
+        float(latitude),
+        float(longitude),
+        float(height),
+    )
 
     # 发送（QoS 0，无响应）
     try:
-        mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
-        console.print(
-            f"[cyan]→[/cyan] Look At 指令已发送: "
+        mqtt_client.publish_drc(payload)
+        _log_sent(
+            f"Look At 指令已发送: "
             f"lat={latitude:.6f}, lon={longitude:.6f}, h={height:.1f}m "
             f"(locked={locked}, payload: {payload_index})"
         )
@@ -736,27 +845,23 @@ def camera_aim(
 
     # 生成 seq
     if seq is None:
-        seq = _next_seq()
+        seq = next_seq()
 
     # 构建消息
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
-    payload = {
-        "seq": seq,
-        "method": "drc_camera_aim",
-        "data": {
-            "payload_index": payload_index,
-            "camera_type": camera_type,
-            "locked": locked,
-            "x": x,
-            "y": y,
-        },
-    }
+    payload = _AIM_TPL % (
+        seq,
+        _json_str(payload_index),
+        _json_str(camera_type),
+        b"true" if locked else b"false",
+        float(x),
+        float(y),
+    )
 
     # 发送（QoS 0，无响应）
     try:
-        mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
-        console.print(
-            f"[cyan]→[/cyan] AIM 指令已发送: "
+        mqtt_client.publish_drc(payload)
+        _log_sent(
+            f"AIM 指令已发送: "
             f"x={x:.2f}, y={y:.2f}, camera={camera_type} "
             f"(locked={locked}, payload: {payload_index})"
         )
@@ -1,88 +1,124 @@
 """
 DRC 心跳维持服务
+
+所有无人机的心跳注册到共享的下行调度器（services/downlink.py），由一个线程统一发送；
+截止时间按 interval 对齐，相同间隔的心跳在同一时刻连续发出。
 """
 
 import time
-import json
 import threading
+from typing import Optional, Protocol
 from ..core import MQTTClient
+from ..core.async_console import console as _async_console
+from .downlink import DRCDownlinkScheduler, get_downlink_scheduler
+from .drc_commands import next_seq
 from rich.console import Console
 
 console = Console()
 
+_HEARTBEAT_TPL = b'{"seq":%d,"method":"heart_beat","data":{"timestamp":%d}}'
+
+
+class Heartbeat(Protocol):
+    """心跳句柄接口：HeartbeatHandle 与 MockHeartbeatThread 均满足（stop_heartbeat 只依赖这些成员）"""
+
+    stop_flag: threading.Event
+
+    def is_alive(self) -> bool: ...
+
+    def join(self, timeout: Optional[float] = None) -> None: ...
+
+
+class HeartbeatHandle:
+    """
+    心跳句柄（鸭子类型兼容 threading.Thread：is_alive/join + stop_flag）
+
+    心跳不再独占线程，句柄只对应调度器中的一个周期任务。
+    """
+
+    __slots__ = ("stop_flag", "_scheduler", "_job")
+
+    def __init__(self, scheduler: DRCDownlinkScheduler, job: int, stop_flag: threading.Event):
+        self.stop_flag = stop_flag
+        self._scheduler = scheduler
+        self._job = job
+
+    def is_alive(self) -> bool:
+        """心跳是否仍在发送"""
+        return self._scheduler.is_scheduled(self._job)
 
-def start_heartbeat(mqtt_client: MQTTClient, interval: float = 0.2) -> threading.Thread:
+    def join(self, timeout: Optional[float] = None) -> None:
+        """stop_flag 已设置时取消心跳任务（等待进行中的一次发送结束）"""
+        if self.stop_flag.is_set():
+            self._scheduler.cancel(self._job, 1.0 if timeout is None else timeout)
+
+
+def start_heartbeat(
+    mqtt_client: MQTTClient,
+    interval: float = 0.2,
+    scheduler: Optional[DRCDownlinkScheduler] = None,
+) -> HeartbeatHandle:
     """
-    启动 DRC 心跳后台线程
+    启动 DRC 心跳
 
     Args:
         mqtt_client: MQTT 客户端
         interval: 心跳间隔（秒）
+        scheduler: 下行调度器（默认使用进程内共享调度器）
 
     Returns:
-        心跳线程对象（调用者负责在程序退出时停止）
+        心跳句柄（调用者负责在程序退出时 stop_heartbeat）
 
     示例:
-        >>> thread = start_heartbeat(mqtt, interval=0.2)
+        >>> hb = start_heartbeat(mqtt, interval=0.2)
         >>> # ... 做你的事情 ...
-        >>> stop_heartbeat(thread)
+        >>> stop_heartbeat(hb)
     """
-    topic = f"thing/product/{mqtt_client.gateway_sn}/drc/down"
+    if scheduler is None:
+        scheduler = get_downlink_scheduler()
+    topic = mqtt_client.drc_down_topic
     stop_flag = threading.Event()
-
-    def heartbeat_loop():
-        """心跳循环 - 使用精确定时"""
-        next_tick = time.perf_counter()
-        seq = int(time.time() * 1000)
-
-        while not stop_flag.is_set():
-            now = time.perf_counter()
-            if now < next_tick:
-                time.sleep(min(interval, next_tick - now))
-                continue
-
-            # 构建心跳消息
-            seq += 1
-            payload = {
-                "seq": seq,
-                "method": "heart_beat",
-                "data": {"timestamp": int(time.time() * 1000)},
-            }
-
-            # 发送心跳（QoS 0，不等待响应）
-            try:
-                mqtt_client.client.publish(topic, json.dumps(payload), qos=0)
-            except Exception as e:
-                console.print(f"[yellow]心跳发送失败: {e}[/yellow]")
-
-            # 计算下一次发送时间
-            next_tick += interval
-            if next_tick < now:
-                next_tick = now + interval
-
-    # 创建并启动线程
-    thread = threading.Thread(target=heartbeat_loop, daemon=True)
-    thread.stop_flag = stop_flag  # 存储停止标志，供 stop_heartbeat 使用
-    thread.start()
+    job = None
+
+    def beat() -> None:
+        if stop_flag.is_set():
+            scheduler.cancel(job)
+            return
+        try:
+            # seq 与杆量等下行指令共用同一递增计数器，同一 topic 上严格递增
+            mqtt_client.client.publish(
+                topic,
+                _HEARTBEAT_TPL % (next_seq(), time.time_ns() // 1_000_000),
+                qos=0,
+            )
+        except Exception as e:
+            # 在调度线程上执行：告警入队由后台线程写出，断网时不拖慢其他无人机的心跳
+            _async_console.print(f"[yellow]心跳发送失败: {e}[/yellow]")
+
+    # 首个心跳立即发出，之后对齐到 interval 网格（多机心跳落在同一 tick）
+    beat()
+    job = scheduler.schedule_periodic(
+        interval, beat, first_delay=interval - time.monotonic() % interval
+    )
 
     console.print(
         f"[green]✓ 心跳已启动 (间隔: {interval}s, 频率: {1.0 / interval:.1f}Hz)[/green]"
     )
-    return thread
+    return HeartbeatHandle(scheduler, job, stop_flag)
 
 
-def stop_heartbeat(thread: threading.Thread):
+def stop_heartbeat(thread: Heartbeat):
     """
-    停止心跳线程
+    停止心跳
 
     Args:
-        thread: 由 start_heartbeat 返回的线程对象
+        thread: 心跳句柄（start_heartbeat 的返回值或 MockHeartbeatThread）
     """
     if hasattr(thread, "stop_flag"):
         thread.stop_flag.set()
         thread.join(timeout=5)
 
-        # 检查线程是否正常退出
+        # 检查心跳是否正常停止
         if thread.is_alive():
             console.print("[red]⚠ 心跳线程未能正常退出[/red]")
         else:
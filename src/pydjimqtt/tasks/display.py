@@ -7,6 +7,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List, TYPE_CHECKING
 from rich.table import Table
 
@@ -15,6 +16,33 @@ if TYPE_CHECKING:
     from .runner import MissionRunner
 
 
+# 状态文本取值有限，按文本缓存着色后的单元格：刷新时每行一次字典查找，不再逐次做子串扫描
+@lru_cache(maxsize=256)
+def _takeoff_status_cell(status: str) -> str:
+    if "完成" in status:
+        status_color = "bright_green"
+    elif "上升" in status:
+        status_color = "bright_yellow"
+    elif "错误" in status:
+        status_color = "bright_red"
+    else:
+        status_color = "bright_cyan"
+    return f"[{status_color}]{status}[/{status_color}]"
+
+
+@lru_cache(maxsize=256)
+def _trajectory_status_cell(task_status: str) -> str:
+    if "完成" in task_status:
+        status_color = "bright_green"
+    elif "飞行中" in task_status:
+        status_color = "bright_yellow"
+    elif "失败" in task_status or "错误" in task_status:
+        status_color = "bright_red"
+    else:
+        status_color = "bright_cyan"
+    return f"[{status_color}]{task_status}[/{status_color}]"
+
+
 def create_takeoff_table(runners: List[MissionRunner]) -> Table:
     """
     创建起飞状态监控表格
@@ -38,9 +66,9 @@ def create_takeoff_table(runners: List[MissionRunner]) -> Table:
         >>> from rich.console import Console
         >>>
         >>> console = Console()
-        >>> with Live(create_takeoff_table(runners), refresh_per_second=4, console=console) as live:
+        >>> with Live(create_takeoff_table(runners), auto_refresh=False, console=console) as live:
         >>>     while any(r.running for r in runners):
-        >>>         live.update(create_takeoff_table(runners))
+        >>>         live.update(create_takeoff_table(runners), refresh=True)
         >>>         time.sleep(0.25)
     """
     table = Table(
@@ -57,20 +85,10 @@ def create_takeoff_table(runners: List[MissionRunner]) -> Table:
         status = runner.status
         height = runner.data.get("height", 0.0) if runner.data else 0.0
 
-        # 状态颜色
-        if "完成" in status or "任务完成" in status:
-            status_color = "bright_green"
-        elif "上升" in status:
-            status_color = "bright_yellow"
-        elif "错误" in status:
-            status_color = "bright_red"
-        else:
-            status_color = "bright_cyan"
-
         table.add_row(
             callsign,
             sn,
-            f"[{status_color}]{status}[/{status_color}]",
+            _takeoff_status_cell(status),
             f"{height:.2f}m" if height is not None else "N/A",
         )
 
@@ -118,9 +136,9 @@ def create_trajectory_table(
         >>>     'Bravo': {'total_waypoints': 8}
         >>> }
         >>>
-        >>> with Live(create_trajectory_table(runners, mission_state), refresh_per_second=2, console=console) as live:
+        >>> with Live(create_trajectory_table(runners, mission_state), auto_refresh=False, console=console) as live:
         >>>     while not all_done:
-        >>>         live.update(create_trajectory_table(runners, mission_state))
+        >>>         live.update(create_trajectory_table(runners, mission_state), refresh=True)
         >>>         time.sleep(0.5)
     """
     table = Table(
@@ -142,16 +160,6 @@ def create_trajectory_table(
         remaining_time = runner.data.get("remaining_time")
         task_status = runner.data.get("task_status", "准备中")
 
-        # 状态颜色
-        if "完成" in task_status:
-            status_color = "bright_green"
-        elif "飞行中" in task_status:
-            status_color = "bright_yellow"
-        elif "失败" in task_status or "错误" in task_status:
-            status_color = "bright_red"
-        else:
-            status_color = "bright_cyan"
-
         # 航点进度
         if current_wp > 0 and total_wp > 0:
             wp_progress = f"{current_wp}/{total_wp}"
@@ -168,7 +176,7 @@ def create_trajectory_table(
 
         table.add_row(
             callsign,
-            f"[{status_color}]{task_status}[/{status_color}]",
+            _trajectory_status_cell(task_status),
             wp_progress,
             dist_str,
             time_str,
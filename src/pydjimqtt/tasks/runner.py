@@ -4,6 +4,7 @@
 
 import time
 import threading
+from functools import lru_cache
 from typing import Callable, Dict, Any, List, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
@@ -11,6 +12,7 @@ from rich.live import Live
 
 from ..core import MQTTClient, ServiceCaller
 from ..services import stop_heartbeat
+from ..services.heartbeat import Heartbeat
 from ..primitives import send_stick_repeatedly
 
 console = Console()
@@ -23,8 +25,9 @@ class MissionRunner:
         self,
         mqtt: MQTTClient,
         caller: ServiceCaller,
-        heartbeat: threading.Thread,
+        heartbeat: Heartbeat,
         config: Dict[str, Any],
+        done_event: Optional[threading.Event] = None,
     ):
         """
         初始化任务执行器
@@ -32,8 +35,9 @@ class MissionRunner:
         Args:
             mqtt: MQTT客户端
             caller: 服务调用器
-            heartbeat: 心跳线程
+            heartbeat: 心跳句柄（start_heartbeat 的返回值）
             config: 配置字典（必须包含 'callsign' 和 'sn'）
+            done_event: 可选，任务结束时 set()（多个执行器可共用一个，监控方据此立即唤醒）
         """
         self.mqtt = mqtt
         self.caller = caller
@@ -41,8 +45,42 @@ class MissionRunner:
         self.config = config
         self.status = "初始化"
         self.data: Dict[str, Any] = {}  # 任务数据（如当前高度）
-        self.running = False
+        self._running = False
+        # running 变为 False 时 set() 的事件（任务层用来代替逐个轮询 running）
+        self._stop_watchers: List[threading.Event] = []
         self.thread: Optional[threading.Thread] = None
+        # 未运行时为 set 状态；run() 时清除，任务结束时再次 set
+        self.finished = threading.Event()
+        self.finished.set()
+        self._done_event = done_event
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @running.setter
+    def running(self, value: bool) -> None:
+        self._running = value
+        if not value:
+            for event in tuple(self._stop_watchers):
+                event.set()
+
+    def watch_stop(self, event: threading.Event) -> None:
+        """
+        注册停止事件：running 变为 False 时 set()（注册时已停止则立即 set）
+
+        多个执行器可共用同一个事件，等待方只需检查一次 is_set()。
+        """
+        self._stop_watchers.append(event)
+        if not self._running:
+            event.set()
+
+    def unwatch_stop(self, event: threading.Event) -> None:
+        """取消 watch_stop 注册的事件"""
+        try:
+            self._stop_watchers.remove(event)
+        except ValueError:
+            pass
 
     def run(self, mission_func: Callable[["MissionRunner"], None]) -> None:
         """
@@ -52,6 +90,7 @@ class MissionRunner:
             mission_func: 任务函数，接收 MissionRunner 作为参数
         """
         self.running = True
+        self.finished.clear()
         self.thread = threading.Thread(
             target=self._run_with_error_handling, args=(mission_func,), daemon=True
         )
@@ -68,6 +107,9 @@ class MissionRunner:
             console.print(f"[red]✗ [{self.config['callsign']}] 任务失败: {e}[/red]")
         finally:
             self.running = False
+            self.finished.set()
+            if self._done_event is not None:
+                self._done_event.set()
 
     def stop(self) -> None:
         """停止任务"""
@@ -76,6 +118,20 @@ class MissionRunner:
             self.thread.join(timeout=2)
 
 
+@lru_cache(maxsize=256)
+def _status_cell(status: str) -> str:
+    """按状态文本缓存着色后的单元格（监控表每次刷新只做一次字典查找）"""
+    if "完成" in status:
+        status_color = "green"
+    elif status.startswith("错误"):
+        status_color = "red"
+    elif "上升" in status or "降落" in status:
+        status_color = "yellow"
+    else:
+        status_color = "cyan"
+    return f"[{status_color}]{status}[/{status_color}]"
+
+
 def create_status_table(runners: List[MissionRunner]) -> Table:
     """
     创建任务状态监控表格
@@ -93,26 +149,20 @@ def create_status_table(runners: List[MissionRunner]) -> Table:
     table.add_column("数据", style="green", width=20)
 
     for runner in runners:
-        # 状态颜色
-        status_color = "cyan"
-        if "完成" in runner.status or "任务完成" in runner.status:
-            status_color = "green"
-        elif runner.status.startswith("错误"):
-            status_color = "red"
-        elif "上升" in runner.status or "降落" in runner.status:
-            status_color = "yellow"
-
+        data = runner.data
+        config = runner.config
         # 数据显示
         data_str = ""
-        if "height" in runner.data and runner.data["height"] is not None:
-            data_str = f"高度: {runner.data['height']:.2f}m"
-        elif runner.data:
-            data_str = ", ".join(f"{k}: {v}" for k, v in list(runner.data.items())[:2])
+        height = data.get("height")
+        if height is not None:
+            data_str = f"高度: {height:.2f}m"
+        elif data:
+            data_str = ", ".join(f"{k}: {v}" for k, v in list(data.items())[:2])
 
         table.add_row(
-            runner.config["callsign"],
-            runner.config["sn"],
-            f"[{status_color}]{runner.status}[/{status_color}]",
+            config["callsign"],
+            config["sn"],
+            _status_cell(runner.status),
             data_str or "[dim]N/A[/dim]",
         )
 
@@ -120,7 +170,7 @@ def create_status_table(runners: List[MissionRunner]) -> Table:
 
 
 def run_parallel_missions(
-    connections: List[Tuple[MQTTClient, ServiceCaller, threading.Thread]],
+    connections: List[Tuple[MQTTClient, ServiceCaller, Heartbeat]],
     mission_func: Callable[[MissionRunner], None]
     | List[Callable[[MissionRunner], None]],
     uav_configs: List[Dict[str, Any]],
@@ -157,8 +207,10 @@ def run_parallel_missions(
     """
     # 创建任务执行器
     runners: List[MissionRunner] = []
+    # 任一任务结束即唤醒监控循环，不必等到下一个刷新周期
+    any_done = threading.Event()
     for i, (mqtt, caller, heartbeat) in enumerate(connections):
-        runner = MissionRunner(mqtt, caller, heartbeat, uav_configs[i])
+        runner = MissionRunner(mqtt, caller, heartbeat, uav_configs[i], any_done)
         runners.append(runner)
         console.print(f"[green]✓ 无人机 {runner.config['callsign']} 初始化完成[/green]")
 
@@ -183,25 +235,30 @@ def run_parallel_missions(
     # 实时监控（可选）
     if show_monitor:
         try:
+            # 关闭自动刷新：只在状态或数据变化时重建并重绘表格，悬停等静止阶段不做渲染
             with Live(
-                create_status_table(runners), refresh_per_second=4, console=console
+                create_status_table(runners), auto_refresh=False, console=console
             ) as live:
+                last_snapshot = None
                 while True:
-                    if all(not r.running for r in runners):
+                    any_done.clear()
+                    done = all(not r.running for r in runners)
+                    snapshot = [(r.status, r.data.copy()) for r in runners]
+                    if snapshot != last_snapshot:
+                        live.update(create_status_table(runners), refresh=True)
+                        last_snapshot = snapshot
+                    if done:
                         break
-                    live.update(create_status_table(runners))
-                    time.sleep(0.25)
+                    any_done.wait(0.25)
         except KeyboardInterrupt:
             console.print("\n[yellow]⚠ 收到中断信号，停止所有任务...[/yellow]")
             for runner in runners:
                 runner.stop()
     else:
-        # 不显示监控，仅等待任务完成
+        # 不显示监控，仅等待任务完成（按任务结束事件阻塞，无轮询）
         try:
-            while True:
-                if all(not r.running for r in runners):
-                    break
-                time.sleep(0.5)
+            for runner in runners:
+                runner.finished.wait()
         except KeyboardInterrupt:
             console.print("\n[yellow]⚠ 收到中断信号，停止所有任务...[/yellow]")
             for runner in runners:
@@ -235,16 +292,14 @@ def cleanup_missions(runners: List[MissionRunner], hover_duration: float = 1.0)
     # 显示最终统计
     console.print("\n[bold cyan]━━━ 任务统计 ━━━[/bold cyan]")
     for runner in runners:
-        if "完成" in runner.status or "任务完成" in runner.status:
+        callsign = runner.config["callsign"]
+        status = runner.status
+        if "完成" in status:
             data_info = ""
             if runner.data:
                 data_info = ", " + ", ".join(
                     f"{k}: {v}" for k, v in list(runner.data.items())[:2]
                 )
-            console.print(
-                f"[green]✓ {runner.config['callsign']}: {runner.status}{data_info}[/green]"
-            )
+            console.print(f"[green]✓ {callsign}: {status}{data_info}[/green]")
         else:
-            console.print(
-                f"[yellow]⚠ {runner.config['callsign']}: {runner.status}[/yellow]"
-            )
+            console.print(f"[yellow]⚠ {callsign}: {status}[/yellow]")
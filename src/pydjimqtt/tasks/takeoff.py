@@ -7,7 +7,7 @@ from typing import Callable
 from rich.console import Console
 
 from ..services import send_stick_control
-from ..primitives import wait_for_condition, send_stick_repeatedly
+from ..primitives import wait_for_event, send_stick_repeatedly
 from .runner import MissionRunner
 
 console = Console()
@@ -68,7 +68,9 @@ def create_takeoff_mission(
 
         # 阶段1: 等待GPS数据
         runner.status = "等待高度数据"
-        wait_for_condition(lambda: mqtt.get_height() is not None, timeout=30)
+        wait_for_event(
+            mqtt.osd_updated, lambda: mqtt.get_height() is not None, timeout=30
+        )
         console.print(
             f"[green]✓ [{callsign}] GPS数据就绪，起飞点高度: {mqtt.get_height():.2f}m[/green]"
         )
@@ -94,16 +96,23 @@ def create_takeoff_mission(
         )
 
         # 无法运动检测：记录初始状态
-        start_time = time.time()
+        start_time = time.monotonic()
         last_check_time = start_time
         last_check_height = mqtt.get_relative_height() or 0.0
         stuck_threshold = 0.1  # 高度变化阈值（米）
         check_interval = 5.0  # 检查间隔（秒）
 
+        # 循环节拍即杆量发送频率（10Hz，DRC 需要持续的杆量流），按绝对截止时间调度不累积漂移
+        stick_interval = 0.1
+        next_tick = time.monotonic()
         while runner.running:
             h = mqtt.get_relative_height()
             if h is None:
-                time.sleep(0.1)
+                # 高度数据缺失：等待下一条 OSD 推送而不是固定休眠（按版本号等待，不清除共享信号）
+                seen = mqtt.osd_updated.version
+                if mqtt.get_relative_height() is None:
+                    mqtt.osd_updated.wait_for_update(seen, stick_interval)
+                next_tick = time.monotonic()
                 continue
 
             runner.data["height"] = h
@@ -116,7 +125,7 @@ def create_takeoff_mission(
                 break
 
             # 无法运动检测：每5秒检查一次
-            current_time = time.time()
+            current_time = time.monotonic()
             if current_time - last_check_time >= check_interval:
                 height_change = abs(h - last_check_height)
 
@@ -151,7 +160,12 @@ def create_takeoff_mission(
 
             # 继续上升
             send_stick_control(mqtt, throttle=throttle_up)
-            time.sleep(0.1)
+            next_tick += stick_interval
+            remaining = next_tick - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                next_tick = time.monotonic()
 
         # 阶段4: 悬停
         runner.status = "悬停"
@@ -8,14 +8,19 @@
 - 航点间悬停稳定
 """
 
+import atexit
+import os
 import time
 import json
 import tempfile
-import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from rich.console import Console
 
+from ..core import codec
 from ..services import fly_to_point, reset_gimbal, set_camera_zoom, change_live_lens
 from ..utils import build_video_id
 from .runner import MissionRunner
@@ -26,9 +31,98 @@ console = Console()
 MISSION_STATE_FILE = Path("/tmp/pydjimqtt_mission_state.json")
 
 
+class _StateFileWriter:
+    """
+    任务状态文件的合并写出器
+
+    update() 只修改内存中的条目并唤醒后台线程；后台线程最多每 min_interval 秒
+    原子写出一次（temp file + rename），快速连续的状态切换只落盘最后一次。
+    """
+
+    def __init__(self, path: Path, min_interval: float = 0.1):
+        self.path = path
+        self.min_interval = min_interval
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._cv = threading.Condition()
+        self._write_lock = threading.Lock()  # 保证快照按顺序落盘
+        self._thread = None
+        # 上次写出的完整内容及文件标识 (inode, mtime_ns, size)：文件未被他人改动时不再回读解析
+        self._written: Dict[str, Dict[str, Any]] = {}
+        self._written_stamp = None
+
+    def update(self, callsign: str, entry: Dict[str, Any]) -> None:
+        """记录一架无人机的最新状态（立即返回，不做文件 I/O）"""
+        with self._cv:
+            self._entries[callsign] = entry
+            self._dirty = True
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="mission-state-writer", daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.flush)
+            self._cv.notify()
+
+    def flush(self) -> None:
+        """立即写出尚未落盘的更新"""
+        with self._write_lock:
+            with self._cv:
+                if not self._dirty:
+                    return
+                entries = dict(self._entries)
+                self._dirty = False
+            self._write(entries)
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                self._cv.wait_for(lambda: self._dirty)
+            self.flush()
+            time.sleep(self.min_interval)
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            # 保留其他进程写入的无人机数据：文件仍是上次写出的那份时直接复用内存副本
+            try:
+                st = os.stat(self.path)
+                stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+            except FileNotFoundError:
+                stamp = None
+            if stamp is None:
+                mission_state = {}
+            elif stamp == self._written_stamp:
+                mission_state = dict(self._written)
+            else:
+                with open(self.path, "r") as f:
+                    mission_state = json.load(f)
+            mission_state.update(entries)
+
+            # 原子写入（先写临时文件，再重命名）
+            with tempfile.NamedTemporaryFile(
+                mode="w", delete=False, dir=self.path.parent, prefix="pydjimqtt_mission_"
+            ) as tmp_file:
+                json.dump(mission_state, tmp_file, separators=(",", ":"))
+                tmp_file.flush()
+                st = os.fstat(tmp_file.fileno())
+                tmp_path = tmp_file.name
+
+            # 原子替换（rename 不改变 inode 与 mtime，替换后的文件标识即临时文件的标识）
+            os.replace(tmp_path, self.path)
+            self._written = mission_state
+            self._written_stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+        except Exception:
+            # 静默失败：文件写入失败不影响任务执行
+            pass
+
+
+_state_writer = _StateFileWriter(MISSION_STATE_FILE)
+
+
 def _update_mission_state_file(runner: MissionRunner, wp_index: int, task_status: str):
     """
-    更新任务状态文件（原子写入，进程安全）
+    更新任务状态文件（限频合并写入，进程安全）
 
     Args:
         runner: MissionRunner 对象
@@ -36,47 +130,32 @@ def _update_mission_state_file(runner: MissionRunner, wp_index: int, task_status
         task_status: 任务状态描述（如"飞行中"、"完成"等）
 
     Note:
-        - 使用原子写入（temp file + rename）防止部分读取
+        - 只更新内存中的条目，由后台线程最多每 0.1 秒原子写出一次
         - 静默失败（写入失败不影响任务执行）
         - Dashboard 通过读取此文件显示任务进度
     """
-    try:
-        callsign = runner.config.get("callsign", "UAV")
-
-        # 读取现有文件（保留其他无人机数据）
-        mission_state = {}
-        if MISSION_STATE_FILE.exists():
-            with open(MISSION_STATE_FILE, "r") as f:
-                mission_state = json.load(f)
-
-        # 更新当前无人机数据
-        mission_state[callsign] = {
+    _state_writer.update(
+        runner.config.get("callsign", "UAV"),
+        {
             "current_waypoint": wp_index,
             "total_waypoints": runner.data.get("total_waypoints", 0),
             "task_status": task_status,
             "timestamp": time.time(),
             "trajectory_file": runner.config.get("trajectory_file", ""),
-        }
-
-        # 原子写入（先写临时文件，再重命名）
-        with tempfile.NamedTemporaryFile(
-            mode="w", delete=False, dir="/tmp", prefix="pydjimqtt_mission_"
-        ) as tmp_file:
-            json.dump(mission_state, tmp_file, indent=2)
-            tmp_path = tmp_file.name
+        },
+    )
 
-        # 原子替换
-        shutil.move(tmp_path, MISSION_STATE_FILE)
 
-    except Exception:
-        # 静默失败：文件写入失败不影响任务执行
-        pass
+# 航点文件解析缓存：路径 → ((mtime_ns, size), 航点列表)
+_TRAJECTORY_CACHE: Dict[str, Tuple[Tuple[int, int], List[Dict[str, Any]]]] = {}
 
 
 def load_trajectory(filepath: str) -> List[Dict[str, Any]]:
     """
     从 JSON 文件加载航点数据
 
+    同一文件未修改（mtime 与大小不变）时直接返回缓存的解析结果，不再重复读取和解析。
+
     Args:
         filepath: 航点文件路径
 
@@ -95,22 +174,38 @@ def load_trajectory(filepath: str) -> List[Dict[str, Any]]:
         >>> waypoints = load_trajectory('Trajectory/uav1.json')
         >>> print(f"加载了 {len(waypoints)} 个航点")
     """
-    path = Path(filepath)
-    if not path.exists():
-        raise FileNotFoundError(f"航点文件不存在: {filepath}")
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"航点文件不存在: {filepath}") from None
+
+    # 文件未修改时复用已解析的航点（每个航点复制一份，调用方修改不影响缓存）
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _TRAJECTORY_CACHE.get(filepath)
+    if cached is not None and cached[0] == stamp:
+        return [dict(wp) for wp in cached[1]]
 
-    with open(path, "r", encoding="utf-8") as f:
-        waypoints = json.load(f)
+    # 按 bytes 读入直接解析（orjson 可用时走快速路径，无需先解码为 str）
+    with open(filepath, "rb") as f:
+        waypoints = codec.loads(f.read())
 
     if not isinstance(waypoints, list) or len(waypoints) == 0:
         raise ValueError(f"航点数据格式错误或为空: {filepath}")
 
-    # 验证航点数据格式
-    for i, wp in enumerate(waypoints):
-        if "lat" not in wp or "lon" not in wp:
-            raise ValueError(f"航点 {i + 1} 缺少 lat 或 lon 字段: {wp}")
+    # 验证航点数据格式（找到第一个缺字段的航点即停止）
+    bad = next(
+        (
+            i
+            for i, wp in enumerate(waypoints)
+            if not isinstance(wp, dict) or "lat" not in wp or "lon" not in wp
+        ),
+        None,
+    )
+    if bad is not None:
+        raise ValueError(f"航点 {bad + 1} 缺少 lat 或 lon 字段: {waypoints[bad]}")
 
-    return waypoints
+    _TRAJECTORY_CACHE[filepath] = (stamp, waypoints)
+    return [dict(wp) for wp in waypoints]
 
 
 def fly_trajectory_sequence(
@@ -148,64 +243,220 @@ def fly_trajectory_sequence(
     total_waypoints = len(waypoints)
     all_success = True
 
+    # 任一 runner 停止（如返航）时由其 running setter 置位，检查时不再逐个扫描
+    abort_flag = threading.Event()
+
     def _should_abort() -> bool:
         """外部停止信号（如返航）时立即终止后续航点"""
-        return any(not r.running for r in runners)
+        return abort_flag.is_set()
+
+    def _dispatch(runner: MissionRunner, lat: float, lon: float):
+        """发送 Fly-to 指令，返回 (fly_to_id, 异常)"""
+        try:
+            fly_to_id = fly_to_point(
+                runner.caller,
+                latitude=lat,
+                longitude=lon,
+                height=height,
+                max_speed=max_speed,
+            )
+            return fly_to_id, None
+        except Exception as e:
+            return None, e
+
+    def _monitor(
+        runner: MissionRunner, callsign: str, fly_to_id: str, wp_index: int
+    ) -> bool:
+        """等待单架无人机到达航点（各机在线程池中并发等待），返回是否成功"""
+        mqtt = runner.mqtt
+
+        # 实时监控飞行进度（条件变量驱动，打印实时信息）
+        try:
+            if debug:
+                console.print(
+                    f"[dim]🐛 [{callsign}] 等待 fly_to_id={fly_to_id[:8]}... 的事件[/dim]"
+                )
 
-    for wp_index, waypoint in enumerate(waypoints, 1):
-        if _should_abort():
-            for r in runners:
-                _update_mission_state_file(r, wp_index - 1, "已取消")
-            return False
-        wp_id = waypoint.get("id", wp_index)
-        lat = waypoint["lat"]
-        lon = waypoint["lon"]
+            last_print = [0.0]
+            print_interval = 1.0  # 每秒打印一次进度
+
+            def _print_progress(progress: Dict[str, Any]) -> None:
+                # 实时打印飞行信息（每秒一次）
+                current_time = time.monotonic()
+                if progress.get("status") != "wayline_progress":
+                    return
+                if current_time - last_print[0] < print_interval:
+                    return
+                remaining_distance = progress.get("remaining_distance")
+                remaining_time = progress.get("remaining_time")
+                way_point_index = progress.get("way_point_index")
+
+                # 构建进度信息字符串
+                info_parts = []
+                if remaining_distance is not None:
+                    info_parts.append(f"剩余距离: {remaining_distance:.1f}m")
+                if remaining_time is not None:
+                    info_parts.append(f"剩余时间: {remaining_time:.1f}s")
+                if way_point_index is not None:
+                    info_parts.append(f"航点索引: {way_point_index}")
+
+                info_str = " | ".join(info_parts) if info_parts else "飞行中..."
+
+                console.print(
+                    f"[bright_cyan]→ [{callsign}] 飞向航点 {wp_index}: {info_str}[/bright_cyan]"
+                )
+                last_print[0] = current_time
+
+            # 进度推送到达即唤醒（fly_to_id 必须匹配，防止读取旧航点数据），不再 0.1 秒轮询
+            progress = mqtt.wait_for_flyto_event(
+                fly_to_id,
+                timeout=120.0,  # 2分钟超时
+                on_progress=_print_progress if show_progress else None,
+                should_abort=lambda: not runner.running,
+            )
+
+            if progress is None:
+                _update_mission_state_file(runner, wp_index, "已取消")
+                return False
 
-        # 更新所有 runner 的当前航点索引（供外部监控和 dashboard 显示）
-        for runner in runners:
-            runner.data["current_waypoint"] = wp_index
-            # ✅ 立即写入文件（Dashboard 通过文件读取任务进度）
-            _update_mission_state_file(runner, wp_index, "飞行中")
+            # 调试：打印完整事件数据
+            if debug:
+                console.print(f"[dim]🐛 [{callsign}] 收到终止事件: {progress}[/dim]")
 
-        if show_progress:
+            status = progress.get("status")
+            result_code = progress.get("result")
+
+            if status == "wayline_ok":
+                if show_progress:
+                    console.print(
+                        f"[bold bright_green]✓ [{callsign}] 已到达航点 {wp_index}！[/bold bright_green]"
+                    )
+                return True
+            if status == "wayline_failed":
+                if show_progress:
+                    console.print(
+                        f"[bold bright_red]✗ [{callsign}] 飞向航点 {wp_index} 失败[/bold bright_red]"
+                    )
+                    console.print(f"[dim]   result_code: {result_code}[/dim]")
+                return False
+            if status == "wayline_cancel":
+                if show_progress:
+                    console.print(
+                        f"[bold bright_yellow]⚠ [{callsign}] 飞向航点 {wp_index} 取消[/bold bright_yellow]"
+                    )
+                    console.print(f"[dim]   result_code: {result_code}[/dim]")
+                return False
+            return True
+
+        except TimeoutError as e:
             console.print(
-                f"\n[bold bright_cyan]━━━ 航点 {wp_index}/{total_waypoints} (ID: {wp_id}) ━━━[/bold bright_cyan]"
+                f"[bold bright_red]✗ [{callsign}] 航点 {wp_index} 超时[/bold bright_red]"
             )
+            console.print(f"[dim]   {e}[/dim]")
+            return False
+        except Exception as e:
             console.print(
-                f"[bright_yellow]目标: lat={lat:.7f}, lon={lon:.7f}, h={height:.1f}m[/bright_yellow]"
+                f"[bold bright_red]✗ [{callsign}] 航点 {wp_index} 异常[/bold bright_red]"
+            )
+            console.print(f"[dim]   {e}[/dim]")
+            return False
+
+    def _prepare_camera(runner: MissionRunner, callsign: str) -> None:
+        """悬停期间：切换zoom镜头 + 云台朝下 + 变焦3倍"""
+        mqtt = runner.mqtt
+        caller = runner.caller
+
+        try:
+            payload_index = mqtt.get_payload_index() or "88-0-0"
+
+            # 1. 切换镜头到 zoom（使用 change_live_lens）
+            try:
+                video_id = build_video_id(mqtt, video_index="zoom-0")
+                if show_progress:
+                    console.print(
+                        f"[bright_cyan][{callsign}] 切换到zoom镜头...[/bright_cyan]"
+                    )
+                change_live_lens(caller, video_id=video_id, video_type="zoom")
+            except Exception as e:
+                if show_progress:
+                    console.print(
+                        f"[bright_yellow]⚠ [{callsign}] 切换镜头失败: {e}[/bright_yellow]"
+                    )
+
+            # 2. 云台朝下（reset_mode=1: yaw回中、pitch向下）
+            if show_progress:
+                console.print(f"[bright_cyan][{callsign}] 云台朝下...[/bright_cyan]")
+            reset_gimbal(mqtt, payload_index=payload_index, reset_mode=1)
+
+            # 3. 变焦3倍
+            if show_progress:
+                console.print(f"[bright_cyan][{callsign}] 变焦3倍...[/bright_cyan]")
+            set_camera_zoom(
+                mqtt,
+                payload_index=payload_index,
+                zoom_factor=3.0,
+                camera_type="zoom",
             )
 
-        # 发送 Fly-to 指令到所有无人机，并记录 fly_to_id
-        fly_to_ids = {}  # {callsign: fly_to_id}
-        for runner in runners:
+        except Exception as e:
+            if show_progress:
+                console.print(
+                    f"[bright_yellow]⚠ [{callsign}] 云台/变焦控制失败: {e}[/bright_yellow]"
+                )
+
+    # 每架无人机一个工作线程：service call 与事件等待都在 I/O 上阻塞，
+    # 多机并发后每个航点的耗时取决于最慢的一架，而不是各机耗时之和
+    for r in runners:
+        r.watch_stop(abort_flag)
+    # 呼号在整个航点序列中不变，只取一次（与 runners 按下标对应）
+    callsigns = [r.config.get("callsign", "UAV") for r in runners]
+    drone_prefixes = [f"[bright_cyan][{callsign}]" for callsign in callsigns]
+    pool = ThreadPoolExecutor(
+        max_workers=max(1, len(runners)), thread_name_prefix="trajectory"
+    )
+    try:
+        for wp_index, waypoint in enumerate(waypoints, 1):
             if _should_abort():
                 for r in runners:
                     _update_mission_state_file(r, wp_index - 1, "已取消")
                 return False
+            wp_id = waypoint.get("id", wp_index)
+            lat = waypoint["lat"]
+            lon = waypoint["lon"]
+
+            # 更新所有 runner 的当前航点索引（供外部监控和 dashboard 显示）
+            for runner in runners:
+                runner.data["current_waypoint"] = wp_index
+                # ✅ 立即写入文件（Dashboard 通过文件读取任务进度）
+                _update_mission_state_file(runner, wp_index, "飞行中")
 
-            caller = runner.caller
-            callsign = runner.config.get("callsign", "UAV")
             if show_progress:
+                # 航点标题与各机提示合并为一次输出（每机前缀在循环外已格式化）
+                dispatch_suffix = f" 飞向航点 {wp_index}...[/bright_cyan]"
                 console.print(
-                    f"[bright_cyan][{callsign}] 飞向航点 {wp_index}...[/bright_cyan]"
+                    "\n".join(
+                        [
+                            f"\n[bold bright_cyan]━━━ 航点 {wp_index}/{total_waypoints} (ID: {wp_id}) ━━━[/bold bright_cyan]",
+                            f"[bright_yellow]目标: lat={lat:.7f}, lon={lon:.7f}, h={height:.1f}m[/bright_yellow]",
+                        ]
+                        + [prefix + dispatch_suffix for prefix in drone_prefixes]
+                    )
                 )
 
-            try:
-                fly_to_id = fly_to_point(
-                    caller,
-                    latitude=lat,
-                    longitude=lon,
-                    height=height,
-                    max_speed=max_speed,
-                )
-                fly_to_ids[callsign] = fly_to_id
-            except Exception as e:
+            # 并发发送 Fly-to 指令到所有无人机，并记录 fly_to_id
+            dispatched = list(pool.map(lambda r: _dispatch(r, lat, lon), runners))
+            fly_to_ids = []  # 与 runners 按下标对应
+            for callsign, (fly_to_id, error) in zip(callsigns, dispatched):
+                if error is None:
+                    fly_to_ids.append(fly_to_id)
+                    continue
+
                 # service call 失败，立即终止整个轨迹任务
                 console.print(
                     f"\n[bold bright_red]✗ [{callsign}] Fly-to service 调用失败，终止轨迹任务[/bold bright_red]"
                 )
                 console.print(f"[yellow]   航点: {wp_index}/{total_waypoints}[/yellow]")
-                console.print(f"[yellow]   异常: {e}[/yellow]")
+                console.print(f"[yellow]   异常: {error}[/yellow]")
 
                 # 更新失败状态到文件
                 for r in runners:
@@ -213,216 +464,45 @@ def fly_trajectory_sequence(
 
                 return False  # 立即返回失败
 
-        # 监控飞行进度（实时打印距离、时间等信息）
-        if show_progress:
-            console.print("[dim]监控飞行进度（实时显示）...[/dim]\n")
-
-        for runner in runners:
-            mqtt = runner.mqtt
-            callsign = runner.config.get("callsign", "UAV")
-
-            # 跳过 service call 失败的无人机（用缺失 key 判断，不用 None）
-            if callsign not in fly_to_ids:
-                if show_progress:
-                    console.print(
-                        f"[dim][{callsign}] 跳过监控（service call 失败）[/dim]"
-                    )
-                continue
-
-            fly_to_id = fly_to_ids[callsign]
-
-            # 实时监控飞行进度（自己实现循环，打印实时信息）
-            try:
-                if debug:
-                    console.print(
-                        f"[dim]🐛 [{callsign}] 等待 fly_to_id={fly_to_id[:8]}... 的事件[/dim]"
-                    )
-
-                start_time = time.time()
-                terminal_statuses = {"wayline_ok", "wayline_failed", "wayline_cancel"}
-                last_print_time = 0
-                print_interval = 1.0  # 每秒打印一次进度
-
-                while True:
-                    if not runner.running:
-                        all_success = False
-                        _update_mission_state_file(runner, wp_index, "已取消")
-                        break
-
-                    elapsed = time.time() - start_time
-                    if elapsed > 120.0:  # 2分钟超时
-                        raise TimeoutError(
-                            f"[{callsign}] 等待 fly_to_id={fly_to_id[:8]}... 的事件超时（120秒）"
-                        )
-
-                    # 读取最新飞行进度数据
-                    progress = mqtt.get_flyto_progress()
-                    event_fly_to_id = progress.get("fly_to_id")
-                    status = progress.get("status")
-
-                    # ✅ 关键检查：fly_to_id 必须匹配（防止读取旧航点数据）
-                    if event_fly_to_id == fly_to_id:
-                        # 收到当前航点的事件
-
-                        # 实时打印飞行信息（每秒一次）
-                        current_time = time.time()
-                        if status == "wayline_progress" and show_progress:
-                            if current_time - last_print_time >= print_interval:
-                                remaining_distance = progress.get("remaining_distance")
-                                remaining_time = progress.get("remaining_time")
-                                way_point_index = progress.get("way_point_index")
-
-                                # 构建进度信息字符串
-                                info_parts = []
-                                if remaining_distance is not None:
-                                    info_parts.append(
-                                        f"剩余距离: {remaining_distance:.1f}m"
-                                    )
-                                if remaining_time is not None:
-                                    info_parts.append(
-                                        f"剩余时间: {remaining_time:.1f}s"
-                                    )
-                                if way_point_index is not None:
-                                    info_parts.append(f"航点索引: {way_point_index}")
-
-                                info_str = (
-                                    " | ".join(info_parts)
-                                    if info_parts
-                                    else "飞行中..."
-                                )
-
-                                console.print(
-                                    f"[bright_cyan]→ [{callsign}] 飞向航点 {wp_index}: {info_str}[/bright_cyan]"
-                                )
-                                last_print_time = current_time
-
-                        # 调试：打印完整事件数据
-                        if debug and status in terminal_statuses:
-                            console.print(
-                                f"[dim]🐛 [{callsign}] 收到终止事件: {progress}[/dim]"
-                            )
-
-                        # 检查是否到达终止状态
-                        if status in terminal_statuses:
-                            result_code = progress.get("result")
-
-                            if status == "wayline_ok":
-                                if show_progress:
-                                    console.print(
-                                        f"[bold bright_green]✓ [{callsign}] 已到达航点 {wp_index}！[/bold bright_green]"
-                                    )
-                            elif status == "wayline_failed":
-                                if show_progress:
-                                    console.print(
-                                        f"[bold bright_red]✗ [{callsign}] 飞向航点 {wp_index} 失败[/bold bright_red]"
-                                    )
-                                    console.print(
-                                        f"[dim]   result_code: {result_code}[/dim]"
-                                    )
-                                all_success = False
-                            elif status == "wayline_cancel":
-                                if show_progress:
-                                    console.print(
-                                        f"[bold bright_yellow]⚠ [{callsign}] 飞向航点 {wp_index} 取消[/bold bright_yellow]"
-                                    )
-                                    console.print(
-                                        f"[dim]   result_code: {result_code}[/dim]"
-                                    )
-                                all_success = False
-
-                            # 到达终止状态，退出循环
-                            break
-
-                    # 短暂休眠（避免过度占用 CPU）
-                    time.sleep(0.1)
-
-            except TimeoutError as e:
-                console.print(
-                    f"[bold bright_red]✗ [{callsign}] 航点 {wp_index} 超时[/bold bright_red]"
-                )
-                console.print(f"[dim]   {e}[/dim]")
-                all_success = False
-            except Exception as e:
-                console.print(
-                    f"[bold bright_red]✗ [{callsign}] 航点 {wp_index} 异常[/bold bright_red]"
-                )
-                console.print(f"[dim]   {e}[/dim]")
-                all_success = False
+            # 监控飞行进度（实时打印距离、时间等信息），各机并发等待
+            if show_progress:
+                console.print("[dim]监控飞行进度（实时显示）...[/dim]\n")
 
-        if show_progress:
-            console.print(
-                f"[bold bright_green]✓ 航点 {wp_index}/{total_waypoints} 飞行完成[/bold bright_green]"
+            arrived = list(
+                pool.map(_monitor, runners, callsigns, fly_to_ids, repeat(wp_index))
             )
-
-        # 航点间等待（除了最后一个航点）
-        if wp_index < total_waypoints and hover_between_waypoints > 0:
-            if _should_abort():
-                for r in runners:
-                    _update_mission_state_file(r, wp_index, "已取消")
-                return False
+            if not all(arrived):
+                all_success = False
 
             if show_progress:
                 console.print(
-                    f"[bright_cyan]━━━ 航点 {wp_index} 悬停操作 ━━━[/bright_cyan]"
-                )
-                console.print(
-                    f"[bright_yellow]悬停 {hover_between_waypoints:.1f} 秒，切换zoom镜头 + 云台朝下 + 变焦3倍[/bright_yellow]"
+                    f"[bold bright_green]✓ 航点 {wp_index}/{total_waypoints} 飞行完成[/bold bright_green]"
                 )
 
-            # 所有无人机：切换zoom镜头 + 云台朝下 + 变焦3倍
-            for runner in runners:
-                mqtt = runner.mqtt
-                caller = runner.caller
-                callsign = runner.config.get("callsign", "UAV")
+            # 航点间等待（除了最后一个航点）
+            if wp_index < total_waypoints and hover_between_waypoints > 0:
+                if _should_abort():
+                    for r in runners:
+                        _update_mission_state_file(r, wp_index, "已取消")
+                    return False
 
-                # 跳过之前失败的无人机
-                if callsign not in fly_to_ids:
-                    continue
-
-                try:
-                    payload_index = mqtt.get_payload_index() or "88-0-0"
-
-                    # 1. 切换镜头到 zoom（使用 change_live_lens）
-                    try:
-                        video_id = build_video_id(mqtt, video_index="zoom-0")
-                        if show_progress:
-                            console.print(
-                                f"[bright_cyan][{callsign}] 切换到zoom镜头...[/bright_cyan]"
-                            )
-                        change_live_lens(caller, video_id=video_id, video_type="zoom")
-                    except Exception as e:
-                        if show_progress:
-                            console.print(
-                                f"[bright_yellow]⚠ [{callsign}] 切换镜头失败: {e}[/bright_yellow]"
-                            )
-
-                    # 2. 云台朝下（reset_mode=1: yaw回中、pitch向下）
-                    if show_progress:
-                        console.print(
-                            f"[bright_cyan][{callsign}] 云台朝下...[/bright_cyan]"
-                        )
-                    reset_gimbal(mqtt, payload_index=payload_index, reset_mode=1)
-
-                    # 3. 变焦3倍
-                    if show_progress:
-                        console.print(
-                            f"[bright_cyan][{callsign}] 变焦3倍...[/bright_cyan]"
-                        )
-                    set_camera_zoom(
-                        mqtt,
-                        payload_index=payload_index,
-                        zoom_factor=3.0,
-                        camera_type="zoom",
+                if show_progress:
+                    console.print(
+                        f"[bright_cyan]━━━ 航点 {wp_index} 悬停操作 ━━━[/bright_cyan]"
+                    )
+                    console.print(
+                        f"[bright_yellow]悬停 {hover_between_waypoints:.1f} 秒，切换zoom镜头 + 云台朝下 + 变焦3倍[/bright_yellow]"
                     )
 
-                except Exception as e:
-                    if show_progress:
-                        console.print(
-                            f"[bright_yellow]⚠ [{callsign}] 云台/变焦控制失败: {e}[/bright_yellow]"
-                        )
+                # 所有无人机并发：切换zoom镜头 + 云台朝下 + 变焦3倍
+                list(pool.map(_prepare_camera, runners, callsigns))
 
-            # 悬停等待（fly_to_point 后飞机会自动悬停）
-            time.sleep(hover_between_waypoints)
+                # 悬停等待（fly_to_point 后飞机会自动悬停）
+                time.sleep(hover_between_waypoints)
+    finally:
+        pool.shutdown(wait=False)
+        for r in runners:
+            r.unwatch_stop(abort_flag)
 
     # ✅ 任务完成，更新最终状态
     for runner in runners:
@@ -8,17 +8,41 @@ DJI SDK 通用工具函数
 - Video ID 构建
 """
 
+import os
+import select
 import time
 import sys
 import tty
 import termios
-import json
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any
 from rich.console import Console
+from rich.json import JSON
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.text import Text
 
-console = Console()
+# 输出都带显式 markup，关闭逐条正则高亮；JSON 面板由 rich.json 自带高亮器着色
+console = Console(highlight=False)
+
+# 方向键 CSI 转义序列 → 键名
+_CSI_KEYS = {
+    b"\x1b[A": "UP",
+    b"\x1b[B": "DOWN",
+    b"\x1b[C": "RIGHT",
+    b"\x1b[D": "LEFT",
+}
+# 方向键序列的真前缀（b"\x1b"、b"\x1b["）：读到这些时还不能判定是单独的 ESC
+_CSI_PREFIXES = frozenset(seq[:i] for seq in _CSI_KEYS for i in range(1, len(seq)))
+# ESC 之后等待后续字节的时间（秒），超时才判定为单独的 ESC
+_ESC_TIMEOUT = 0.1
+# 一次 read 读到的多余按键（长按自动重复时一次可能读到多个），留给下一次调用
+_pending_keys = b""
+
+
+@lru_cache(maxsize=64)
+def _panel_title(title: str, color: str) -> Text:
+    """面板标题按 (title, color) 缓存，重复调用不再解析 markup（Panel 渲染时会复制）"""
+    return Text(title, style=f"bold {color}")
 
 
 def print_json_message(title: str, data: Dict[str, Any], color: str = "cyan") -> None:
@@ -33,15 +57,14 @@ def print_json_message(title: str, data: Dict[str, Any], color: str = "cyan") ->
     Example:
         >>> print_json_message("Request", {"method": "live_start_push"}, "blue")
     """
-    json_str = json.dumps(data, indent=2, ensure_ascii=False)
-    syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
+    # rich.json 用正则高亮器着色，省去 Pygments 词法分析的整轮开销
     panel = Panel(
-        syntax,
-        title=f"[bold {color}]{title}[/bold {color}]",
+        JSON.from_data(data, indent=2, ensure_ascii=False),
+        title=_panel_title(title, color),
         border_style=color,
         padding=(1, 2),
     )
-    console.print("\n")
+    console.line(2)
     console.print(panel)
 
 
@@ -57,28 +80,39 @@ def get_key() -> Optional[str]:
         >>> if key == 'UP':
         ...     print("向上箭头")
     """
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(sys.stdin.fileno())
-        ch = sys.stdin.read(1)
-        # 检测箭头键（转义序列）
-        if ch == "\x1b":  # ESC
-            ch2 = sys.stdin.read(1)
-            if ch2 == "[":
-                ch3 = sys.stdin.read(1)
-                if ch3 == "A":
-                    return "UP"
-                elif ch3 == "B":
-                    return "DOWN"
-                elif ch3 == "C":
-                    return "RIGHT"
-                elif ch3 == "D":
-                    return "LEFT"
-            return "ESC"
-        return ch
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+    global _pending_keys
+
+    data = _pending_keys
+    if not data or data in _CSI_PREFIXES:
+        # 一次系统调用读入整个按键序列（方向键为 3 字节）
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            # TCSANOW：不清空已到达但未读取的按键（默认 TCSAFLUSH 会丢弃）
+            tty.setraw(fd, termios.TCSANOW)
+            if not data:
+                data = os.read(fd, 8)
+            # 序列被 read 边界或慢速链路截断时继续读，短时间内没有后续字节才按 ESC 处理
+            while data in _CSI_PREFIXES:
+                if not select.select([fd], [], [], _ESC_TIMEOUT)[0]:
+                    break
+                data += os.read(fd, 8)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+    key = _CSI_KEYS.get(data[:3])
+    if key is not None:
+        _pending_keys = data[3:]
+        return key
+    if data[:1] == b"\x1b":
+        # 单独的 ESC 或未识别的转义序列
+        _pending_keys = b""
+        return "ESC"
+
+    # 普通字符（可能是多字节 UTF-8）
+    ch = data.decode("utf-8", errors="ignore")[:1]
+    _pending_keys = data[len(ch.encode("utf-8")) or 1 :]
+    return ch
 
 
 def wait_for_camera_data(
@@ -101,8 +135,8 @@ def wait_for_camera_data(
     """
     console.print(f"\n[yellow]⏳ 等待相机数据（最多 {max_wait} 秒）...[/yellow]")
 
-    start_time = time.time()
-    while time.time() - start_time < max_wait:
+    start_time = time.monotonic()
+    while time.monotonic() - start_time < max_wait:
         aircraft_sn = mqtt_client.get_aircraft_sn()
         payload_index = mqtt_client.get_payload_index()
 
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+
+import paho.mqtt.client as paho
+
+from pydjimqtt.core.mqtt_client import MQTTClient
+
+
+class _FakePahoClient:
+    """只实现 install_asyncio_loop 用到的接口，socket 用 socketpair 代替"""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self.write_threads = []
+        self.written = None
+
+    def loop_stop(self) -> None:
+        pass
+
+    def socket(self) -> socket.socket:
+        return self._sock
+
+    def want_write(self) -> bool:
+        return False
+
+    def loop_read(self) -> None:
+        pass
+
+    def loop_write(self) -> None:
+        self.write_threads.append(threading.get_ident())
+        self.on_socket_unregister_write(self, None, self._sock)
+        self.written.set()
+
+    def loop_misc(self) -> int:
+        return paho.MQTT_ERR_SUCCESS
+
+
+def test_publish_from_other_thread_wakes_idle_loop() -> None:
+    a, b = socket.socketpair()
+    add_writer_threads = []
+    fake = _FakePahoClient(a)
+    mqtt_client = MQTTClient("GW", {})
+    mqtt_client.client = fake
+
+    async def main() -> None:
+        fake.written = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        real_add_writer = loop.add_writer
+
+        def add_writer(*args):
+            add_writer_threads.append(threading.get_ident())
+            return real_add_writer(*args)
+
+        loop.add_writer = add_writer
+        mqtt_client.install_asyncio_loop(loop)
+        try:
+            # 模拟调度线程上的 publish：paho 在调用线程上触发注册回调
+            publisher = threading.Thread(
+                target=fake.on_socket_register_write, args=(fake, None, a)
+            )
+            publisher.start()
+            await asyncio.wait_for(fake.written.wait(), 0.5)
+            publisher.join()
+        finally:
+            mqtt_client._misc_task.cancel()
+
+    try:
+        asyncio.run(main())
+    finally:
+        a.close()
+        b.close()
+
+    # 事件循环方法只在循环线程上调用
+    assert add_writer_threads == [threading.get_ident()]
+    assert fake.write_threads == [threading.get_ident()]
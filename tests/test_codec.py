@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+from pydjimqtt.core import codec
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_codec_round_trip(monkeypatch, use_orjson: bool) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(codec, "orjson", None)
+    elif codec.orjson is None:
+        pytest.skip("orjson not installed")
+
+    payload = {"method": "osd_info_push", "seq": 7, "data": {"height": 12.5}}
+    encoded = codec.dumps(payload)
+    raw = encoded if isinstance(encoded, bytes) else encoded.encode("utf-8")
+
+    assert codec.loads(raw) == payload
+    assert codec.loads(memoryview(raw)) == payload
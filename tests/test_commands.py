@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pydjimqtt.services import commands
+
+
+class _StubCaller:
+    def __init__(self, reply: dict) -> None:
+        self.reply = reply
+
+    def call(self, method: str, data=None) -> dict:
+        return self.reply
+
+    def call_raw(self, method: str, data_json: bytes) -> dict:
+        return self.reply
+
+
+@pytest.mark.parametrize(
+    ("reply", "expected"),
+    [
+        ({"result": 1, "message": "denied"}, "denied"),
+        ({"result": 1, "output": {"msg": "busy"}}, "busy"),
+        ({"result": 1, "output": None}, "Unknown error"),
+        ({"result": 1}, "Unknown error"),
+    ],
+)
+def test_call_service_error_message(reply, expected) -> None:
+    with pytest.raises(Exception, match=f"\\(code=1\\): {expected} "):
+        commands._call_service(_StubCaller(reply), "return_home")
+
+
+def test_call_service_raw_returns_data() -> None:
+    caller = _StubCaller({"result": 0, "data": {"ok": True}})
+
+    assert commands.call_service_raw(caller, "drc_mode_exit") == {"ok": True}
+
+
+def test_legacy_send_stick_control_uses_shared_template() -> None:
+    published = []
+
+    class _Paho:
+        def publish(self, topic, payload, qos=0) -> None:
+            published.append((topic, payload))
+
+    class _Client:
+        drc_down_topic = "thing/product/GW/drc/down"
+        client = _Paho()
+
+    commands.send_stick_control(_Client(), pitch=1354)
+    commands.send_stick_control(_Client(), roll=694)
+
+    (topic, first), (_, second) = published
+    first, second = json.loads(first), json.loads(second)
+    assert topic == "thing/product/GW/drc/down"
+    assert first["method"] == "stick_control"
+    assert first["data"] == {"roll": 1024, "pitch": 1354, "throttle": 1024, "yaw": 1024}
+    assert second["seq"] > first["seq"]
+
+
+@pytest.mark.parametrize("channel", ["roll", "pitch", "throttle", "yaw"])
+def test_legacy_send_stick_control_names_bad_channel(channel) -> None:
+    with pytest.raises(ValueError, match=f"^{channel} 必须在"):
+        commands.send_stick_control(object(), **{channel: 1685})
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from pydjimqtt.core import codec
+from pydjimqtt.services import connection_manager
+from pydjimqtt.services.connection_manager import DRCConnectionManager
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_reconnect_builds_fresh_broker_config(monkeypatch, use_orjson) -> None:
+    if not use_orjson:
+        monkeypatch.setattr(codec, "orjson", None)
+    sent = []
+    monkeypatch.setattr(connection_manager, "request_control_auth", lambda *a, **k: {})
+    monkeypatch.setattr(
+        connection_manager,
+        "call_service_raw",
+        lambda caller, method, data_json, *args: sent.append((method, json.loads(data_json))),
+    )
+    monkeypatch.setattr(connection_manager, "start_heartbeat", lambda *a, **k: None)
+
+    manager = DRCConnectionManager(
+        mqtt_client=None,
+        service_caller=None,
+        uav_config={"sn": "SN1", "callsign": "Alpha"},
+        mqtt_config={"host": "10.0.0.1", "port": 1883, "username": "u", "password": "p%s\""},
+    )
+
+    assert manager._reconnect_drc()
+    assert manager._reconnect_drc()
+
+    (method, first), (_, second) = sent
+    assert method == "drc_mode_enter"
+    assert first["osd_frequency"] == 100 and first["hsi_frequency"] == 10
+    first, second = first["mqtt_broker"], second["mqtt_broker"]
+    assert first["address"] == "10.0.0.1:1883"
+    assert first["password"] == 'p%s"'
+    assert first["enable_tls"] is False
+    assert isinstance(first["expire_time"], int)
+    assert first["client_id"].startswith("drc-SN1-")
+    assert len(first["client_id"]) == len("drc-SN1-") + 3
+    assert second["client_id"].startswith("drc-SN1-")
+    assert b"drc-SN1-" not in manager._enter_drc_tpl
+
+
+class _FakeOsdClient:
+    def __init__(self) -> None:
+        self.callbacks = []
+        self.online = False
+
+    def register_osd_callback(self, callback) -> None:
+        self.callbacks.append(callback)
+
+    def unregister_osd_callback(self, callback) -> None:
+        self.callbacks.remove(callback)
+
+    def is_online(self, timeout: float = 2.0) -> bool:
+        return self.online
+
+
+def _make_manager(mqtt_client, **kwargs) -> DRCConnectionManager:
+    return DRCConnectionManager(
+        mqtt_client=mqtt_client,
+        service_caller=None,
+        uav_config={"sn": "SN1", "callsign": "Alpha"},
+        mqtt_config={"host": "10.0.0.1", "port": 1883, "username": "u", "password": "p"},
+        **kwargs,
+    )
+
+
+def test_osd_callback_keeps_manager_online(monkeypatch) -> None:
+    monkeypatch.setattr(connection_manager, "stop_heartbeat", lambda *a, **k: None)
+    attempts = []
+    mqtt_client = _FakeOsdClient()
+    manager = _make_manager(mqtt_client, offline_timeout=0.1)
+    monkeypatch.setattr(manager, "_reconnect_drc", lambda: attempts.append(1) or True)
+
+    manager.start()
+    try:
+        (callback,) = mqtt_client.callbacks
+        deadline = time.monotonic() + 0.4
+        while time.monotonic() < deadline:
+            callback()
+            time.sleep(0.02)
+        assert attempts == []
+        assert manager.is_online()
+    finally:
+        manager.stop()
+
+
+def test_missing_osd_triggers_reconnect_at_deadline(monkeypatch) -> None:
+    monkeypatch.setattr(connection_manager, "stop_heartbeat", lambda *a, **k: None)
+    reconnected = threading.Event()
+    manager = _make_manager(_FakeOsdClient(), offline_timeout=0.05)
+    monkeypatch.setattr(manager, "_reconnect_drc", lambda: reconnected.set() or True)
+
+    manager.start()
+    try:
+        assert reconnected.wait(1.0)
+    finally:
+        manager.stop()
+    assert not manager.monitor_thread.is_alive()
+
+
+def test_stop_interrupts_reconnect_backoff(monkeypatch) -> None:
+    monkeypatch.setattr(connection_manager, "stop_heartbeat", lambda *a, **k: None)
+    attempts = []
+    manager = _make_manager(
+        _FakeOsdClient(), offline_timeout=0.01, reconnect_interval=5.0
+    )
+    monkeypatch.setattr(manager, "_reconnect_drc", lambda: attempts.append(1) or False)
+
+    manager.start()
+    deadline = time.monotonic() + 1.0
+    while not attempts and time.monotonic() < deadline:
+        time.sleep(0.01)
+    start = time.monotonic()
+    manager.stop()
+
+    assert attempts == [1]
+    assert time.monotonic() - start < 1.0
+    assert not manager.monitor_thread.is_alive()
+
+
+def test_stop_unregisters_osd_callback(monkeypatch) -> None:
+    from pydjimqtt.core.mqtt_client import MQTTClient
+
+    monkeypatch.setattr(connection_manager, "stop_heartbeat", lambda *a, **k: None)
+    mqtt_client = MQTTClient("__test__", {})
+    other = lambda: None  # noqa: E731
+    mqtt_client.register_osd_callback(other)
+
+    for _ in range(3):
+        manager = _make_manager(mqtt_client)
+        monkeypatch.setattr(manager, "_reconnect_drc", lambda: True)
+        manager.start()
+        assert len(mqtt_client.osd_callbacks) == 2
+        manager.stop()
+
+    assert mqtt_client.osd_callbacks == (other,)
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from pydjimqtt.tasks.display import create_takeoff_table, create_trajectory_table
+
+
+def _runner(status: str, **data) -> SimpleNamespace:
+    return SimpleNamespace(
+        config={"callsign": "UAV1", "sn": "SN1"}, status=status, data=data
+    )
+
+
+def test_status_cells_keep_color_rules() -> None:
+    takeoff = create_takeoff_table(
+        [_runner("任务完成", height=1.0), _runner("上升中"), _runner("错误: x"), _runner("待机")]
+    )
+    trajectory = create_trajectory_table(
+        [_runner("", task_status="飞行中"), _runner("", task_status="失败(航点2)")], {}
+    )
+
+    assert list(takeoff.columns[2].cells) == [
+        "[bright_green]任务完成[/bright_green]",
+        "[bright_yellow]上升中[/bright_yellow]",
+        "[bright_red]错误: x[/bright_red]",
+        "[bright_cyan]待机[/bright_cyan]",
+    ]
+    assert list(trajectory.columns[1].cells) == [
+        "[bright_yellow]飞行中[/bright_yellow]",
+        "[bright_red]失败(航点2)[/bright_red]",
+    ]
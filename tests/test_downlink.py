@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from pydjimqtt.services.downlink import DRCDownlinkScheduler
+
+
+def test_jobs_share_one_thread_and_run_in_deadline_order() -> None:
+    scheduler = DRCDownlinkScheduler()
+    calls: list[tuple[str, str]] = []
+    done = threading.Event()
+
+    def _job(name: str):
+        def _run() -> None:
+            calls.append((name, threading.current_thread().name))
+            if len(calls) >= 6:
+                done.set()
+
+        return _run
+
+    fast = scheduler.schedule_periodic(0.02, _job("fast"))
+    slow = scheduler.schedule_periodic(0.05, _job("slow"), first_delay=0.01)
+    try:
+        assert done.wait(1.0)
+    finally:
+        scheduler.cancel(fast)
+        scheduler.cancel(slow)
+
+    assert calls[0][0] == "fast"
+    assert {name for name, _ in calls} == {"fast", "slow"}
+    assert {thread for _, thread in calls} == {"drc-downlink"}
+
+
+def test_cancel_stops_job_and_idle_thread_exits() -> None:
+    scheduler = DRCDownlinkScheduler()
+    count = 0
+
+    def _tick() -> None:
+        nonlocal count
+        count += 1
+
+    job = scheduler.schedule_periodic(0.01, _tick)
+    time.sleep(0.05)
+    scheduler.cancel(job)
+    after_cancel = count
+    time.sleep(0.05)
+
+    assert after_cancel > 0
+    assert count == after_cancel
+    assert not scheduler.is_scheduled(job)
+    assert scheduler._thread is None
+
+
+def test_failing_job_does_not_stop_scheduler() -> None:
+    scheduler = DRCDownlinkScheduler()
+    ran = threading.Event()
+
+    def _boom() -> None:
+        raise RuntimeError("boom")
+
+    bad = scheduler.schedule_periodic(0.01, _boom)
+    good = scheduler.schedule_periodic(0.01, ran.set, first_delay=0.02)
+    try:
+        assert ran.wait(1.0)
+    finally:
+        scheduler.cancel(bad)
+        scheduler.cancel(good)
+
+
+def test_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError):
+        DRCDownlinkScheduler().schedule_periodic(0, lambda: None)
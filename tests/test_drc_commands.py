@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import json
+import threading
 from types import SimpleNamespace
 
+import pytest
+
+from pydjimqtt.core import async_console
+from pydjimqtt.core.mqtt_client import MQTTClient, _PendingCall
 from pydjimqtt.services import drc_commands
+from pydjimqtt.services.downlink import DRCDownlinkScheduler
 
 
 class _FakePahoClient:
@@ -18,6 +24,28 @@ class _FakePahoClient:
 class _FakeMQTTClient:
     def __init__(self) -> None:
         self.client = _FakePahoClient()
+        self.client.on_message = self._on_message
+        self._drc_waiters = {}
+
+    def expect_drc_reply(self, method: str, seq: int) -> _PendingCall:
+        future = self._drc_waiters[(method, seq)] = _PendingCall()
+        return future
+
+    def cancel_drc_reply(self, method: str, seq: int) -> None:
+        self._drc_waiters.pop((method, seq), None)
+
+    def _on_message(self, _client, _userdata, msg) -> None:
+        payload = json.loads(msg.payload)
+        future = self._drc_waiters.pop((payload.get("method"), payload.get("seq")), None)
+        if future is not None:
+            future.set_result(payload)
+
+    @property
+    def drc_down_topic(self) -> str:
+        return f"thing/product/{self.gateway_sn}/drc/down"
+
+    def publish_drc(self, payload) -> None:
+        self.client.publish(self.drc_down_topic, payload, qos=0)
 
 
 def test_take_photo_wait_returns_request_payload_index(monkeypatch) -> None:
@@ -46,3 +74,224 @@ def test_take_photo_wait_returns_request_payload_index(monkeypatch) -> None:
     assert result["ok"] is True
     assert result["payload_index"] == "89-0-0"
     assert result["raw"]["timestamp"] == 1776414002533
+
+
+def test_send_stick_control_batch_assigns_increasing_seq() -> None:
+    published = []
+
+    class _RecordingClient(_FakePahoClient):
+        def publish(self, topic: str, payload: str, qos: int = 0) -> None:
+            published.append((topic, json.loads(payload)))
+
+    mqtt_client = _FakeMQTTClient()
+    mqtt_client.client = _RecordingClient()
+    mqtt_client.gateway_sn = "GW"
+
+    seqs = drc_commands.send_stick_control_batch(
+        mqtt_client, [(1024, 1200, 1024, 1024), (1024, 1024, 1024, 1100)]
+    )
+
+    assert seqs == sorted(set(seqs))
+    assert [p["seq"] for _, p in published] == seqs
+    assert published[1][1]["data"]["yaw"] == 1100
+    assert all(topic == "thing/product/GW/drc/down" for topic, _ in published)
+
+
+def test_send_stick_control_batch_rejects_whole_batch_on_bad_frame() -> None:
+    mqtt_client = _FakeMQTTClient()
+    mqtt_client.gateway_sn = "GW"
+
+    with pytest.raises(ValueError):
+        drc_commands.send_stick_control_batch(
+            mqtt_client, [(1024, 1024, 1024, 1024), (2000, 1024, 1024, 1024)]
+        )
+
+
+def test_stick_template_encodes_valid_json() -> None:
+    payload = drc_commands.STICK_TPL % (42, 1100, 1024, 900, 1684)
+
+    assert isinstance(payload, bytes)
+    assert json.loads(payload) == {
+        "seq": 42,
+        "method": "stick_control",
+        "data": {"roll": 1100, "pitch": 1024, "throttle": 900, "yaw": 1684},
+    }
+
+
+def test_stick_batcher_sends_only_latest_frame_per_drone() -> None:
+    published = []
+
+    class _RecordingClient(_FakePahoClient):
+        def publish(self, topic: str, payload: bytes, qos: int = 0) -> None:
+            published.append((topic, json.loads(payload)))
+
+    a, b = _FakeMQTTClient(), _FakeMQTTClient()
+    a.client, b.client = _RecordingClient(), _RecordingClient()
+    a.gateway_sn, b.gateway_sn = "A", "B"
+
+    batcher = drc_commands.StickBatcher(tick=10.0)
+    batcher.set(a, roll=1100)
+    batcher.set(a, roll=1200)
+    batcher.set(b, yaw=900)
+    batcher.flush()
+    batcher.flush()
+
+    by_topic = {topic: p["data"] for topic, p in published}
+    assert len(published) == 2
+    assert by_topic["thing/product/A/drc/down"]["roll"] == 1200
+    assert by_topic["thing/product/B/drc/down"]["yaw"] == 900
+
+
+def test_next_seq_is_strictly_increasing() -> None:
+    seqs = [drc_commands.next_seq() for _ in range(100)]
+
+    assert seqs == sorted(set(seqs))
+
+
+def test_verbose_off_silences_downlink_success_output(monkeypatch, capsys) -> None:
+    mqtt_client = _FakeMQTTClient()
+    mqtt_client.gateway_sn = "GW-1"
+
+    monkeypatch.setattr(async_console, "VERBOSE", True)
+    drc_commands.take_photo(mqtt_client, payload_index="89-0-0", seq=1)
+    assert capsys.readouterr().out == "→ 拍照指令已发送 (payload: 89-0-0)\n"
+
+    monkeypatch.setattr(async_console, "VERBOSE", False)
+    drc_commands.take_photo(mqtt_client, payload_index="89-0-0", seq=2)
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize("channel", ["roll", "pitch", "throttle", "yaw"])
+@pytest.mark.parametrize("value", [363, 1685])
+def test_send_stick_control_names_out_of_range_channel(channel, value) -> None:
+    mqtt_client = _FakeMQTTClient()
+    mqtt_client.gateway_sn = "GW"
+
+    with pytest.raises(ValueError, match=f"^{channel} must be in range"):
+        drc_commands.send_stick_control(mqtt_client, **{channel: value})
+
+
+def test_stick_channels_are_encoded_as_ints() -> None:
+    mqtt_client = _FakeMQTTClient()
+    mqtt_client.gateway_sn = "GW"
+    sent = []
+    mqtt_client.client.publish = lambda topic, payload, qos=0: sent.append(payload)
+
+    drc_commands.send_stick_control(mqtt_client, roll=1024.7, seq=1)
+    drc_commands.send_stick_control_batch(mqtt_client, [(1024, 1200.9, 1024, 1024)])
+
+    first, second = (json.loads(payload) for payload in sent)
+    assert first["data"]["roll"] == 1024
+    assert second["data"]["pitch"] == 1200
+
+
+def test_stick_batcher_runs_on_given_scheduler() -> None:
+    sent = threading.Event()
+
+    class _SignalClient(_FakePahoClient):
+        def publish(self, topic: str, payload: bytes, qos: int = 0) -> None:
+            sent.set()
+
+    mqtt_client = _FakeMQTTClient()
+    mqtt_client.client = _SignalClient()
+    mqtt_client.gateway_sn = "GW"
+    scheduler = DRCDownlinkScheduler()
+    jobs = []
+    schedule_periodic = scheduler.schedule_periodic
+
+    def record_job(*args, **kwargs) -> int:
+        jobs.append(schedule_periodic(*args, **kwargs))
+        return jobs[-1]
+
+    scheduler.schedule_periodic = record_job
+
+    batcher = drc_commands.StickBatcher(tick=0.01, scheduler=scheduler)
+    batcher.start()
+    batcher.set(mqtt_client, roll=1200)
+    try:
+        assert sent.wait(1.0)
+    finally:
+        batcher.stop()
+    (job,) = jobs
+    assert not scheduler.is_scheduled(job)
+
+
+def test_mqtt_client_routes_drc_reply_by_method_and_seq() -> None:
+    mqtt_client = MQTTClient("GW", {})
+    waiter = mqtt_client.expect_drc_reply("drc_camera_screen_split", 7)
+    other = {"method": "drc_camera_screen_split", "seq": 8, "data": {"result": 0}}
+    reply = {"method": "drc_camera_screen_split", "seq": 7, "data": {"result": 0}}
+
+    mqtt_client._on_message(None, None, SimpleNamespace(payload=json.dumps(other).encode()))
+    with pytest.raises(TimeoutError):
+        waiter.result(0)
+    mqtt_client._on_message(None, None, SimpleNamespace(payload=json.dumps(reply).encode()))
+
+    assert waiter.result(0) == reply
+    assert mqtt_client._drc_waiters == {}
+
+
+def test_drc_reply_wait_unregisters_on_timeout() -> None:
+    mqtt_client = _FakeMQTTClient()
+
+    with pytest.raises(TimeoutError, match="drc_live_lens_change timeout"):
+        drc_commands._wait_for_drc_reply(
+            mqtt_client, method="drc_live_lens_change", seq=3, timeout=0.01, send_fn=lambda: None
+        )
+
+    assert mqtt_client._drc_waiters == {}
+
+
+def test_camera_command_templates_encode_valid_json() -> None:
+    published = []
+
+    class _RecordingClient(_FakePahoClient):
+        def publish(self, topic: str, payload: bytes, qos: int = 0) -> None:
+            published.append(json.loads(payload))
+
+    mqtt_client = _FakeMQTTClient()
+    mqtt_client.client = _RecordingClient()
+    mqtt_client.gateway_sn = "GW"
+
+    drc_commands.set_camera_zoom(mqtt_client, "89-0-0", 10, camera_type="ir", seq=1)
+    drc_commands.camera_look_at(
+        mqtt_client, "89-0-0", 22.908061, 113.705107, -100, locked=True, seq=2
+    )
+    drc_commands.camera_aim(mqtt_client, 'a"b', 0.5, 1, seq=3)
+
+    assert published[0] == {
+        "seq": 1,
+        "method": "drc_camera_focal_length_set",
+        "data": {"payload_index": "89-0-0", "camera_type": "ir", "zoom_factor": 10.0},
+    }
+    assert published[1]["data"] == {
+        "payload_index": "89-0-0",
+        "locked": True,
+        "latitude": 22.908061,
+        "longitude": 113.705107,
+        "height": -100.0,
+    }
+    assert published[2]["method"] == "drc_camera_aim"
+    assert published[2]["data"] == {
+        "payload_index": 'a"b',
+        "camera_type": "zoom",
+        "locked": False,
+        "x": 0.5,
+        "y": 1.0,
+    }
+
+
+def test_mqtt_client_publish_drc_uses_precomputed_topic() -> None:
+    published = []
+
+    class _RecordingClient(_FakePahoClient):
+        def publish(self, topic: str, payload: bytes, qos: int = 0) -> None:
+            published.append((topic, payload, qos))
+
+    mqtt_client = MQTTClient("GW", {})
+    mqtt_client.client = _RecordingClient()
+    drc_commands.camera_aim(mqtt_client, "89-0-0", 0.5, 0.5, seq=9)
+
+    (topic, payload, qos), = published
+    assert (topic, qos) == ("thing/product/GW/drc/down", 0)
+    assert json.loads(payload)["seq"] == 9
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from pydjimqtt.core.mqtt_client import MQTTClient
+
+
+def _make_client() -> MQTTClient:
+    return MQTTClient(
+        "__test__",
+        {"host": "127.0.0.1", "port": 1883, "username": "", "password": ""},
+    )
+
+
+def _push_progress(client: MQTTClient, fly_to_id: str, status: str) -> None:
+    payload = {
+        "method": "fly_to_point_progress",
+        "data": {"fly_to_id": fly_to_id, "status": status, "result": 0},
+    }
+    msg = SimpleNamespace(payload=json.dumps(payload).encode("utf-8"))
+    client._on_message(None, None, msg)
+
+
+def test_wait_for_flyto_event_wakes_on_terminal_status() -> None:
+    client = _make_client()
+
+    def _feed() -> None:
+        _push_progress(client, "other", "wayline_ok")
+        _push_progress(client, "target", "wayline_progress")
+        _push_progress(client, "target", "wayline_ok")
+
+    timer = threading.Timer(0.05, _feed)
+    timer.start()
+    progress = client.wait_for_flyto_event("target", timeout=2.0)
+    timer.join()
+
+    assert progress["fly_to_id"] == "target"
+    assert progress["status"] == "wayline_ok"
+
+
+def test_wait_for_flyto_event_times_out() -> None:
+    client = _make_client()
+    _push_progress(client, "target", "wayline_progress")
+
+    with pytest.raises(TimeoutError):
+        client.wait_for_flyto_event("target", timeout=0.05)
+
+
+def test_wait_for_flyto_event_reports_progress_outside_lock() -> None:
+    client = _make_client()
+    seen = []
+
+    def _on_progress(progress) -> None:
+        seen.append(progress["status"])
+        # 回调在锁外执行：此处推送新进度不会死锁
+        if len(seen) == 1:
+            _push_progress(client, "target", "wayline_ok")
+
+    _push_progress(client, "other", "wayline_progress")
+    threading.Timer(0.05, _push_progress, (client, "target", "wayline_progress")).start()
+    progress = client.wait_for_flyto_event("target", timeout=2.0, on_progress=_on_progress)
+
+    assert seen == ["wayline_progress"]
+    assert progress["status"] == "wayline_ok"
+
+
+def test_wait_for_flyto_event_returns_none_on_abort() -> None:
+    client = _make_client()
+    stop = threading.Event()
+    threading.Timer(0.05, stop.set).start()
+
+    assert client.wait_for_flyto_event("target", timeout=2.0, should_abort=stop.is_set) is None
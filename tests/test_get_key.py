@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import sys
+
+from pydjimqtt import utils
+
+
+def test_get_key_decodes_burst_of_keys(monkeypatch) -> None:
+    master, slave = os.openpty()
+    try:
+        with os.fdopen(slave, "r", closefd=False) as stdin:
+            monkeypatch.setattr(sys, "stdin", stdin)
+            monkeypatch.setattr(utils, "_pending_keys", b"")
+            os.write(master, b"\x1b[A\x1b[Bq")
+
+            assert utils.get_key() == "UP"
+            assert utils.get_key() == "DOWN"
+            assert utils.get_key() == "q"
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+def test_get_key_reassembles_sequence_split_at_read_boundary(monkeypatch) -> None:
+    master, slave = os.openpty()
+    try:
+        with os.fdopen(slave, "r", closefd=False) as stdin:
+            monkeypatch.setattr(sys, "stdin", stdin)
+            monkeypatch.setattr(utils, "_pending_keys", b"")
+            os.write(master, b"\x1b[A" * 4)
+
+            assert [utils.get_key() for _ in range(4)] == ["UP"] * 4
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+def test_get_key_reports_lone_escape_after_timeout(monkeypatch) -> None:
+    master, slave = os.openpty()
+    try:
+        with os.fdopen(slave, "r", closefd=False) as stdin:
+            monkeypatch.setattr(sys, "stdin", stdin)
+            monkeypatch.setattr(utils, "_pending_keys", b"")
+            monkeypatch.setattr(utils, "_ESC_TIMEOUT", 0.01)
+            os.write(master, b"\x1b")
+
+            assert utils.get_key() == "ESC"
+    finally:
+        os.close(master)
+        os.close(slave)
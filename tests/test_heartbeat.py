@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from pydjimqtt.services.downlink import DRCDownlinkScheduler
+from pydjimqtt.services.heartbeat import start_heartbeat, stop_heartbeat
+
+
+class _RecordingPaho:
+    def __init__(self, sink: list) -> None:
+        self.sink = sink
+
+    def publish(self, topic: str, payload: bytes, qos: int = 0) -> None:
+        self.sink.append((topic, json.loads(payload), threading.current_thread().name))
+
+
+class _FakeMQTTClient:
+    def __init__(self, sn: str, sink: list) -> None:
+        self.gateway_sn = sn
+        self.drc_down_topic = f"thing/product/{sn}/drc/down"
+        self.client = _RecordingPaho(sink)
+
+
+def test_heartbeats_share_scheduler_thread_and_stop_cleanly() -> None:
+    sent: list = []
+    scheduler = DRCDownlinkScheduler()
+    a = start_heartbeat(_FakeMQTTClient("A", sent), interval=0.02, scheduler=scheduler)
+    b = start_heartbeat(_FakeMQTTClient("B", sent), interval=0.02, scheduler=scheduler)
+    time.sleep(0.1)
+    stop_heartbeat(a)
+    stop_heartbeat(b)
+    count = len(sent)
+    time.sleep(0.05)
+
+    assert not a.is_alive() and not b.is_alive()
+    assert len(sent) == count
+    topics = {topic for topic, _, _ in sent}
+    assert topics == {"thing/product/A/drc/down", "thing/product/B/drc/down"}
+    # 首个心跳在调用线程发出，其余都在调度线程上
+    assert {name for _, _, name in sent[2:]} == {"drc-downlink"}
+
+    seqs = [p["seq"] for topic, p, _ in sent if topic.endswith("/A/drc/down")]
+    assert seqs == sorted(seqs) and len(seqs) > 2
+    assert all(p["method"] == "heart_beat" for _, p, _ in sent)
+
+
+def test_heartbeat_and_stick_seq_interleave_monotonically() -> None:
+    from pydjimqtt.services import drc_commands
+
+    sent: list = []
+    scheduler = DRCDownlinkScheduler()
+    client = _FakeMQTTClient("A", sent)
+    hb = start_heartbeat(client, interval=10.0, scheduler=scheduler)
+    drc_commands.send_stick_control(client, roll=1100)
+    stop_heartbeat(hb)
+
+    heartbeat_seq, stick_seq = (p["seq"] for _, p, _ in sent)
+    assert stick_seq > heartbeat_seq
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import math
+
+from pydjimqtt.mock import MockMQTTClient, MockServiceCaller
+
+
+def test_mock_speed_matches_trajectory_derivative() -> None:
+    mqtt = MockMQTTClient("SN000001", {}, index=1)
+    horizontal, speed_x, speed_y, _ = mqtt.get_speed()
+
+    assert math.isclose(horizontal, math.hypot(speed_x, speed_y))
+    assert math.isclose(horizontal, mqtt.flight_radius * mqtt.angular_velocity * 111000)
+
+
+def test_mock_position_stays_on_circle() -> None:
+    mqtt = MockMQTTClient("SN000001", {}, index=3)
+    lat, lon, _ = mqtt.get_position()
+
+    radius = math.hypot(lat - mqtt.base_lat, lon - mqtt.base_lon)
+    assert math.isclose(radius, mqtt.flight_radius, rel_tol=1e-6)
+
+
+def test_mock_getters_share_position_within_tick(monkeypatch) -> None:
+    mqtt = MockMQTTClient("SN000001", {}, index=0)
+    calls = []
+    original = MockMQTTClient._kinematics
+
+    def counting_kinematics(self):
+        calls.append(1)
+        return original(self)
+
+    monkeypatch.setattr(MockMQTTClient, "_kinematics", counting_kinematics)
+    monkeypatch.setattr("pydjimqtt.mock.mock_drone.time.time", lambda: 1000.0)
+
+    lat, lon, height = mqtt.get_position()
+    assert mqtt.get_latitude() == lat
+    assert mqtt.get_longitude() == lon
+    assert mqtt.get_height() == height
+    mqtt.get_speed()
+    mqtt.get_attitude_head()
+    assert len(calls) == 1
+
+
+def test_mock_heartbeat_stops_via_stop_heartbeat() -> None:
+    from pydjimqtt.mock import MockHeartbeatThread
+    from pydjimqtt.services import stop_heartbeat
+
+    heartbeat = MockHeartbeatThread()
+    heartbeat.start()
+    assert heartbeat.is_alive()
+
+    stop_heartbeat(heartbeat)
+
+    assert not heartbeat.is_alive()
+
+
+def test_mock_service_caller_returns_independent_results() -> None:
+    caller = MockServiceCaller(MockMQTTClient("SN", {}))
+
+    first = caller.call("method")
+    first["data"]["touched"] = True
+
+    assert caller.call("method")["data"] == {}
+    assert caller.call_raw("method", b"{}")["data"] == {}
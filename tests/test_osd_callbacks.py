@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from pydjimqtt.core.mqtt_client import MQTTClient
+
+
+def _make_client() -> MQTTClient:
+    return MQTTClient(
+        "__test__",
+        {"host": "127.0.0.1", "port": 1883, "username": "", "password": ""},
+    )
+
+
+def _push_osd(client: MQTTClient, height: float) -> None:
+    payload = {"method": "osd_info_push", "data": {"height": height}}
+    msg = SimpleNamespace(payload=json.dumps(payload).encode("utf-8"))
+    client._on_message(None, None, msg)
+
+
+def test_osd_callbacks_fire_per_message_by_default() -> None:
+    client = _make_client()
+    calls = []
+    client.register_osd_callback(lambda: calls.append(1))
+
+    for h in range(5):
+        _push_osd(client, float(h))
+
+    assert len(calls) == 5
+
+
+def test_osd_callback_rate_throttles_callbacks_not_cache() -> None:
+    client = _make_client()
+    calls = []
+    client.register_osd_callback(lambda: calls.append(1))
+    client.set_osd_callback_rate(1.0)
+
+    for h in range(5):
+        _push_osd(client, float(h))
+
+    assert len(calls) == 1
+    assert client.get_height() == 4.0
+    assert client.get_relative_height() == 4.0
+
+
+def test_register_osd_callback_keeps_snapshot_stable() -> None:
+    client = _make_client()
+    snapshot = client.osd_callbacks
+    client.register_osd_callback(lambda: None)
+
+    assert snapshot == ()
+    assert len(client.osd_callbacks) == 1
+
+
+def test_osd_push_sets_osd_updated() -> None:
+    client = _make_client()
+    assert not client.osd_updated.is_set()
+
+    _push_osd(client, 1.0)
+
+    assert client.osd_updated.is_set()
+
+
+def test_drone_state_push_sets_drone_state_updated() -> None:
+    client = _make_client()
+    assert not client.drone_state_updated.is_set()
+
+    payload = {"method": "drc_drone_state_push", "data": {"mode_code": 0}}
+    client._on_message(None, None, SimpleNamespace(payload=json.dumps(payload).encode()))
+
+    assert client.drone_state_updated.is_set()
+    assert client.get_flight_mode() == 0
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from pydjimqtt.tasks.runner import MissionRunner, run_parallel_missions
+
+
+def test_runner_finished_event_tracks_mission_lifetime() -> None:
+    done = threading.Event()
+    release = threading.Event()
+    runner = MissionRunner(None, None, None, {"callsign": "A", "sn": "1"}, done)
+
+    assert runner.finished.is_set()
+    runner.run(lambda r: release.wait(2.0))
+    assert not runner.finished.is_set()
+    release.set()
+
+    assert runner.finished.wait(2.0)
+    assert done.is_set()
+
+
+def test_run_parallel_missions_returns_as_soon_as_missions_end() -> None:
+    configs = [{"callsign": "A", "sn": "1"}, {"callsign": "B", "sn": "2"}]
+
+    start = time.monotonic()
+    runners = run_parallel_missions(
+        [(None, None, None)] * 2,
+        [lambda r: time.sleep(0.05)],  # 第二架没有分配任务
+        configs,
+        countdown=0,
+        show_monitor=False,
+    )
+
+    assert time.monotonic() - start < 0.4
+    assert all(not r.running for r in runners)
+
+
+def test_watch_stop_sets_event_when_running_turns_false() -> None:
+    runner = MissionRunner(None, None, None, {"callsign": "A", "sn": "1"})
+    runner.running = True
+    stopped = threading.Event()
+
+    runner.watch_stop(stopped)
+    assert not stopped.is_set()
+    runner.stop()
+
+    assert stopped.is_set()
+    runner.unwatch_stop(stopped)
+    assert runner._stop_watchers == []
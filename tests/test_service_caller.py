@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pydjimqtt.core import MQTTClient, ServiceCaller
+
+
+class _FakePahoClient:
+    def __init__(self) -> None:
+        self.published: list[tuple[str, object]] = []
+
+    def publish(self, topic: str, payload, qos: int = 0) -> None:
+        self.published.append((topic, payload))
+
+
+def _make_client() -> MQTTClient:
+    client = MQTTClient(
+        "__test__",
+        {"host": "127.0.0.1", "port": 1883, "username": "", "password": ""},
+    )
+    client.client = _FakePahoClient()
+    return client
+
+
+def _reply(client: MQTTClient, payload: dict) -> None:
+    msg = SimpleNamespace(payload=json.dumps(payload).encode("utf-8"))
+    client._on_message(None, None, msg)
+
+
+def _last_tid(client: MQTTClient) -> str:
+    _, raw = client.client.published[-1]
+    return json.loads(raw)["tid"]
+
+
+def _call_in_background(caller: ServiceCaller, box: dict) -> threading.Thread:
+    def _run() -> None:
+        try:
+            box["result"] = caller.call("return_home")
+        except Exception as e:
+            box["error"] = e
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    return thread
+
+
+def _wait_published(client: MQTTClient) -> None:
+    for _ in range(200):
+        if client.client.published:
+            return
+        time.sleep(0.005)
+    raise AssertionError("request was not published")
+
+
+def test_call_returns_reply_data() -> None:
+    client = _make_client()
+    caller = ServiceCaller(client, timeout=2)
+    box: dict = {}
+    thread = _call_in_background(caller, box)
+    _wait_published(client)
+
+    _reply(client, {"tid": _last_tid(client), "data": {"result": 0}})
+    thread.join(timeout=2)
+
+    assert box == {"result": {"result": 0}}
+    assert client.pending_requests == {}
+
+
+def test_call_raises_on_error_reply() -> None:
+    client = _make_client()
+    caller = ServiceCaller(client, timeout=2)
+    box: dict = {}
+    thread = _call_in_background(caller, box)
+    _wait_published(client)
+
+    _reply(client, {"tid": _last_tid(client), "data": {"result": 314000}})
+    thread.join(timeout=2)
+
+    assert "314000" in str(box["error"])
+
+
+def test_call_timeout_cleans_pending_request() -> None:
+    client = _make_client()
+    caller = ServiceCaller(client, timeout=0.05)
+
+    with pytest.raises(TimeoutError):
+        caller.call("return_home")
+    assert client.pending_requests == {}
+
+
+def test_call_raw_sends_same_envelope_as_call() -> None:
+    client = _make_client()
+    caller = ServiceCaller(client, timeout=2)
+    box: dict = {}
+
+    def _run() -> None:
+        box["result"] = caller.call_raw("drc_mode_exit", b'{"a":[1,"x"]}')
+
+    thread = threading.Thread(target=_run)
+    thread.start()
+    _wait_published(client)
+
+    _, raw = client.client.published[-1]
+    body = json.loads(raw)
+    assert body["tid"] == body["bid"]
+    assert body["method"] == "drc_mode_exit"
+    assert body["data"] == {"a": [1, "x"]}
+    assert isinstance(body["timestamp"], int)
+
+    _reply(client, {"tid": body["tid"], "data": {"result": 0}})
+    thread.join(timeout=2)
+    assert box == {"result": {"result": 0}}
+    assert client.pending_requests == {}
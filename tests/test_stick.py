@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import time
+
+from pydjimqtt.primitives import stick
+
+
+def test_send_stick_repeatedly_does_not_accumulate_send_latency(monkeypatch) -> None:
+    sent = []
+
+    def slow_send(mqtt, **kwargs):
+        sent.append(kwargs)
+        time.sleep(0.005)
+
+    monkeypatch.setattr(stick, "send_stick_control", slow_send)
+
+    start = time.monotonic()
+    stick.send_stick_repeatedly(object(), duration=0.2, frequency=50)
+    elapsed = time.monotonic() - start
+
+    assert len(sent) == 10
+    # 固定 sleep(interval) 时约为 10 * (0.02 + 0.005) = 0.25 秒
+    assert elapsed < 0.235
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+
+from pydjimqtt.tasks.trajectory import _StateFileWriter
+
+
+def test_state_writer_coalesces_updates_and_keeps_other_entries(tmp_path) -> None:
+    path = tmp_path / "mission_state.json"
+    path.write_text(json.dumps({"OTHER": {"task_status": "飞行中"}}))
+    writer = _StateFileWriter(path, min_interval=10.0)
+    writes = []
+    original_write = writer._write
+    writer._write = lambda entries: (writes.append(entries), original_write(entries))
+
+    writer.flush()
+    for i in range(50):
+        writer.update("UAV1", {"current_waypoint": i})
+    writer.flush()
+
+    state = json.loads(path.read_text())
+    assert state["UAV1"] == {"current_waypoint": 49}
+    assert state["OTHER"] == {"task_status": "飞行中"}
+    assert len(writes) <= 2
+    assert not list(tmp_path.glob("pydjimqtt_mission_*"))
+
+
+def test_load_trajectory_reuses_parse_until_file_changes(tmp_path, monkeypatch) -> None:
+    from pydjimqtt.tasks import trajectory
+
+    path = tmp_path / "uav1.json"
+    path.write_text(json.dumps([{"lat": 1.0, "lon": 2.0}]))
+    loads = []
+    real_loads = trajectory.codec.loads
+    monkeypatch.setattr(trajectory.codec, "loads", lambda b: loads.append(1) or real_loads(b))
+
+    first = trajectory.load_trajectory(str(path))
+    first[0]["lat"] = 99.0
+    second = trajectory.load_trajectory(str(path))
+    path.write_text(json.dumps([{"lat": 3.0, "lon": 4.0}, {"lat": 5.0, "lon": 6.0}]))
+    third = trajectory.load_trajectory(str(path))
+
+    assert len(loads) == 2
+    assert second == [{"lat": 1.0, "lon": 2.0}]
+    assert len(third) == 2
+
+
+def test_state_writer_rereads_only_when_file_changed_externally(tmp_path, monkeypatch) -> None:
+    from pydjimqtt.tasks import trajectory
+
+    path = tmp_path / "mission_state.json"
+    writer = _StateFileWriter(path, min_interval=10.0)
+    loads = []
+    real_load = json.load
+    monkeypatch.setattr(trajectory.json, "load", lambda f: loads.append(1) or real_load(f))
+
+    writer._write({"UAV1": {"current_waypoint": 1}})
+    writer._write({"UAV1": {"current_waypoint": 2}})
+    assert loads == []
+
+    path.write_text(json.dumps({"OTHER": {"current_waypoint": 7}}))
+    writer._write({"UAV1": {"current_waypoint": 3}})
+
+    assert loads == [1]
+    assert json.loads(path.read_text()) == {
+        "OTHER": {"current_waypoint": 7},
+        "UAV1": {"current_waypoint": 3},
+    }
+
+
+def test_fly_trajectory_sequence_dispatches_and_waits_concurrently(monkeypatch) -> None:
+    import threading
+
+    from pydjimqtt.tasks import trajectory
+    from pydjimqtt.tasks.runner import MissionRunner
+
+    barrier = threading.Barrier(3, timeout=2.0)
+    monkeypatch.setattr(trajectory, "_update_mission_state_file", lambda *a: None)
+
+    def fake_fly_to_point(caller, **kwargs):
+        barrier.wait()  # 三架都进入 service call 才放行，串行调用会超时
+        return f"id-{caller}"
+
+    class FakeMQTT:
+        def wait_for_flyto_event(self, fly_to_id, **kwargs):
+            barrier.wait()
+            return {"fly_to_id": fly_to_id, "status": "wayline_ok"}
+
+    monkeypatch.setattr(trajectory, "fly_to_point", fake_fly_to_point)
+    runners = [MissionRunner(FakeMQTT(), i, None, {"callsign": f"UAV{i}"}) for i in range(3)]
+    for r in runners:
+        r.running = True
+
+    ok = trajectory.fly_trajectory_sequence(
+        runners, [{"lat": 1.0, "lon": 2.0}], height=50.0, show_progress=False
+    )
+
+    assert ok is True
+    assert all(r.data["current_waypoint"] == 1 for r in runners)
+
+
+def test_load_trajectory_reports_first_waypoint_missing_coordinates(tmp_path) -> None:
+    import pytest
+
+    from pydjimqtt.tasks import trajectory
+
+    path = tmp_path / "bad.json"
+    path.write_bytes(b'[{"lat": 1.0, "lon": 2.0}, {"lat": 3.0}, {"lon": 4.0}]')
+
+    with pytest.raises(ValueError, match="航点 2"):
+        trajectory.load_trajectory(str(path))
+
+
+def test_fly_trajectory_sequence_aborts_when_any_runner_stops(monkeypatch) -> None:
+    from pydjimqtt.tasks import trajectory
+    from pydjimqtt.tasks.runner import MissionRunner
+
+    monkeypatch.setattr(trajectory, "_update_mission_state_file", lambda *a: None)
+    calls = []
+    monkeypatch.setattr(trajectory, "fly_to_point", lambda caller, **kw: calls.append(caller))
+    runners = [MissionRunner(None, i, None, {"callsign": f"UAV{i}"}) for i in range(2)]
+    runners[0].running = True
+
+    ok = trajectory.fly_trajectory_sequence(
+        runners, [{"lat": 1.0, "lon": 2.0}], height=50.0, show_progress=False
+    )
+
+    assert ok is False
+    assert calls == []
+    assert runners[0]._stop_watchers == []
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from pydjimqtt.core.mqtt_client import UpdateSignal
+from pydjimqtt.primitives import wait_for_event
+
+
+def test_wait_for_event_wakes_on_set() -> None:
+    event = threading.Event()
+    state = {"ready": False}
+
+    def producer() -> None:
+        time.sleep(0.05)
+        state["ready"] = True
+        event.set()
+
+    threading.Thread(target=producer).start()
+    start = time.monotonic()
+    wait_for_event(event, lambda: state["ready"], timeout=2.0)
+
+    assert time.monotonic() - start < 1.0
+
+
+def test_wait_for_event_times_out() -> None:
+    with pytest.raises(TimeoutError, match="no data"):
+        wait_for_event(threading.Event(), lambda: False, timeout=0.05, timeout_msg="no data")
+
+
+def test_wait_for_event_signal_wakes_every_waiter() -> None:
+    signal = UpdateSignal()
+    state = {"a": False, "b": False}
+    finished = []
+
+    def waiter(key: str) -> None:
+        wait_for_event(signal, lambda: state[key], timeout=2.0)
+        finished.append(key)
+
+    threads = [threading.Thread(target=waiter, args=(k,)) for k in ("a", "b")]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    # 两个条件在同一次更新中满足：任一等待方都不能吞掉另一方的唤醒
+    state["a"] = state["b"] = True
+    start = time.monotonic()
+    signal.set()
+    for t in threads:
+        t.join(2.0)
+
+    assert sorted(finished) == ["a", "b"]
+    assert time.monotonic() - start < 1.0
@@ -300,12 +300,11 @@ def main() -> int:
         sniffer = TopicSniffer(mqtt, SNIFF_TOPICS)
 
         # ========== 3. 实时显示监控面板 ==========
-        with Live(
-            sniffer.render_status(), refresh_per_second=2, console=console
-        ) as live:
+        # 关闭自动刷新：每 0.5 秒重建面板时重绘一次，不再由后台刷新线程额外渲染
+        with Live(sniffer.render_status(), auto_refresh=False, console=console) as live:
             while True:
                 time.sleep(0.5)
-                live.update(sniffer.render_status())
+                live.update(sniffer.render_status(), refresh=True)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]检测到中断，正在停止...[/yellow]")